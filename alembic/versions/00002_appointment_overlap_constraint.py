@@ -0,0 +1,43 @@
+"""appointment_overlap_constraint
+
+Revision ID: 00002
+Revises: 00001
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '00002'
+down_revision: Union[str, Sequence[str], None] = '00001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # btree_gist lets the exclusion constraint combine uuid equality with range overlap
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+    op.create_check_constraint(
+        'ck_appointments_end_after_start', 'appointments', 'appointment_end > appointment_start'
+    )
+    op.execute(
+        "ALTER TABLE appointments ADD CONSTRAINT ex_appointments_staff_overlap "
+        "EXCLUDE USING gist (staff_id WITH =, tsrange(appointment_start, appointment_end) WITH &&) "
+        "WHERE (status <> 'CANCELED')"
+    )
+    op.create_index('ix_appointments_staff_id_appointment_start', 'appointments', ['staff_id', 'appointment_start'], unique=False)
+    op.create_index('ix_appointments_company_id_appointment_start', 'appointments', ['company_id', 'appointment_start'], unique=False)
+    op.create_index('ix_appointments_user_id_appointment_start', 'appointments', ['user_id', 'appointment_start'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_appointments_user_id_appointment_start', table_name='appointments')
+    op.drop_index('ix_appointments_company_id_appointment_start', table_name='appointments')
+    op.drop_index('ix_appointments_staff_id_appointment_start', table_name='appointments')
+    op.drop_constraint('ex_appointments_staff_overlap', 'appointments', type_='exclude')
+    op.drop_constraint('ck_appointments_end_after_start', 'appointments', type_='check')
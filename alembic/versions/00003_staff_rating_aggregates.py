@@ -0,0 +1,82 @@
+"""staff_rating_aggregates
+
+Revision ID: 00003
+Revises: 00002
+Create Date: 2026-10-18 14:05:12.529817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '00003'
+down_revision: Union[str, Sequence[str], None] = '00002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Applies the old row (UPDATE, DELETE) and the new row (INSERT, UPDATE) to the staff aggregates.
+# SET expressions see the row before the update, so the average is computed from the new sum and count.
+MAINTAIN_STAFF_RATING = """
+CREATE FUNCTION maintain_staff_rating() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE staff SET
+            rating_count = rating_count - 1,
+            rating_sum = rating_sum - OLD.rating,
+            rating_average = CASE WHEN rating_count > 1 THEN (rating_sum - OLD.rating) / (rating_count - 1) END
+        WHERE id = OLD.staff_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE staff SET
+            rating_count = rating_count + 1,
+            rating_sum = rating_sum + NEW.rating,
+            rating_average = (rating_sum + NEW.rating) / (rating_count + 1)
+        WHERE id = NEW.staff_id;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+BACKFILL_STAFF_RATING = """
+UPDATE staff SET rating_count = agg.count, rating_sum = agg.total, rating_average = agg.total / agg.count
+FROM (SELECT staff_id, count(*) AS count, sum(rating) AS total FROM reviews GROUP BY staff_id) AS agg
+WHERE staff.id = agg.staff_id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('staff', sa.Column('rating_count', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.add_column('staff', sa.Column('rating_sum', sa.Float(), server_default=sa.text('0'), nullable=False))
+    op.add_column('staff', sa.Column('rating_average', sa.Float(), nullable=True))
+    op.execute(MAINTAIN_STAFF_RATING)
+    op.execute(
+        "CREATE TRIGGER tr_reviews_staff_rating_insert_delete AFTER INSERT OR DELETE ON reviews "
+        "FOR EACH ROW EXECUTE FUNCTION maintain_staff_rating()"
+    )
+    op.execute(
+        "CREATE TRIGGER tr_reviews_staff_rating_update AFTER UPDATE OF staff_id, rating ON reviews "
+        "FOR EACH ROW WHEN (OLD.staff_id IS DISTINCT FROM NEW.staff_id OR OLD.rating IS DISTINCT FROM NEW.rating) "
+        "EXECUTE FUNCTION maintain_staff_rating()"
+    )
+    op.execute(BACKFILL_STAFF_RATING)
+    op.create_index(
+        'ix_staff_company_id_rating_average', 'staff', ['company_id', sa.text('rating_average DESC NULLS LAST')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_staff_company_id_rating_average', table_name='staff')
+    op.execute('DROP TRIGGER tr_reviews_staff_rating_update ON reviews')
+    op.execute('DROP TRIGGER tr_reviews_staff_rating_insert_delete ON reviews')
+    op.execute('DROP FUNCTION maintain_staff_rating()')
+    op.drop_column('staff', 'rating_average')
+    op.drop_column('staff', 'rating_sum')
+    op.drop_column('staff', 'rating_count')
@@ -0,0 +1,35 @@
+"""appointment_reminders
+
+Revision ID: 00004
+Revises: 00003
+Create Date: 2026-10-18 15:22:47.081364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '00004'
+down_revision: Union[str, Sequence[str], None] = '00003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('appointments', sa.Column('reminder_sent_at', sa.DateTime(), nullable=True))
+    # Past appointments never get a reminder, keep them out of the partial index
+    op.execute("UPDATE appointments SET reminder_sent_at = appointment_start WHERE appointment_start <= now()")
+    op.create_index(
+        'ix_appointments_status_appointment_start', 'appointments', ['status', 'appointment_start'],
+        unique=False, postgresql_where=sa.text('reminder_sent_at IS NULL')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_appointments_status_appointment_start', table_name='appointments')
+    op.drop_column('appointments', 'reminder_sent_at')
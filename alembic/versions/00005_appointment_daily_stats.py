@@ -0,0 +1,138 @@
+"""appointment_daily_stats
+
+Revision ID: 00005
+Revises: 00004
+Create Date: 2026-10-18 16:40:03.614920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '00005'
+down_revision: Union[str, Sequence[str], None] = '00004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Key of the advisory lock guarding the rollup rows of one company and day
+APPOINTMENT_DAILY_STATS_LOCK_KEY = """
+CREATE FUNCTION appointment_daily_stats_lock_key(p_company_id uuid, p_day date) RETURNS bigint
+LANGUAGE sql IMMUTABLE AS $$
+SELECT hashtextextended(p_company_id::text, p_day - DATE '2000-01-01')
+$$
+"""
+
+# Adds one appointment (sign 1) or takes it away (sign -1), with the price stored on the appointment so the
+# -1 always cancels its +1. The shared lock lets writers run concurrently but waits for a reconciliation of
+# the same company and day. Scalar arguments rather than an appointments row type, so the function survives
+# the table being rebuilt.
+APPLY_APPOINTMENT_DAILY_STATS = """
+CREATE FUNCTION apply_appointment_daily_stats(
+    p_company_id uuid, p_staff_id uuid, p_start timestamp, p_end timestamp,
+    p_status appointment_status, p_price double precision, p_sign integer
+) RETURNS void LANGUAGE sql AS $$
+SELECT pg_advisory_xact_lock_shared(appointment_daily_stats_lock_key(p_company_id, p_start::date));
+INSERT INTO appointment_daily_stats AS stats (id, company_id, staff_id, day, status, booking_count, revenue, booked_minutes)
+VALUES (
+    gen_random_uuid(), p_company_id, COALESCE(p_staff_id, '00000000-0000-0000-0000-000000000000'), p_start::date,
+    p_status, p_sign, p_sign * COALESCE(p_price, 0), p_sign * (EXTRACT(EPOCH FROM p_end - p_start) / 60)::integer
+)
+ON CONFLICT (company_id, day, staff_id, status) DO UPDATE SET
+    booking_count = stats.booking_count + EXCLUDED.booking_count,
+    revenue = stats.revenue + EXCLUDED.revenue,
+    booked_minutes = stats.booked_minutes + EXCLUDED.booked_minutes,
+    updated_at = now()
+$$
+"""
+
+# Applies the old row (UPDATE, DELETE) and the new row (INSERT, UPDATE) to the daily stats
+MAINTAIN_APPOINTMENT_DAILY_STATS = """
+CREATE FUNCTION maintain_appointment_daily_stats() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM apply_appointment_daily_stats(
+            OLD.company_id, OLD.staff_id, OLD.appointment_start, OLD.appointment_end, OLD.status, OLD.price, -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM apply_appointment_daily_stats(
+            NEW.company_id, NEW.staff_id, NEW.appointment_start, NEW.appointment_end, NEW.status, NEW.price, 1
+        );
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+# Existing appointments get the service's current price, the best information left
+BACKFILL_APPOINTMENT_PRICE = """
+UPDATE appointments SET price = staff_services.price
+FROM staff_services WHERE staff_services.id = appointments.service_id
+"""
+
+BACKFILL_APPOINTMENT_DAILY_STATS = """
+INSERT INTO appointment_daily_stats (id, company_id, staff_id, day, status, booking_count, revenue, booked_minutes)
+SELECT
+    gen_random_uuid(), company_id, COALESCE(staff_id, '00000000-0000-0000-0000-000000000000'),
+    appointment_start::date, status, count(*), COALESCE(sum(price), 0),
+    sum((EXTRACT(EPOCH FROM appointment_end - appointment_start) / 60)::integer)
+FROM appointments
+GROUP BY 2, 3, 4, 5
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('appointments', sa.Column('price', sa.Float(), nullable=True))
+    op.execute(BACKFILL_APPOINTMENT_PRICE)
+    op.create_table('appointment_daily_stats',
+    sa.Column('company_id', sa.Uuid(), nullable=False),
+    sa.Column('staff_id', sa.Uuid(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', postgresql.ENUM(name='appointment_status', create_type=False), nullable=False),
+    sa.Column('booking_count', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('revenue', sa.Float(), server_default=sa.text('0'), nullable=False),
+    sa.Column('booked_minutes', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('company_id', 'day', 'staff_id', 'status', name='uq_appointment_daily_stats_key')
+    )
+    op.execute(APPOINTMENT_DAILY_STATS_LOCK_KEY)
+    op.execute(APPLY_APPOINTMENT_DAILY_STATS)
+    op.execute(MAINTAIN_APPOINTMENT_DAILY_STATS)
+    op.execute(
+        "CREATE TRIGGER tr_appointments_daily_stats_insert_delete AFTER INSERT OR DELETE ON appointments "
+        "FOR EACH ROW EXECUTE FUNCTION maintain_appointment_daily_stats()"
+    )
+    # Column list keeps unrelated updates (reminder_sent_at) from touching the stats
+    op.execute(
+        "CREATE TRIGGER tr_appointments_daily_stats_update "
+        "AFTER UPDATE OF company_id, staff_id, appointment_start, appointment_end, status, price ON appointments "
+        "FOR EACH ROW WHEN ("
+        "(OLD.company_id, OLD.staff_id, OLD.appointment_start, OLD.appointment_end, OLD.status, OLD.price) "
+        "IS DISTINCT FROM "
+        "(NEW.company_id, NEW.staff_id, NEW.appointment_start, NEW.appointment_end, NEW.status, NEW.price)"
+        ") EXECUTE FUNCTION maintain_appointment_daily_stats()"
+    )
+    op.execute(BACKFILL_APPOINTMENT_DAILY_STATS)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER tr_appointments_daily_stats_update ON appointments')
+    op.execute('DROP TRIGGER tr_appointments_daily_stats_insert_delete ON appointments')
+    op.execute('DROP FUNCTION maintain_appointment_daily_stats()')
+    op.execute(
+        'DROP FUNCTION apply_appointment_daily_stats'
+        '(uuid, uuid, timestamp, timestamp, appointment_status, double precision, integer)'
+    )
+    op.execute('DROP FUNCTION appointment_daily_stats_lock_key(uuid, date)')
+    op.drop_table('appointment_daily_stats')
+    op.drop_column('appointments', 'price')
@@ -0,0 +1,219 @@
+"""partition_appointments
+
+Revision ID: 00006
+Revises: 00005
+Create Date: 2026-10-18 17:31:56.204718
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '00006'
+down_revision: Union[str, Sequence[str], None] = '00005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Partitions created before this revision's data copy and afterwards by the maintenance command
+PARTITIONS_AHEAD_MONTHS = 12
+
+# Creates the monthly partition containing the given day unless it exists; returns its name, or NULL.
+# Exclusion constraints can't span partitions, so every partition gets its own overlap constraint;
+# ck_appointments_within_month keeps each appointment inside one partition, which makes them equivalent.
+CREATE_APPOINTMENTS_PARTITION = """
+CREATE FUNCTION create_appointments_partition(month date) RETURNS text LANGUAGE plpgsql AS $$
+DECLARE
+    lower_bound timestamp := date_trunc('month', month);
+    partition_name text := 'appointments_' || to_char(lower_bound, 'YYYY_MM');
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN NULL;
+    END IF;
+    EXECUTE format(
+        'CREATE TABLE %I PARTITION OF appointments FOR VALUES FROM (%L) TO (%L)',
+        partition_name, lower_bound, lower_bound + interval '1 month'
+    );
+    EXECUTE format(
+        'ALTER TABLE %I ADD CONSTRAINT %I EXCLUDE USING gist '
+        '(staff_id WITH =, tsrange(appointment_start, appointment_end) WITH &&) WHERE (status <> ''CANCELED'')',
+        partition_name, 'ex_' || partition_name || '_staff_overlap'
+    );
+    RETURN partition_name;
+END
+$$
+"""
+
+# Replaces ON DELETE CASCADE of the reviews foreign key. A row moving between partitions is deleted
+# and reinserted by the same statement, so only reviews of appointments that are really gone are removed.
+DELETE_APPOINTMENT_REVIEWS = """
+CREATE FUNCTION delete_appointment_reviews() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM reviews
+    WHERE appointment_id = OLD.id AND NOT EXISTS (SELECT 1 FROM appointments WHERE id = OLD.id);
+    RETURN NULL;
+END
+$$
+"""
+
+# ck_appointments_within_month would abort the copy half way with a bare constraint error
+CHECK_WITHIN_MONTH = """
+DO $$
+DECLARE
+    crossing bigint;
+    example uuid;
+BEGIN
+    SELECT count(*), min(id::text)::uuid INTO crossing, example FROM appointments
+    WHERE appointment_end > date_trunc('month', appointment_start) + interval '1 month';
+    IF crossing > 0 THEN
+        RAISE EXCEPTION '% appointments end in a later month than they start (e.g. %)', crossing, example
+            USING HINT = 'Partitioning needs every appointment inside one month; shorten or split them, then retry.';
+    END IF;
+END
+$$
+"""
+
+CREATE_PARTITIONS = f"""
+SELECT create_appointments_partition(month::date)
+FROM generate_series(
+    (SELECT date_trunc('month', LEAST(min(appointment_start), now()::timestamp)) FROM appointments_unpartitioned),
+    (SELECT GREATEST(
+        date_trunc('month', max(appointment_start)),
+        date_trunc('month', now()::timestamp) + interval '{PARTITIONS_AHEAD_MONTHS} months'
+    ) FROM appointments_unpartitioned),
+    interval '1 month'
+) AS month
+"""
+
+COLUMNS = (
+    "id, company_id, staff_id, user_id, service_id, appointment_start, appointment_end, status, "
+    "reminder_sent_at, price, created_at, updated_at"
+)
+
+
+def _create_daily_stats_triggers() -> None:
+    op.execute(
+        "CREATE TRIGGER tr_appointments_daily_stats_insert_delete AFTER INSERT OR DELETE ON appointments "
+        "FOR EACH ROW EXECUTE FUNCTION maintain_appointment_daily_stats()"
+    )
+    op.execute(
+        "CREATE TRIGGER tr_appointments_daily_stats_update "
+        "AFTER UPDATE OF company_id, staff_id, appointment_start, appointment_end, status, price ON appointments "
+        "FOR EACH ROW WHEN ("
+        "(OLD.company_id, OLD.staff_id, OLD.appointment_start, OLD.appointment_end, OLD.status, OLD.price) "
+        "IS DISTINCT FROM "
+        "(NEW.company_id, NEW.staff_id, NEW.appointment_start, NEW.appointment_end, NEW.status, NEW.price)"
+        ") EXECUTE FUNCTION maintain_appointment_daily_stats()"
+    )
+
+
+def _create_indexes() -> None:
+    op.create_index(op.f('ix_appointments_created_at'), 'appointments', ['created_at'], unique=False)
+    op.create_index(op.f('ix_appointments_id'), 'appointments', ['id'], unique=False)
+    op.create_index('ix_appointments_staff_id_appointment_start', 'appointments', ['staff_id', 'appointment_start'], unique=False)
+    op.create_index('ix_appointments_company_id_appointment_start', 'appointments', ['company_id', 'appointment_start'], unique=False)
+    op.create_index('ix_appointments_user_id_appointment_start', 'appointments', ['user_id', 'appointment_start'], unique=False)
+    op.create_index(
+        'ix_appointments_status_appointment_start', 'appointments', ['status', 'appointment_start'],
+        unique=False, postgresql_where=sa.text('reminder_sent_at IS NULL')
+    )
+
+
+def _appointments_table(*constraints: sa.schema.Constraint, **kwargs) -> None:
+    op.create_table('appointments',
+    sa.Column('company_id', sa.Uuid(), nullable=False),
+    sa.Column('staff_id', sa.Uuid(), nullable=True),
+    sa.Column('user_id', sa.Uuid(), nullable=True),
+    sa.Column('service_id', sa.Uuid(), nullable=True),
+    sa.Column('appointment_start', sa.DateTime(), nullable=False),
+    sa.Column('appointment_end', sa.DateTime(), nullable=False),
+    sa.Column('status', postgresql.ENUM(name='appointment_status', create_type=False), nullable=False),
+    sa.Column('reminder_sent_at', sa.DateTime(), nullable=True),
+    sa.Column('price', sa.Float(), nullable=True),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.CheckConstraint('appointment_end > appointment_start', name='ck_appointments_end_after_start'),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['service_id'], ['staff_services.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['staff_id'], ['staff.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='SET NULL'),
+    *constraints,
+    **kwargs
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Copies every appointment into the new table; run it in a maintenance
+    window. Daily stats triggers are only created after the copy, so the
+    rollups are not counted twice.
+    """
+    op.execute(CHECK_WITHIN_MONTH)
+    op.execute('CREATE SCHEMA IF NOT EXISTS archive')
+    op.drop_constraint('reviews_appointment_id_fkey', 'reviews', type_='foreignkey')
+    op.execute('ALTER TABLE appointments RENAME TO appointments_unpartitioned')
+    op.execute('ALTER INDEX appointments_pkey RENAME TO appointments_unpartitioned_pkey')
+
+    _appointments_table(
+        sa.PrimaryKeyConstraint('id', 'appointment_start', name='appointments_pkey'),
+        sa.CheckConstraint(
+            "appointment_end <= date_trunc('month', appointment_start) + interval '1 month'",
+            name='ck_appointments_within_month'
+        ),
+        postgresql_partition_by='RANGE (appointment_start)'
+    )
+    op.execute(CREATE_APPOINTMENTS_PARTITION)
+    op.execute(CREATE_PARTITIONS)
+    op.execute(f"INSERT INTO appointments ({COLUMNS}) SELECT {COLUMNS} FROM appointments_unpartitioned")
+    op.drop_table('appointments_unpartitioned')
+    _create_indexes()
+    _create_daily_stats_triggers()
+
+    op.create_index(op.f('ix_reviews_appointment_id'), 'reviews', ['appointment_id'], unique=False)
+    op.execute(DELETE_APPOINTMENT_REVIEWS)
+    op.execute(
+        "CREATE TRIGGER tr_appointments_delete_reviews AFTER DELETE ON appointments "
+        "FOR EACH ROW EXECUTE FUNCTION delete_appointment_reviews()"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Only attached partitions are copied back; archived partitions stay in
+    the archive schema.
+    """
+    op.execute('DROP TRIGGER tr_appointments_delete_reviews ON appointments')
+    op.execute('DROP FUNCTION delete_appointment_reviews()')
+    op.drop_index(op.f('ix_reviews_appointment_id'), table_name='reviews')
+
+    op.execute('ALTER TABLE appointments RENAME TO appointments_partitioned')
+    op.execute('ALTER INDEX appointments_pkey RENAME TO appointments_partitioned_pkey')
+    for index in (
+        'ix_appointments_created_at', 'ix_appointments_id', 'ix_appointments_staff_id_appointment_start',
+        'ix_appointments_company_id_appointment_start', 'ix_appointments_user_id_appointment_start',
+        'ix_appointments_status_appointment_start',
+    ):
+        op.drop_index(index, table_name='appointments_partitioned')
+
+    _appointments_table(sa.PrimaryKeyConstraint('id', name='appointments_pkey'))
+    op.execute(f"INSERT INTO appointments ({COLUMNS}) SELECT {COLUMNS} FROM appointments_partitioned")
+    op.execute('DROP TABLE appointments_partitioned CASCADE')
+    op.execute('DROP FUNCTION create_appointments_partition(date)')
+
+    op.execute(
+        "ALTER TABLE appointments ADD CONSTRAINT ex_appointments_staff_overlap "
+        "EXCLUDE USING gist (staff_id WITH =, tsrange(appointment_start, appointment_end) WITH &&) "
+        "WHERE (status <> 'CANCELED')"
+    )
+    _create_indexes()
+    _create_daily_stats_triggers()
+    op.create_foreign_key(
+        'reviews_appointment_id_fkey', 'reviews', 'appointments', ['appointment_id'], ['id'], ondelete='CASCADE'
+    )
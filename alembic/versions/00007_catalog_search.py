@@ -0,0 +1,48 @@
+"""catalog_search
+
+Revision ID: 00007
+Revises: 00006
+Create Date: 2026-10-18 18:47:09.338152
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '00007'
+down_revision: Union[str, Sequence[str], None] = '00006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # gist_trgm_ops answers both the word similarity filter (<%) and the distance ordering (<<->)
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.add_column('companies', sa.Column(
+        'search_text', sa.Text(), sa.Computed("company_name || ' ' || company_address", persisted=True),
+        nullable=False
+    ))
+    op.add_column('staff_services', sa.Column(
+        'search_text', sa.Text(), sa.Computed("name || ' ' || coalesce(description, '')", persisted=True),
+        nullable=False
+    ))
+    op.create_index(
+        'ix_companies_search_text_trgm', 'companies', ['search_text'], unique=False,
+        postgresql_using='gist', postgresql_ops={'search_text': 'gist_trgm_ops'}
+    )
+    op.create_index(
+        'ix_staff_services_search_text_trgm', 'staff_services', ['search_text'], unique=False,
+        postgresql_using='gist', postgresql_ops={'search_text': 'gist_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_staff_services_search_text_trgm', table_name='staff_services')
+    op.drop_index('ix_companies_search_text_trgm', table_name='companies')
+    op.drop_column('staff_services', 'search_text')
+    op.drop_column('companies', 'search_text')
@@ -0,0 +1,61 @@
+"""catalog_change_notifications
+
+Revision ID: 00008
+Revises: 00007
+Create Date: 2026-10-18 20:12:41.530917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '00008'
+down_revision: Union[str, Sequence[str], None] = '00007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Notifies '<namespace>:<key>' on the catalog_changes channel for the old and the new row; arguments are
+# the cache namespace and the key column. Delivered on commit; duplicates within a transaction are merged.
+NOTIFY_CATALOG_CHANGE = """
+CREATE FUNCTION notify_catalog_change() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM pg_notify('catalog_changes', TG_ARGV[0] || ':' || (to_jsonb(OLD) ->> TG_ARGV[1]));
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM pg_notify('catalog_changes', TG_ARGV[0] || ':' || (to_jsonb(NEW) ->> TG_ARGV[1]));
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+# table -> (cache namespace, key column, events); new companies, staff and services can't be cached yet,
+# while a staff member's working hours are cached even when there are none. Cached staff aren't used for
+# their ratings, so the review triggers updating the rating aggregates don't evict them.
+CATALOG_TABLES = {
+    'companies': ('company', 'id', 'UPDATE OR DELETE'),
+    'staff': ('staff', 'id', 'UPDATE OF user_id, company_id, role, avatar_url OR DELETE'),
+    'staff_services': ('staff_service', 'id', 'UPDATE OR DELETE'),
+    'working_hours': ('working_hours', 'staff_id', 'INSERT OR UPDATE OR DELETE'),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(NOTIFY_CATALOG_CHANGE)
+    for table, (namespace, key, events) in CATALOG_TABLES.items():
+        op.execute(
+            f"CREATE TRIGGER tr_{table}_notify_catalog_change AFTER {events} ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION notify_catalog_change('{namespace}', '{key}')"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in CATALOG_TABLES:
+        op.execute(f'DROP TRIGGER tr_{table}_notify_catalog_change ON {table}')
+    op.execute('DROP FUNCTION notify_catalog_change()')
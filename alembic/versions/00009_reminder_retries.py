@@ -0,0 +1,32 @@
+"""reminder_retries
+
+Revision ID: 00009
+Revises: 00008
+Create Date: 2026-10-18 20:48:15.902364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '00009'
+down_revision: Union[str, Sequence[str], None] = '00008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'appointments', sa.Column('reminder_attempts', sa.Integer(), server_default=sa.text('0'), nullable=False)
+    )
+    op.add_column('appointments', sa.Column('reminder_next_attempt_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('appointments', 'reminder_next_attempt_at')
+    op.drop_column('appointments', 'reminder_attempts')
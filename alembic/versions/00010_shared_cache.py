@@ -0,0 +1,43 @@
+"""shared_cache
+
+Revision ID: 00010
+Revises: 00009
+Create Date: 2026-10-18 21:37:09.418226
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '00010'
+down_revision: Union[str, Sequence[str], None] = '00009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('shared_cache',
+    sa.Column('key', sa.String(length=255), nullable=False),
+    sa.Column('value', sa.LargeBinary(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=True),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('key')
+    )
+    op.create_index(op.f('ix_shared_cache_created_at'), 'shared_cache', ['created_at'], unique=False)
+    op.create_index(op.f('ix_shared_cache_expires_at'), 'shared_cache', ['expires_at'], unique=False)
+    op.create_index(op.f('ix_shared_cache_id'), 'shared_cache', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_shared_cache_id'), table_name='shared_cache')
+    op.drop_index(op.f('ix_shared_cache_expires_at'), table_name='shared_cache')
+    op.drop_index(op.f('ix_shared_cache_created_at'), table_name='shared_cache')
+    op.drop_table('shared_cache')
@@ -0,0 +1,37 @@
+"""keyset_pagination_indexes
+
+Revision ID: 00011
+Revises: 00010
+Create Date: 2026-10-18 22:05:52.771840
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '00011'
+down_revision: Union[str, Sequence[str], None] = '00010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Listings filtered by their parent page through these in (created_at, id) order, read backwards
+PAGINATION_INDEXES = {
+    'ix_staff_company_id_created_at_id': ('staff', ['company_id', 'created_at', 'id']),
+    'ix_appointments_company_id_created_at_id': ('appointments', ['company_id', 'created_at', 'id']),
+    'ix_staff_services_staff_id_created_at_id': ('staff_services', ['staff_id', 'created_at', 'id']),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, (table, columns) in PAGINATION_INDEXES.items():
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, (table, _) in PAGINATION_INDEXES.items():
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,267 @@
+"""In-memory stand-ins for the repositories used by the benchmarks.
+
+They implement the application interfaces, so the API, services and
+serialization run exactly as in production while the database is replaced
+by dictionaries. That isolates the cost of the Python request path.
+"""
+
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from typing import AsyncIterator
+from uuid import UUID, uuid4
+
+from src.application.interfaces.appointment_repository import AbstractAppointmentRepository
+from src.application.interfaces.availability_repository import AbstractAvailabilityRepository, BusyInterval
+from src.application.interfaces.company_repository import AbstractCompanyRepository
+from src.application.interfaces.staff_repository import AbstractStaffRepository
+from src.application.interfaces.staff_service_repository import AbstractStaffServiceRepository
+from src.application.interfaces.user_repository import AbstractUserRepository
+from src.application.schemas.appointment_export import AppointmentExportRow
+from src.domain.entities import (
+    DomainAppointment,
+    DomainCompany,
+    DomainStaff,
+    DomainStaffService,
+    DomainUser,
+    DomainWorkingHours,
+)
+from src.domain.enums import WeekDay
+from src.domain.exceptions import AppointmentConflict, ObjectAlreadyExists
+from src.infrastructure.security.auth_security import AuthSecurity
+
+
+def _page(items: list, limit: int, cursor: str | None) -> tuple[list, str | None]:
+    start = int(cursor) if cursor else 0
+    page = items[start:start + limit]
+    next_cursor = str(start + limit) if start + limit < len(items) else None
+    return page, next_cursor
+
+
+class FakeDataset:
+    """A small tenant: companies with staff, services, working hours and users."""
+
+    def __init__(self, companies: int = 5, staff_per_company: int = 10, users: int = 1000):
+        now = datetime.now().replace(microsecond=0)
+        self.users: dict[str, DomainUser] = {}
+        for index in range(users):
+            user = DomainUser.create(email=f"user{index}@example.com", phone="+100000000", password_hash="x")
+            user.created_at = user.updated_at = now
+            self.users[user.email] = user
+
+        self.companies: list[DomainCompany] = []
+        self.staff: list[DomainStaff] = []
+        self.services: list[DomainStaffService] = []
+        self.working_hours: list[DomainWorkingHours] = []
+        user_ids = [user.id for user in self.users.values()]
+        for company_index in range(companies):
+            company = DomainCompany(
+                id=uuid4(), company_name=f"Salon {company_index}", company_address="Main st.", created_at=now
+            )
+            self.companies.append(company)
+            for staff_index in range(staff_per_company):
+                member = DomainStaff(
+                    id=uuid4(),
+                    user_id=user_ids[(company_index * staff_per_company + staff_index) % len(user_ids)],
+                    company_id=company.id,
+                    created_at=now,
+                )
+                self.staff.append(member)
+                self.services.append(
+                    DomainStaffService(
+                        id=uuid4(), staff_id=member.id, name="Haircut", price=25.0, duration=30, created_at=now
+                    )
+                )
+                for day in list(WeekDay)[:6]:
+                    self.working_hours.append(
+                        DomainWorkingHours(
+                            id=uuid4(), staff_id=member.id, day_of_week=day, start_time=time(9), end_time=time(18)
+                        )
+                    )
+
+        self.appointments: list[DomainAppointment] = []
+        start = datetime.combine(now.date() + timedelta(days=1), time(10))
+        for member, service in zip(self.staff, self.services):
+            for day in range(30):
+                appointment_start = start + timedelta(days=day)
+                self.appointments.append(
+                    DomainAppointment.create(
+                        company_id=member.company_id,
+                        staff_id=member.id,
+                        user_id=user_ids[0],
+                        service_id=service.id,
+                        appointment_start=appointment_start,
+                        appointment_end=appointment_start + timedelta(minutes=service.duration),
+                        price=service.price,
+                    )
+                )
+
+
+class FakeUserRepository(AbstractUserRepository):
+
+    def __init__(self, dataset: FakeDataset):
+        self.dataset = dataset
+
+    async def create_user(self, user: DomainUser) -> DomainUser:
+        return await self.register_user(user)
+
+    async def get_user(self, email: str) -> DomainUser | None:
+        return self.dataset.users.get(email)
+
+    async def get_users_by_email(self, emails: list[str]) -> list[DomainUser]:
+        return [self.dataset.users[email] for email in emails if email in self.dataset.users]
+
+    async def register_user(self, user: DomainUser) -> DomainUser:
+        if user.email in self.dataset.users:
+            raise ObjectAlreadyExists(f"User with this email: {user.email} already exists.")
+        user.created_at = user.updated_at = datetime.now()
+        self.dataset.users[user.email] = user
+        return user
+
+    async def email_exists(self, email: str) -> bool:
+        return email in self.dataset.users
+
+    async def list_users(self, limit: int, cursor: str | None = None) -> tuple[list[DomainUser], str | None]:
+        return _page(list(self.dataset.users.values()), limit, cursor)
+
+
+class FakeCompanyRepository(AbstractCompanyRepository):
+
+    def __init__(self, dataset: FakeDataset):
+        self.dataset = dataset
+
+    async def get_company(self, company_id: UUID) -> DomainCompany | None:
+        return next((company for company in self.dataset.companies if company.id == company_id), None)
+
+    async def get_companies_by_ids(self, company_ids: list[UUID]) -> list[DomainCompany]:
+        wanted = set(company_ids)
+        return [company for company in self.dataset.companies if company.id in wanted]
+
+    async def list_companies(self, limit: int, cursor: str | None = None) -> tuple[list[DomainCompany], str | None]:
+        return _page(self.dataset.companies, limit, cursor)
+
+
+class FakeStaffRepository(AbstractStaffRepository):
+
+    def __init__(self, dataset: FakeDataset):
+        self.dataset = dataset
+
+    async def get_staff(self, staff_id: UUID) -> DomainStaff | None:
+        return next((member for member in self.dataset.staff if member.id == staff_id), None)
+
+    async def get_staff_by_ids(self, staff_ids: list[UUID]) -> list[DomainStaff]:
+        wanted = set(staff_ids)
+        return [member for member in self.dataset.staff if member.id in wanted]
+
+    async def list_staff(
+        self, limit: int, cursor: str | None = None, company_id: UUID | None = None
+    ) -> tuple[list[DomainStaff], str | None]:
+        staff = [member for member in self.dataset.staff if company_id is None or member.company_id == company_id]
+        return _page(staff, limit, cursor)
+
+    async def list_top_rated_staff(self, company_id: UUID, limit: int) -> list[DomainStaff]:
+        staff = [member for member in self.dataset.staff if member.company_id == company_id]
+        return sorted(staff, key=lambda member: -(member.rating_average or 0))[:limit]
+
+
+class FakeStaffServiceRepository(AbstractStaffServiceRepository):
+
+    def __init__(self, dataset: FakeDataset):
+        self.dataset = dataset
+
+    async def get_service(self, service_id: UUID) -> DomainStaffService | None:
+        return next((service for service in self.dataset.services if service.id == service_id), None)
+
+    async def get_services_by_ids(self, service_ids: list[UUID]) -> list[DomainStaffService]:
+        wanted = set(service_ids)
+        return [service for service in self.dataset.services if service.id in wanted]
+
+    async def list_services(
+        self, limit: int, cursor: str | None = None, staff_id: UUID | None = None
+    ) -> tuple[list[DomainStaffService], str | None]:
+        services = [service for service in self.dataset.services if staff_id is None or service.staff_id == staff_id]
+        return _page(services, limit, cursor)
+
+
+class FakeAvailabilityRepository(AbstractAvailabilityRepository):
+
+    def __init__(self, dataset: FakeDataset):
+        self.dataset = dataset
+
+    async def get_staff_service(self, service_id: UUID) -> DomainStaffService | None:
+        return next((service for service in self.dataset.services if service.id == service_id), None)
+
+    async def get_working_hours(self, staff_ids: list[UUID]) -> list[DomainWorkingHours]:
+        wanted = set(staff_ids)
+        return [hours for hours in self.dataset.working_hours if hours.staff_id in wanted]
+
+    async def get_busy_intervals(
+        self, staff_ids: list[UUID], range_start: datetime, range_end: datetime
+    ) -> list[BusyInterval]:
+        wanted = set(staff_ids)
+        busy = [
+            (appointment.staff_id, appointment.appointment_start, appointment.appointment_end)
+            for appointment in self.dataset.appointments
+            if appointment.staff_id in wanted
+            and appointment.appointment_start < range_end
+            and appointment.appointment_end > range_start
+        ]
+        return sorted(busy, key=lambda interval: (str(interval[0]), interval[1]))
+
+
+class FakeAppointmentRepository(AbstractAppointmentRepository):
+
+    def __init__(self, dataset: FakeDataset):
+        self.dataset = dataset
+        self._by_staff: dict[UUID, list[DomainAppointment]] = defaultdict(list)
+        for appointment in dataset.appointments:
+            self._by_staff[appointment.staff_id].append(appointment)
+
+    async def create_appointment(self, appointment: DomainAppointment) -> DomainAppointment:
+        for existing in self._by_staff[appointment.staff_id]:
+            if (
+                existing.appointment_start < appointment.appointment_end
+                and existing.appointment_end > appointment.appointment_start
+            ):
+                raise AppointmentConflict("Staff member is already booked at this time.")
+        appointment.created_at = appointment.updated_at = datetime.now()
+        self._by_staff[appointment.staff_id].append(appointment)
+        self.dataset.appointments.append(appointment)
+        return appointment
+
+    async def list_appointments(
+        self, limit: int, cursor: str | None = None, company_id: UUID | None = None
+    ) -> tuple[list[DomainAppointment], str | None]:
+        appointments = [
+            appointment
+            for appointment in self.dataset.appointments
+            if company_id is None or appointment.company_id == company_id
+        ]
+        return _page(appointments, limit, cursor)
+
+    async def stream_export_rows(
+        self, company_id: UUID, start_from: datetime, start_to: datetime
+    ) -> AsyncIterator[AppointmentExportRow]:
+        for appointment in sorted(self.dataset.appointments, key=lambda appointment: appointment.appointment_start):
+            if appointment.company_id == company_id and start_from <= appointment.appointment_start < start_to:
+                yield AppointmentExportRow(
+                    id=appointment.id,
+                    appointment_start=appointment.appointment_start,
+                    appointment_end=appointment.appointment_end,
+                    status=appointment.status,
+                    service_name=None,
+                    service_price=None,
+                    staff_first_name=None,
+                    staff_last_name=None,
+                    customer_first_name=None,
+                    customer_last_name=None,
+                )
+
+
+class FastHashAuthSecurity(AuthSecurity):
+    """AuthSecurity with a trivial password hash, for measuring the request path without bcrypt."""
+
+    async def hash_password_async(self, password: str) -> str:
+        return f"plain${password}"
+
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        return hashed_password == f"plain${plain_password}"
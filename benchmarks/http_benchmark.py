@@ -0,0 +1,291 @@
+"""In-process HTTP benchmark of the API.
+
+Builds the app with ``create_app()`` and drives it through httpx's ASGI
+transport, so no server or network is involved. By default repositories are
+replaced with in-memory fakes (see ``benchmarks.fakes``); ``--backend postgres``
+keeps the real repositories and hits the database from the settings.
+
+Usage:
+    python -m benchmarks.http_benchmark
+    python -m benchmarks.http_benchmark --requests 5000 --concurrency 64 --scenario health
+    python -m benchmarks.http_benchmark --output benchmarks/results/$(git rev-parse --short HEAD).json
+
+Results (p50/p95/p99 latency in ms and req/s per scenario) are printed and
+written as JSON to ``--output`` so runs can be compared across commits.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
+
+import httpx
+
+from benchmarks.fakes import (
+    FakeAppointmentRepository,
+    FakeAvailabilityRepository,
+    FakeCompanyRepository,
+    FakeDataset,
+    FakeStaffRepository,
+    FakeStaffServiceRepository,
+    FakeUserRepository,
+    FastHashAuthSecurity,
+)
+from src.infrastructure.repositories.batched_repositories import (
+    BatchingCompanyRepository,
+    BatchingStaffRepository,
+    BatchingStaffServiceRepository,
+    BatchingUserRepository,
+)
+from src.infrastructure.repositories.cached_repositories import (
+    CachedAvailabilityRepository,
+    CachedCompanyRepository,
+    CachedStaffRepository,
+    CachedStaffServiceRepository,
+)
+from src.main import create_app
+from src.presentation.api import dependencies
+
+DEFAULT_OUTPUT = Path(__file__).resolve().parent / "results" / "latest.json"
+
+
+@dataclass
+class Scenario:
+    """One endpoint to benchmark; ``build`` returns (method, url, json body) for the i-th request."""
+
+    name: str
+    build: Callable[[int], tuple[str, str, dict | None]]
+    expected_status: tuple[int, ...] = (200,)
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    requests: int
+    concurrency: int
+    errors: int
+    duration_seconds: float
+    requests_per_second: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    max_ms: float
+
+
+def _percentile(sorted_values: list[float], percentile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(percentile / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def build_scenarios(dataset: FakeDataset | None) -> list[Scenario]:
+    """All benchmarked endpoints; add new hot endpoints here."""
+    run_id = int(time.time())
+    scenarios = [
+        Scenario("health", lambda i: ("GET", "/v1/health", None)),
+        Scenario(
+            "create_user",
+            lambda i: (
+                "POST",
+                "/v1/users/",
+                {"email": f"bench-{run_id}-{i}@example.com", "phone": "+100000000", "password": "secret-password"},
+            ),
+        ),
+        Scenario("list_users", lambda i: ("GET", "/v1/users/?limit=50", None)),
+        Scenario("list_companies", lambda i: ("GET", "/v1/companies/?limit=50", None)),
+        Scenario("list_services", lambda i: ("GET", "/v1/services/?limit=100", None)),
+        Scenario("list_appointments", lambda i: ("GET", "/v1/appointments/?limit=100", None)),
+    ]
+    if dataset is None:
+        return scenarios
+
+    services = dataset.services
+    today = date.today()
+    scenarios.append(
+        Scenario(
+            "get_service",
+            lambda i: ("GET", f"/v1/services/{services[i % len(services)].id}", None),
+        )
+    )
+    scenarios.append(
+        Scenario(
+            "availability_30d",
+            lambda i: (
+                "GET",
+                f"/v1/availability/?service_id={services[i % len(services)].id}"
+                f"&date_from={today + timedelta(days=1)}&date_to={today + timedelta(days=30)}",
+                None,
+            ),
+        )
+    )
+    booking_start = datetime.combine(today + timedelta(days=1), datetime.min.time()).replace(hour=9)
+
+    def booking_time(i: int) -> str:
+        # Walk through the 18 half-hour slots of each working day, then move to the next day
+        slot = i // len(services)
+        return (booking_start + timedelta(days=slot // 18, minutes=30 * (slot % 18))).isoformat()
+
+    scenarios.append(
+        Scenario(
+            "book_appointment",
+            lambda i: (
+                "POST",
+                "/v1/appointments/",
+                {
+                    "service_id": str(services[i % len(services)].id),
+                    "user_id": str(dataset.staff[0].user_id),
+                    "appointment_start": booking_time(i),
+                },
+            ),
+            expected_status=(201, 400, 409),
+        )
+    )
+    return scenarios
+
+
+def install_fakes(app, dataset: FakeDataset, real_hashing: bool) -> None:
+    """Swap the database-backed dependencies for in-memory fakes.
+
+    Fakes stay behind the production batching and caching wrappers so those paths are measured too.
+    """
+
+    async def no_unit_of_work():
+        yield None
+
+    app.dependency_overrides.update({
+        dependencies.get_unit_of_work: no_unit_of_work,
+        dependencies.get_user_repository: lambda: BatchingUserRepository(FakeUserRepository(dataset)),
+        dependencies.get_company_repository: lambda: CachedCompanyRepository(
+            BatchingCompanyRepository(FakeCompanyRepository(dataset))
+        ),
+        dependencies.get_staff_repository: lambda: CachedStaffRepository(
+            BatchingStaffRepository(FakeStaffRepository(dataset))
+        ),
+        dependencies.get_uncached_staff_repository: lambda: BatchingStaffRepository(FakeStaffRepository(dataset)),
+        dependencies.get_staff_service_repository: lambda: CachedStaffServiceRepository(
+            BatchingStaffServiceRepository(FakeStaffServiceRepository(dataset))
+        ),
+        dependencies.get_availability_repository: lambda: CachedAvailabilityRepository(
+            FakeAvailabilityRepository(dataset)
+        ),
+        dependencies.get_appointment_repository: lambda: FakeAppointmentRepository(dataset),
+        # Every benchmark client shares one address, rate limits would only measure 429s
+        dependencies.admit_credential_request: lambda: None,
+        dependencies.get_email_rate_limiter: lambda: None,
+    })
+    if not real_hashing:
+        app.dependency_overrides[dependencies.get_auth_security] = lambda: FastHashAuthSecurity()
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, scenario: Scenario, requests: int, concurrency: int, warmup: int
+) -> ScenarioResult:
+    counter = itertools.count()
+    latencies: list[float] = []
+    errors = 0
+
+    async def send(index: int, record: bool) -> None:
+        nonlocal errors
+        method, url, body = scenario.build(index)
+        started = time.perf_counter()
+        response = await client.request(method, url, json=body)
+        elapsed = time.perf_counter() - started
+        if record:
+            latencies.append(elapsed)
+            if response.status_code not in scenario.expected_status:
+                errors += 1
+
+    async def worker(total: int, record: bool) -> None:
+        while (index := next(counter)) < total:
+            await send(index, record)
+
+    await asyncio.gather(*(worker(warmup, False) for _ in range(concurrency)))
+    counter = itertools.count(warmup)
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(warmup + requests, True) for _ in range(concurrency)))
+    duration = time.perf_counter() - started
+
+    latencies.sort()
+    to_ms = 1000
+    return ScenarioResult(
+        name=scenario.name,
+        requests=requests,
+        concurrency=concurrency,
+        errors=errors,
+        duration_seconds=round(duration, 4),
+        requests_per_second=round(requests / duration, 1) if duration else 0.0,
+        p50_ms=round(_percentile(latencies, 50) * to_ms, 3),
+        p95_ms=round(_percentile(latencies, 95) * to_ms, 3),
+        p99_ms=round(_percentile(latencies, 99) * to_ms, 3),
+        mean_ms=round(statistics.fmean(latencies) * to_ms, 3) if latencies else 0.0,
+        max_ms=round(latencies[-1] * to_ms, 3) if latencies else 0.0,
+    )
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="In-process HTTP benchmark of the BookMe API.")
+    parser.add_argument("--backend", choices=["fake", "postgres"], default="fake")
+    parser.add_argument("--scenario", action="append", help="Run only these scenarios (repeatable)")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--real-hashing", action="store_true", help="Keep bcrypt on the signup path")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> dict:
+    app = create_app()
+    dataset = None
+    if args.backend == "fake":
+        dataset = FakeDataset()
+        install_fakes(app, dataset, real_hashing=args.real_hashing)
+
+    scenarios = build_scenarios(dataset)
+    if args.scenario:
+        scenarios = [scenario for scenario in scenarios if scenario.name in args.scenario]
+
+    results = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for scenario in scenarios:
+            result = await run_scenario(client, scenario, args.requests, args.concurrency, args.warmup)
+            results.append(result)
+            print(
+                f"{result.name:<20} {result.requests_per_second:>9.1f} req/s  "
+                f"p50 {result.p50_ms:>8.3f} ms  p95 {result.p95_ms:>8.3f} ms  "
+                f"p99 {result.p99_ms:>8.3f} ms  errors {result.errors}"
+            )
+
+    report = {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "backend": args.backend,
+        "real_hashing": args.real_hashing,
+        "results": [asdict(result) for result in results],
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2))
+    return report
+
+
+if __name__ == "__main__":
+    asyncio.run(main(_parse_args()))
@@ -0,0 +1,64 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from uuid import UUID
+
+from src.application.schemas.analytics import DailyStatusTotals, StaffBookedTotals
+
+
+class AbstractAnalyticsRepository(ABC):
+    """Repository interface for the appointment rollups behind company analytics."""
+
+    @abstractmethod
+    async def get_daily_totals(self, company_id: UUID, date_from: date, date_to: date) -> list[DailyStatusTotals]:
+        """Retrieve a company's appointment totals per day and status.
+        
+        Args:
+            company_id: Company identifier
+            date_from: First day (inclusive)
+            date_to: Last day (inclusive)
+            
+        Returns:
+            Totals ordered by day; days without appointments are missing
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_staff_booked_totals(
+        self, company_id: UUID, date_from: date, date_to: date
+    ) -> list[StaffBookedTotals]:
+        """Retrieve the non-canceled appointment totals of every staff member of a company.
+        
+        Args:
+            company_id: Company identifier
+            date_from: First day (inclusive)
+            date_to: Last day (inclusive)
+            
+        Returns:
+            One entry per staff member, with zeros for those without appointments
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_company_ids_for_day(self, day: date) -> list[UUID]:
+        """Retrieve the companies with appointments or rollup rows on a day.
+        
+        Args:
+            day: Day to look at
+            
+        Returns:
+            Company identifiers, in no particular order
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def reconcile_day(self, company_id: UUID, day: date) -> int:
+        """Rebuild the rollup rows of one company and day from the appointments.
+        
+        Args:
+            company_id: Company identifier
+            day: Day to rebuild
+            
+        Returns:
+            Number of rollup rows written
+        """
+        raise NotImplementedError
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+
+class AbstractAppointmentPartitionRepository(ABC):
+    """Repository interface for the monthly partitions of the appointments table."""
+
+    @abstractmethod
+    async def create_partitions(self, month_from: date, month_to: date) -> list[str]:
+        """Create the missing monthly partitions of a range of months.
+        
+        Args:
+            month_from: Any day of the first month
+            month_to: Any day of the last month, inclusive
+            
+        Returns:
+            Names of the partitions created
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_partitions(self) -> dict[str, date]:
+        """Retrieve the partitions attached to the appointments table.
+        
+        Returns:
+            First day of the month each partition holds, by partition name, oldest first
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def archive_partition(self, name: str) -> None:
+        """Detach a partition and move it into the archive schema.
+        
+        Its appointments disappear from every query of the live table; the
+        analytics rollups keep counting them.
+        
+        Args:
+            name: Partition name
+        """
+        raise NotImplementedError
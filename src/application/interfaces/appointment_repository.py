@@ -0,0 +1,61 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator
+from uuid import UUID
+
+from src.application.schemas.appointment_export import AppointmentExportRow
+from src.domain.entities import DomainAppointment
+
+
+class AbstractAppointmentRepository(ABC):
+    """Repository interface for Appointment domain entity."""
+
+    @abstractmethod
+    async def create_appointment(self, appointment: DomainAppointment) -> DomainAppointment:
+        """Create a new appointment.
+        
+        Args:
+            appointment: Appointment domain entity to create
+            
+        Returns:
+            Created Appointment domain entity with generated timestamps
+            
+        Raises:
+            AppointmentConflict: If the staff member already has an overlapping booking
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_appointments(
+        self, limit: int, cursor: str | None = None, company_id: UUID | None = None
+    ) -> tuple[list[DomainAppointment], str | None]:
+        """List appointments newest first, one keyset page at a time.
+        
+        Args:
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            company_id: Only list appointments of this company
+            
+        Returns:
+            Appointments of the page and the cursor of the next page, if any
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_export_rows(
+        self, company_id: UUID, start_from: datetime, start_to: datetime
+    ) -> AsyncIterator[AppointmentExportRow]:
+        """Stream a company's appointments with staff, customer and service details.
+        
+        Rows are fetched in batches from a server-side cursor, so memory use
+        does not depend on the number of appointments.
+        
+        Args:
+            company_id: Company whose appointments are exported
+            start_from: Earliest appointment start, inclusive
+            start_to: Latest appointment start, exclusive
+            
+        Returns:
+            Async iterator of export rows ordered by appointment start
+        """
+        raise NotImplementedError
@@ -15,6 +15,16 @@ class AbstractAuthSecurity(ABC):
         """Hash a plain password."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a plain password off the event loop."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a plain password off the event loop."""
+        raise NotImplementedError
+
     @abstractmethod
     def create_token(self, payload: dict, token_type: TokenType, expire_minutes: int) -> str:
         """Create an access token."""
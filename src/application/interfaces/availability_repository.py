@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.entities import DomainStaffService, DomainWorkingHours
+
+# (staff_id, start, end) of an interval in which the staff member is booked
+BusyInterval = tuple[UUID, datetime, datetime]
+
+
+class AbstractAvailabilityRepository(ABC):
+    """Repository interface for the data behind availability search.
+    
+    Every method loads data for many staff members in one query so the
+    availability service never queries per slot or per day.
+    """
+
+    @abstractmethod
+    async def get_staff_service(self, service_id: UUID) -> DomainStaffService | None:
+        """Retrieve a staff service by id.
+        
+        Args:
+            service_id: Staff service identifier
+            
+        Returns:
+            StaffService domain entity if found, None otherwise
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_working_hours(self, staff_ids: list[UUID]) -> list[DomainWorkingHours]:
+        """Retrieve the weekly working hours of the given staff members.
+        
+        Args:
+            staff_ids: Staff member identifiers
+            
+        Returns:
+            WorkingHours domain entities for all given staff members
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_busy_intervals(
+        self, staff_ids: list[UUID], range_start: datetime, range_end: datetime
+    ) -> list[BusyInterval]:
+        """Retrieve non-canceled appointments overlapping a time range.
+        
+        Args:
+            staff_ids: Staff member identifiers
+            range_start: Range start (inclusive)
+            range_end: Range end (exclusive)
+            
+        Returns:
+            Busy intervals ordered by staff_id and start
+        """
+        raise NotImplementedError
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+from src.application.schemas.bulk_import import ImportEntity
+
+
+class AbstractBulkImportRepository(ABC):
+    """Repository interface for bulk inserts of already validated rows."""
+
+    @abstractmethod
+    async def insert_rows(self, entity: ImportEntity, rows: list[dict]) -> list[str | None]:
+        """Insert a chunk of rows, skipping the ones that can't be stored.
+        
+        Args:
+            entity: Entity the rows belong to
+            rows: Column values per row, each including its ``id``
+            
+        Returns:
+            Per-row error message, None for rows that were inserted
+        """
+        raise NotImplementedError
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractCacheBackend(ABC):
+    """Interface of a shared (cross-process) cache such as Redis or Memcached.
+    
+    Values are opaque bytes; serialization is up to the caller.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Return the value stored under key, or None."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl_seconds: float | None = None) -> None:
+        """Store a value, optionally expiring after ttl_seconds."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a key if present."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def incr(self, key: str, ttl_seconds: float | None = None) -> int:
+        """Atomically increment an integer counter (missing counts as 0) and return the new value.
+
+        A counter created by the call expires after ttl_seconds; an existing one keeps its expiry.
+        """
+        raise NotImplementedError
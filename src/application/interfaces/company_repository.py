@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from src.domain.entities import DomainCompany
+
+
+class AbstractCompanyRepository(ABC):
+    """Repository interface for Company domain entity."""
+
+    @abstractmethod
+    async def list_companies(self, limit: int, cursor: str | None = None) -> tuple[list[DomainCompany], str | None]:
+        """List companies newest first, one keyset page at a time.
+        
+        Args:
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            
+        Returns:
+            Companies of the page and the cursor of the next page, if any
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_company(self, company_id: UUID) -> DomainCompany | None:
+        """Retrieve a company by id.
+        
+        Args:
+            company_id: Company identifier
+            
+        Returns:
+            Company domain entity if found, None otherwise
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_companies_by_ids(self, company_ids: list[UUID]) -> list[DomainCompany]:
+        """Retrieve many companies by id in one query.
+        
+        Args:
+            company_ids: Identifiers to look up
+            
+        Returns:
+            Companies found, in no particular order
+        """
+        raise NotImplementedError
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractRateLimiter(ABC):
+    """Rate limiter interface.
+    
+    The in-process implementation limits per worker; an implementation on a
+    shared store (e.g. a Redis script) enforces one budget across workers.
+    """
+
+    @abstractmethod
+    async def hit(self, key: str, cost: float = 1.0) -> float:
+        """Spend ``cost`` from the budget of ``key`` if it is available.
+        
+        Args:
+            key: Client the budget belongs to, e.g. an IP address or e-mail
+            cost: Amount to spend
+            
+        Returns:
+            0 if the request is allowed, otherwise seconds until it would be
+        """
+        raise NotImplementedError
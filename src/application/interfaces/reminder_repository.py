@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from src.application.schemas.reminder import AppointmentReminder
+
+
+class AbstractReminderRepository(ABC):
+    """Repository interface for appointment reminders."""
+
+    @abstractmethod
+    async def claim_due_reminders(
+        self, now: datetime, due_before: datetime, limit: int, retry_delay: timedelta, max_attempts: int
+    ) -> list[AppointmentReminder]:
+        """Claim a batch of scheduled appointments still waiting for their reminder.
+        
+        Claiming counts an attempt and holds the reminder back until
+        ``retry_delay * 2 ** previous attempts`` from now, so once committed
+        no other worker claims it while it is being sent, and a failed send
+        is retried after that backoff. Rows locked by another worker's claim
+        are skipped.
+        
+        Args:
+            now: Appointments that already started are not claimed
+            due_before: Only appointments starting before this are claimed
+            limit: Maximum batch size
+            retry_delay: Backoff after the first attempt
+            max_attempts: Reminders attempted this often are given up
+            
+        Returns:
+            Claimed reminders, earliest appointment first
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def mark_reminders_sent(self, appointment_ids: list[UUID], sent_at: datetime) -> None:
+        """Record that the reminders of these appointments went out.
+        
+        Args:
+            appointment_ids: Appointments whose reminder was sent
+            sent_at: When they were sent
+        """
+        raise NotImplementedError
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+from src.application.schemas.reminder import AppointmentReminder
+
+
+class AbstractReminderSender(ABC):
+    """Delivery channel for appointment reminders (e-mail, SMS, push, ...)."""
+
+    @abstractmethod
+    async def send(self, reminder: AppointmentReminder) -> None:
+        """Deliver one reminder.
+        
+        Args:
+            reminder: Reminder to deliver
+            
+        Raises:
+            Exception: Any error marks the reminder as not sent; it is retried after the backoff
+        """
+        raise NotImplementedError
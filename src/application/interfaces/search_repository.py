@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+
+from src.application.schemas.search import CompanySearchHit, ServiceSearchHit
+
+
+class AbstractSearchRepository(ABC):
+    """Repository interface for fuzzy catalog search."""
+
+    @abstractmethod
+    async def search_companies(
+        self, query: str, limit: int, cursor: str | None = None
+    ) -> tuple[list[CompanySearchHit], str | None]:
+        """Search companies by name and address, best match first.
+        
+        Args:
+            query: Search text, matched against whole words and word prefixes
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            
+        Returns:
+            Matching companies and the cursor of the next page, None on the last page
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search_services(
+        self, query: str, limit: int, cursor: str | None = None
+    ) -> tuple[list[ServiceSearchHit], str | None]:
+        """Search active staff services by name and description, best match first.
+        
+        Args:
+            query: Search text, matched against whole words and word prefixes
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            
+        Returns:
+            Matching services and the cursor of the next page, None on the last page
+        """
+        raise NotImplementedError
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class AbstractStaffRatingRepository(ABC):
+    """Repository interface for the per-staff rating aggregates."""
+
+    @abstractmethod
+    async def rebuild_ratings(self, staff_ids: list[UUID] | None = None) -> list[UUID]:
+        """Recompute rating aggregates from the reviews and fix the ones that drifted.
+        
+        Args:
+            staff_ids: Only rebuild these staff members, all by default
+            
+        Returns:
+            Staff members whose stored aggregates were corrected
+        """
+        raise NotImplementedError
@@ -0,0 +1,61 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from src.domain.entities import DomainStaff
+
+
+class AbstractStaffRepository(ABC):
+    """Repository interface for Staff domain entity."""
+
+    @abstractmethod
+    async def list_staff(
+        self, limit: int, cursor: str | None = None, company_id: UUID | None = None
+    ) -> tuple[list[DomainStaff], str | None]:
+        """List staff members newest first, one keyset page at a time.
+        
+        Args:
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            company_id: Only list staff of this company
+            
+        Returns:
+            Staff members of the page and the cursor of the next page, if any
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_staff(self, staff_id: UUID) -> DomainStaff | None:
+        """Retrieve a staff member by id.
+        
+        Args:
+            staff_id: Staff member identifier
+            
+        Returns:
+            Staff domain entity if found, None otherwise
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_staff_by_ids(self, staff_ids: list[UUID]) -> list[DomainStaff]:
+        """Retrieve many staff members by id in one query.
+        
+        Args:
+            staff_ids: Identifiers to look up
+            
+        Returns:
+            Staff members found, in no particular order
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_top_rated_staff(self, company_id: UUID, limit: int) -> list[DomainStaff]:
+        """List a company's staff members best rated first.
+        
+        Args:
+            company_id: Company whose staff is listed
+            limit: Maximum number of staff members
+            
+        Returns:
+            Staff members by average rating descending, unrated ones last
+        """
+        raise NotImplementedError
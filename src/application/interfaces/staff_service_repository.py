@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from src.domain.entities import DomainStaffService
+
+
+class AbstractStaffServiceRepository(ABC):
+    """Repository interface for StaffService domain entity."""
+
+    @abstractmethod
+    async def list_services(
+        self, limit: int, cursor: str | None = None, staff_id: UUID | None = None
+    ) -> tuple[list[DomainStaffService], str | None]:
+        """List staff services newest first, one keyset page at a time.
+        
+        Args:
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            staff_id: Only list services of this staff member
+            
+        Returns:
+            Services of the page and the cursor of the next page, if any
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_service(self, service_id: UUID) -> DomainStaffService | None:
+        """Retrieve a staff service by id.
+        
+        Args:
+            service_id: Staff service identifier
+            
+        Returns:
+            StaffService domain entity if found, None otherwise
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_services_by_ids(self, service_ids: list[UUID]) -> list[DomainStaffService]:
+        """Retrieve many staff services by id in one query.
+        
+        Args:
+            service_ids: Identifiers to look up
+            
+        Returns:
+            Staff services found, in no particular order
+        """
+        raise NotImplementedError
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractUnitOfWork(ABC):
+    """Unit of work interface.
+    
+    A unit of work spans one business transaction (usually one request).
+    All repository calls made inside it share a single session and are
+    committed together.
+    """
+
+    @abstractmethod
+    async def __aenter__(self) -> "AbstractUnitOfWork":
+        raise NotImplementedError
+
+    @abstractmethod
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Commit all changes made in this unit of work."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Discard all changes made in this unit of work."""
+        raise NotImplementedError
@@ -33,3 +33,55 @@ class AbstractUserRepository(ABC):
             User domain entity if found, None otherwise
         """
         raise NotImplementedError
+
+    @abstractmethod
+    async def register_user(self, user: DomainUser) -> DomainUser:
+        """Atomically insert a user unless the email is already taken.
+        
+        Args:
+            user: User domain entity to create
+            
+        Returns:
+            Created User domain entity with generated timestamps
+            
+        Raises:
+            ObjectAlreadyExists: If a user with this email already exists
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def email_exists(self, email: str) -> bool:
+        """Check whether a user with this email exists.
+        
+        Args:
+            email: User email address
+            
+        Returns:
+            True if the email is taken, False otherwise
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_users(self, limit: int, cursor: str | None = None) -> tuple[list[DomainUser], str | None]:
+        """List users newest first, one keyset page at a time.
+        
+        Args:
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            
+        Returns:
+            Users of the page and the cursor of the next page, if any
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_users_by_email(self, emails: list[str]) -> list[DomainUser]:
+        """Retrieve the users with any of the given emails in one query.
+        
+        Args:
+            emails: User email addresses
+            
+        Returns:
+            Users found, in no particular order
+        """
+        raise NotImplementedError
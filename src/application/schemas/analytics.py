@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+from datetime import date
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.domain.enums import AppointmentStatus
+
+
+@dataclass(frozen=True, slots=True)
+class DailyStatusTotals:
+    """Appointment totals of one company for one day and status."""
+
+    day: date
+    status: AppointmentStatus
+    booking_count: int
+    revenue: float
+    booked_minutes: int
+
+
+@dataclass(frozen=True, slots=True)
+class StaffBookedTotals:
+    """Non-canceled appointment totals of one staff member over a date range."""
+
+    staff_id: UUID
+    booking_count: int
+    booked_minutes: int
+
+
+class DailyStatsSchema(BaseModel):
+    """Schema for the appointments of one day."""
+
+    day: date
+    scheduled: int = 0
+    completed: int = 0
+    canceled: int = 0
+    revenue: float = 0
+    booked_minutes: int = 0
+
+
+class StaffUtilizationSchema(BaseModel):
+    """Schema for the share of a staff member's working time that is booked."""
+
+    staff_id: UUID
+    booking_count: int
+    booked_minutes: int
+    available_minutes: int
+    utilization: float | None = None
@@ -0,0 +1,29 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.application.schemas.base import DomainOutputSchema
+from src.domain.enums import AppointmentStatus
+
+
+class AppointmentInputSchema(BaseModel):
+    """Schema for appointment booking input data."""
+
+    service_id: UUID
+    user_id: UUID
+    appointment_start: datetime
+
+
+class AppointmentOutputSchema(DomainOutputSchema):
+    """Schema for appointment output data."""
+
+    id: UUID
+    company_id: UUID
+    staff_id: UUID | None = None
+    user_id: UUID | None = None
+    service_id: UUID | None = None
+    appointment_start: datetime
+    appointment_end: datetime
+    status: AppointmentStatus
+    price: float | None = None
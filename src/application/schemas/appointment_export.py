@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+from uuid import UUID
+
+from src.domain.enums import AppointmentStatus
+
+
+class ExportFormat(StrEnum):
+    """Supported appointment export formats."""
+    CSV = "csv"
+    ICS = "ics"
+
+
+@dataclass(frozen=True, slots=True)
+class AppointmentExportRow:
+    """One exported appointment joined with its staff member, customer and service.
+
+    Customer contact details are left out: exports are files that get passed
+    around, and customers are reached through the reminders instead.
+    """
+
+    id: UUID
+    appointment_start: datetime
+    appointment_end: datetime
+    status: AppointmentStatus
+    service_name: str | None
+    service_price: float | None
+    staff_first_name: str | None
+    staff_last_name: str | None
+    customer_first_name: str | None
+    customer_last_name: str | None
@@ -0,0 +1,20 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class TimeSlotSchema(BaseModel):
+    """Schema for a bookable time slot."""
+
+    start: datetime
+    end: datetime
+
+
+class StaffAvailabilitySchema(BaseModel):
+    """Schema for the free slots of one staff member."""
+
+    staff_id: UUID
+    service_id: UUID
+    duration: int
+    slots: list[TimeSlotSchema]
@@ -0,0 +1,26 @@
+from typing import Any, ClassVar, TypeVar
+
+from pydantic import BaseModel, ConfigDict
+
+SchemaT = TypeVar("SchemaT", bound="DomainOutputSchema")
+
+
+class DomainOutputSchema(BaseModel):
+    """Base for output schemas built from domain entities.
+
+    Domain entities are already valid, so ``from_domain`` copies their
+    attributes into the schema without running validation. Set
+    ``validate_domain_objects`` to validate them anyway, e.g. while
+    developing a new schema.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    validate_domain_objects: ClassVar[bool] = False
+
+    @classmethod
+    def from_domain(cls: type[SchemaT], obj: Any) -> SchemaT:
+        """Build the schema from the attributes of a domain entity."""
+        if DomainOutputSchema.validate_domain_objects:
+            return cls.model_validate(obj)
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields})
@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel, EmailStr, Field, model_validator
+
+from src.domain.enums import AppointmentStatus, StaffMemberRole
+
+
+class ImportEntity(StrEnum):
+    """Entities that can be bulk imported."""
+    USERS = "users"
+    STAFF = "staff"
+    SERVICES = "services"
+    APPOINTMENTS = "appointments"
+
+
+class ImportFormat(StrEnum):
+    """Supported bulk import file formats."""
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One raw record read from an import file."""
+
+    row_number: int
+    data: dict | None = None
+    error: str | None = None
+
+
+class UserImportSchema(BaseModel):
+    """Schema for an imported user row."""
+
+    id: UUID = Field(default_factory=uuid4)
+    # Mirrors the NOT NULL and length limits of users, so a row the INSERT would reject fails validation instead
+    first_name: str = Field(min_length=1, max_length=50)
+    last_name: str = Field(min_length=1, max_length=50)
+    email: EmailStr = Field(max_length=100)
+    phone: str = Field(max_length=25)
+    password: str | None = Field(default=None, exclude=True)
+    password_hash: str | None = None
+
+    @model_validator(mode="after")
+    def check_password(self) -> "UserImportSchema":
+        if not self.password and not self.password_hash:
+            raise ValueError("Either password or password_hash is required")
+        return self
+
+
+class StaffImportSchema(BaseModel):
+    """Schema for an imported staff row."""
+
+    id: UUID = Field(default_factory=uuid4)
+    user_id: UUID
+    company_id: UUID
+    role: StaffMemberRole = StaffMemberRole.MEMBER
+    avatar_url: str | None = None
+
+
+class StaffServiceImportSchema(BaseModel):
+    """Schema for an imported staff service row."""
+
+    id: UUID = Field(default_factory=uuid4)
+    staff_id: UUID
+    name: str
+    description: str | None = None
+    price: float
+    duration: int = Field(gt=0)
+    is_active: bool = True
+
+
+class AppointmentImportSchema(BaseModel):
+    """Schema for an imported appointment row."""
+
+    id: UUID = Field(default_factory=uuid4)
+    company_id: UUID
+    staff_id: UUID | None = None
+    user_id: UUID | None = None
+    service_id: UUID | None = None
+    appointment_start: datetime
+    appointment_end: datetime
+    status: AppointmentStatus = AppointmentStatus.SCHEDULED
+    price: float | None = None
+
+
+class ImportRowErrorSchema(BaseModel):
+    """Schema for a row that could not be imported."""
+
+    row: int
+    message: str
+
+
+class ImportReportSchema(BaseModel):
+    """Schema for the outcome of a bulk import."""
+
+    entity: ImportEntity
+    total: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: list[ImportRowErrorSchema] = []
@@ -0,0 +1,16 @@
+from datetime import datetime
+from uuid import UUID
+
+from src.application.schemas.base import DomainOutputSchema
+
+
+class CompanyOutputSchema(DomainOutputSchema):
+    """Schema for company output data."""
+
+    id: UUID
+    company_name: str
+    company_address: str
+    company_email: str | None = None
+    company_phone: str | None = None
+    company_logo_url: str | None = None
+    created_at: datetime
@@ -0,0 +1,12 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class PageSchema(BaseModel, Generic[T]):
+    """Schema for one page of a keyset-paginated listing."""
+
+    items: list[T]
+    next_cursor: str | None = None
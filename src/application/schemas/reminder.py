@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class AppointmentReminder:
+    """A due reminder: an upcoming appointment with what the customer needs to know about it."""
+
+    appointment_id: UUID
+    appointment_start: datetime
+    appointment_end: datetime
+    service_name: str | None
+    staff_first_name: str | None
+    staff_last_name: str | None
+    customer_first_name: str | None
+    customer_email: str | None
+    customer_phone: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class ReminderBatchResult:
+    """Outcome of claiming and sending one batch of reminders."""
+
+    claimed: int
+    sent: int
+    failed: int
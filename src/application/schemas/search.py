@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.application.schemas.company import CompanyOutputSchema
+from src.application.schemas.staff_service import StaffServiceOutputSchema
+from src.domain.entities import DomainCompany, DomainStaffService
+
+
+@dataclass(frozen=True, slots=True)
+class CompanySearchHit:
+    """A company matching a search query."""
+
+    company: DomainCompany
+    similarity: float
+
+
+@dataclass(frozen=True, slots=True)
+class ServiceSearchHit:
+    """An active staff service matching a search query, with the company offering it."""
+
+    service: DomainStaffService
+    company_id: UUID
+    company_name: str
+    similarity: float
+
+
+class CompanySearchResultSchema(BaseModel):
+    """Schema for a company search result."""
+
+    company: CompanyOutputSchema
+    score: float
+
+
+class ServiceSearchResultSchema(BaseModel):
+    """Schema for a staff service search result."""
+
+    service: StaffServiceOutputSchema
+    company_id: UUID
+    company_name: str
+    score: float
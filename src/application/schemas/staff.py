@@ -0,0 +1,18 @@
+from datetime import datetime
+from uuid import UUID
+
+from src.application.schemas.base import DomainOutputSchema
+from src.domain.enums import StaffMemberRole
+
+
+class StaffOutputSchema(DomainOutputSchema):
+    """Schema for staff member output data."""
+
+    id: UUID
+    user_id: UUID
+    company_id: UUID
+    role: StaffMemberRole
+    avatar_url: str | None = None
+    rating_count: int = 0
+    rating_average: float | None = None
+    created_at: datetime
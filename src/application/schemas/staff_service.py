@@ -0,0 +1,17 @@
+from datetime import datetime
+from uuid import UUID
+
+from src.application.schemas.base import DomainOutputSchema
+
+
+class StaffServiceOutputSchema(DomainOutputSchema):
+    """Schema for staff service output data."""
+
+    id: UUID
+    staff_id: UUID
+    name: str
+    description: str | None = None
+    price: float
+    duration: int
+    is_active: bool
+    created_at: datetime
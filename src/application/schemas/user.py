@@ -3,6 +3,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, EmailStr
 
+from src.application.schemas.base import DomainOutputSchema
+
 
 class UserInputSchema(BaseModel):
     """Schema for user input data."""
@@ -13,7 +15,7 @@ class UserInputSchema(BaseModel):
     phone: str
     password: str
 
-class UserOutputSchema(BaseModel):
+class UserOutputSchema(DomainOutputSchema):
     """Schema for user output data."""
 
     id: UUID
@@ -21,6 +23,3 @@ class UserOutputSchema(BaseModel):
     last_name: str | None = None
     email: EmailStr
     phone: str
-
-    class Config:
-        from_attributes = True
@@ -0,0 +1,129 @@
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from uuid import UUID
+
+from src.application.interfaces.analytics_repository import AbstractAnalyticsRepository
+from src.application.interfaces.availability_repository import AbstractAvailabilityRepository
+from src.application.schemas.analytics import DailyStatsSchema, StaffUtilizationSchema
+from src.domain.enums import AppointmentStatus, WeekDay
+from src.domain.exceptions import ObjectValidationError
+
+MAX_RANGE_DAYS = 366
+
+STATUS_FIELDS = {
+    AppointmentStatus.SCHEDULED: "scheduled",
+    AppointmentStatus.COMPLETED: "completed",
+    AppointmentStatus.CANCELED: "canceled",
+}
+
+
+def _validate_range(date_from: date, date_to: date) -> None:
+    if date_to < date_from:
+        raise ObjectValidationError("date_to must not be earlier than date_from.")
+    if (date_to - date_from).days >= MAX_RANGE_DAYS:
+        raise ObjectValidationError(f"Date range must not exceed {MAX_RANGE_DAYS} days.")
+
+
+def _weekday_counts(date_from: date, date_to: date) -> Counter[WeekDay]:
+    """How often each weekday occurs between two days, both inclusive."""
+    days = (date_to - date_from).days + 1
+    full_weeks, remainder = divmod(days, 7)
+    counts = Counter({weekday: full_weeks for weekday in WeekDay})
+    for offset in range(remainder):
+        counts[WeekDay((date_from.weekday() + offset) % 7)] += 1
+    return counts
+
+
+class AnalyticsService:
+    """Service for company dashboards.
+    
+    Booking figures come only from the daily rollups, never from the
+    appointments table, so latency depends on the length of the range and
+    not on the size of the company's history.
+    """
+
+    def __init__(
+        self,
+        analytics_repository: AbstractAnalyticsRepository,
+        availability_repository: AbstractAvailabilityRepository,
+    ):
+        self.analytics_repository: AbstractAnalyticsRepository = analytics_repository
+        self.availability_repository: AbstractAvailabilityRepository = availability_repository
+
+    async def get_daily_stats(self, company_id: UUID, date_from: date, date_to: date) -> list[DailyStatsSchema]:
+        """Get booking counts per status and revenue for every day of a range.
+        
+        Args:
+            company_id: Company identifier
+            date_from: First day of the range
+            date_to: Last day of the range, inclusive
+            
+        Returns:
+            One entry per day, including days without appointments. Revenue
+            and booked minutes leave canceled appointments out.
+            
+        Raises:
+            ObjectValidationError: If the range is inverted or too long
+        """
+        _validate_range(date_from, date_to)
+        totals = await self.analytics_repository.get_daily_totals(
+            company_id=company_id, date_from=date_from, date_to=date_to
+        )
+
+        days = {
+            date_from + timedelta(days=offset): DailyStatsSchema(day=date_from + timedelta(days=offset))
+            for offset in range((date_to - date_from).days + 1)
+        }
+        for total in totals:
+            stats = days[total.day]
+            setattr(stats, STATUS_FIELDS[total.status], total.booking_count)
+            if total.status != AppointmentStatus.CANCELED:
+                stats.revenue += total.revenue
+                stats.booked_minutes += total.booked_minutes
+        return list(days.values())
+
+    async def get_staff_utilization(
+        self, company_id: UUID, date_from: date, date_to: date
+    ) -> list[StaffUtilizationSchema]:
+        """Get the share of every staff member's working time booked within a range.
+        
+        Args:
+            company_id: Company identifier
+            date_from: First day of the range
+            date_to: Last day of the range, inclusive
+            
+        Returns:
+            One entry per staff member; utilization is None without working hours
+            
+        Raises:
+            ObjectValidationError: If the range is inverted or too long
+        """
+        _validate_range(date_from, date_to)
+        booked = await self.analytics_repository.get_staff_booked_totals(
+            company_id=company_id, date_from=date_from, date_to=date_to
+        )
+        if not booked:
+            return []
+
+        working_hours = await self.availability_repository.get_working_hours(
+            staff_ids=[total.staff_id for total in booked]
+        )
+        weekday_counts = _weekday_counts(date_from, date_to)
+        available: dict[UUID, int] = defaultdict(int)
+        for hours in working_hours:
+            if hours.start_time < hours.end_time:
+                shift = datetime.combine(date_from, hours.end_time) - datetime.combine(date_from, hours.start_time)
+                available[hours.staff_id] += int(shift.total_seconds()) // 60 * weekday_counts[hours.day_of_week]
+
+        return [
+            StaffUtilizationSchema(
+                staff_id=total.staff_id,
+                booking_count=total.booking_count,
+                booked_minutes=total.booked_minutes,
+                available_minutes=available[total.staff_id],
+                utilization=(
+                    round(total.booked_minutes / available[total.staff_id], 4) if available[total.staff_id] else None
+                ),
+            )
+            for total in booked
+        ]
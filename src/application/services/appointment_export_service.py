@@ -0,0 +1,49 @@
+from datetime import date, datetime, time, timedelta
+from typing import AsyncIterator
+from uuid import UUID
+
+from src.application.interfaces.appointment_repository import AbstractAppointmentRepository
+from src.application.schemas.appointment_export import AppointmentExportRow
+from src.domain.exceptions import ObjectValidationError
+
+# Longest exportable range; an export holds a database connection for as long as it streams
+MAX_EXPORT_DAYS = 366
+
+
+class AppointmentExportService:
+    """Service for exporting a company's appointment history.
+    
+    Exports are streamed end to end: rows come from a server-side cursor and
+    are handed on one at a time, nothing is collected in memory.
+    """
+
+    def __init__(self, appointment_repository: AbstractAppointmentRepository):
+        self.appointment_repository: AbstractAppointmentRepository = appointment_repository
+
+    def export_appointments(self, company_id: UUID, date_from: date, date_to: date) -> AsyncIterator[AppointmentExportRow]:
+        """Stream the appointments of a company starting within a date range.
+        
+        Validation happens on call, before anything is streamed, so errors can
+        still be reported with a proper status code.
+        
+        Args:
+            company_id: Company whose appointments are exported
+            date_from: First day of the range
+            date_to: Last day of the range, inclusive
+            
+        Returns:
+            Async iterator of export rows ordered by appointment start
+            
+        Raises:
+            ObjectValidationError: If date_to is earlier than date_from or the range exceeds MAX_EXPORT_DAYS
+        """
+        if date_to < date_from:
+            raise ObjectValidationError("date_to must not be earlier than date_from.")
+        if (date_to - date_from).days >= MAX_EXPORT_DAYS:
+            raise ObjectValidationError(f"The export range must not exceed {MAX_EXPORT_DAYS} days.")
+
+        return self.appointment_repository.stream_export_rows(
+            company_id=company_id,
+            start_from=datetime.combine(date_from, time.min),
+            start_to=datetime.combine(date_to + timedelta(days=1), time.min),
+        )
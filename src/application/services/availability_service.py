@@ -0,0 +1,187 @@
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from uuid import UUID
+
+from src.application.interfaces.availability_repository import AbstractAvailabilityRepository
+from src.application.schemas.availability import StaffAvailabilitySchema, TimeSlotSchema
+from src.application.services.booking_service import booking_window
+from src.domain.entities import DomainWorkingHours
+from src.domain.enums import WeekDay
+from src.domain.exceptions import BusinessRuleViolation, ObjectNotFound, ObjectValidationError
+
+Interval = tuple[datetime, datetime]
+
+MAX_SEARCH_DAYS = 92
+
+
+def _working_windows(
+    hours: dict[WeekDay, DomainWorkingHours], range_start: datetime, range_end: datetime
+) -> list[Interval]:
+    """Expand weekly working hours into concrete windows inside a range, in order."""
+    windows = []
+    day = range_start.date()
+    while datetime.combine(day, time.min) < range_end:
+        day_hours = hours.get(WeekDay(day.weekday()))
+        if day_hours is not None and day_hours.start_time < day_hours.end_time:
+            start = max(datetime.combine(day, day_hours.start_time), range_start)
+            end = min(datetime.combine(day, day_hours.end_time), range_end)
+            if start < end:
+                windows.append((start, end))
+        day += timedelta(days=1)
+    return windows
+
+
+def _subtract_intervals(windows: list[Interval], busy: list[Interval]) -> list[Interval]:
+    """Subtract busy intervals from working windows with a single sorted sweep.
+    
+    Both lists must be sorted by start. Busy intervals may overlap each other
+    and span several windows; the cost is linear in windows + busy intervals.
+    """
+    free = []
+    first = 0
+    for window_start, window_end in windows:
+        cursor = window_start
+        while first < len(busy) and busy[first][1] <= cursor:
+            first += 1
+
+        current = first
+        while current < len(busy) and busy[current][0] < window_end:
+            busy_start, busy_end = busy[current]
+            if busy_start > cursor:
+                free.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+            current += 1
+
+        if cursor < window_end:
+            free.append((cursor, window_end))
+    return free
+
+
+def _split_into_slots(free: list[Interval], duration: timedelta, step: timedelta) -> list[Interval]:
+    """Cut free intervals into slots of ``duration`` starting every ``step``."""
+    slots = []
+    for free_start, free_end in free:
+        slot_start = free_start
+        while slot_start + duration <= free_end:
+            slots.append((slot_start, slot_start + duration))
+            slot_start += step
+    return slots
+
+
+class AvailabilityService:
+    """Service computing bookable slots from working hours and appointments.
+    
+    Data is loaded with one query for working hours and one for appointments,
+    regardless of how many staff members or days are searched; the rest is
+    in-memory interval arithmetic. Only slots ``BookingService`` would accept
+    are offered: none starting in the past or beyond the booking horizon.
+    """
+
+    def __init__(self, availability_repository: AbstractAvailabilityRepository, max_months_ahead: int = 12):
+        """Initialize availability service.
+
+        Args:
+            availability_repository: Repository of working hours and appointments
+            max_months_ahead: Booking horizon, as in BookingService
+        """
+        self.max_months_ahead = max_months_ahead
+        self.availability_repository: AbstractAvailabilityRepository = availability_repository
+
+    async def get_service_availability(
+        self, service_id: UUID, date_from: date, date_to: date, step_minutes: int | None = None
+    ) -> StaffAvailabilitySchema:
+        """Find free slots for a staff service over an inclusive date range.
+        
+        Args:
+            service_id: Staff service to book
+            date_from: First day of the search
+            date_to: Last day of the search
+            step_minutes: Distance between slot starts, defaults to the service duration
+            
+        Returns:
+            Free slots of the staff member offering the service
+            
+        Raises:
+            ObjectNotFound: If the service does not exist
+            BusinessRuleViolation: If the service is not active
+            ObjectValidationError: If the date range is invalid
+        """
+        service = await self.availability_repository.get_staff_service(service_id=service_id)
+        if service is None:
+            raise ObjectNotFound(f"Service with id {service_id} not found.")
+        if not service.is_active:
+            raise BusinessRuleViolation(f"Service with id {service_id} is not active.")
+
+        slots = await self.find_free_slots(
+            staff_ids=[service.staff_id],
+            duration_minutes=service.duration,
+            date_from=date_from,
+            date_to=date_to,
+            step_minutes=step_minutes,
+        )
+        return StaffAvailabilitySchema(
+            staff_id=service.staff_id,
+            service_id=service.id,
+            duration=service.duration,
+            slots=[TimeSlotSchema.model_construct(start=start, end=end) for start, end in slots[service.staff_id]],
+        )
+
+    async def find_free_slots(
+        self,
+        staff_ids: list[UUID],
+        duration_minutes: int,
+        date_from: date,
+        date_to: date,
+        step_minutes: int | None = None,
+    ) -> dict[UUID, list[Interval]]:
+        """Find free slots of a given duration for many staff members at once.
+        
+        Args:
+            staff_ids: Staff members to search
+            duration_minutes: Slot length in minutes
+            date_from: First day of the search
+            date_to: Last day of the search
+            step_minutes: Distance between slot starts, defaults to the duration
+            
+        Returns:
+            Mapping of staff_id to its free (start, end) slots in order
+            
+        Raises:
+            ObjectValidationError: If the date range or durations are invalid
+        """
+        if date_to < date_from:
+            raise ObjectValidationError("date_to must not be earlier than date_from.")
+        if (date_to - date_from).days + 1 > MAX_SEARCH_DAYS:
+            raise ObjectValidationError(f"Availability can be searched for at most {MAX_SEARCH_DAYS} days.")
+        if duration_minutes <= 0 or (step_minutes is not None and step_minutes <= 0):
+            raise ObjectValidationError("Duration and step must be positive.")
+
+        earliest, horizon = booking_window(self.max_months_ahead)
+        range_start = max(datetime.combine(date_from, time.min), datetime.combine(earliest.date(), time.min))
+        range_end = min(datetime.combine(date_to + timedelta(days=1), time.min), horizon)
+        if range_start >= range_end:
+            return {staff_id: [] for staff_id in staff_ids}
+
+        working_hours = await self.availability_repository.get_working_hours(staff_ids=staff_ids)
+        busy_rows = await self.availability_repository.get_busy_intervals(
+            staff_ids=staff_ids, range_start=range_start, range_end=range_end
+        )
+
+        hours_by_staff: dict[UUID, dict[WeekDay, DomainWorkingHours]] = defaultdict(dict)
+        for hours in working_hours:
+            hours_by_staff[hours.staff_id][hours.day_of_week] = hours
+
+        busy_by_staff: dict[UUID, list[Interval]] = defaultdict(list)
+        for staff_id, busy_start, busy_end in busy_rows:
+            busy_by_staff[staff_id].append((busy_start, busy_end))
+
+        duration = timedelta(minutes=duration_minutes)
+        step = timedelta(minutes=step_minutes or duration_minutes)
+
+        slots = {}
+        for staff_id in staff_ids:
+            windows = _working_windows(hours_by_staff.get(staff_id, {}), range_start, range_end)
+            free = _subtract_intervals(windows, busy_by_staff.get(staff_id, []))
+            # Slots keep their grid from the window start; only those already started today are dropped
+            slots[staff_id] = [slot for slot in _split_into_slots(free, duration, step) if slot[0] >= earliest]
+        return slots
@@ -0,0 +1,141 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from src.application.interfaces.appointment_repository import AbstractAppointmentRepository
+from src.application.interfaces.availability_repository import AbstractAvailabilityRepository
+from src.application.interfaces.staff_repository import AbstractStaffRepository
+from src.application.schemas.appointment import AppointmentInputSchema, AppointmentOutputSchema
+from src.application.schemas.pagination import PageSchema
+from src.domain.entities import DomainAppointment
+from src.domain.enums import WeekDay
+from src.domain.exceptions import BusinessRuleViolation, ObjectNotFound
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    """Normalize a datetime to the naive UTC form stored in the database."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _month_start(value: datetime, months_later: int = 0) -> datetime:
+    index = value.year * 12 + value.month - 1 + months_later
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def booking_window(max_months_ahead: int) -> tuple[datetime, datetime]:
+    """Current time and the start of the first month appointments can't be booked in, naive UTC.
+
+    Appointments are bookable when they start within [earliest, horizon).
+    """
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return now, _month_start(now, max_months_ahead)
+
+
+class BookingService:
+    """Service for booking appointments.
+    
+    Overlapping bookings are rejected by the database exclusion constraint,
+    so concurrent bookings for the same staff member need no app-level locking;
+    the repository reports the loser as AppointmentConflict. Appointments are
+    stored in monthly partitions created ``max_months_ahead`` months in
+    advance, which bounds how far ahead they can be booked.
+    """
+
+    def __init__(
+        self,
+        appointment_repository: AbstractAppointmentRepository,
+        availability_repository: AbstractAvailabilityRepository,
+        staff_repository: AbstractStaffRepository,
+        max_months_ahead: int = 12,
+    ):
+        """Initialize booking service.
+        
+        Args:
+            appointment_repository: Repository storing the appointments
+            availability_repository: Repository of services and working hours
+            staff_repository: Repository of staff members
+            max_months_ahead: Appointments must start before the month this many months after the current one
+        """
+        self.max_months_ahead = max_months_ahead
+        self.appointment_repository: AbstractAppointmentRepository = appointment_repository
+        self.availability_repository: AbstractAvailabilityRepository = availability_repository
+        self.staff_repository: AbstractStaffRepository = staff_repository
+
+    async def book_appointment(self, booking_input: AppointmentInputSchema) -> AppointmentOutputSchema:
+        """Book an appointment for a staff service.
+        
+        Args:
+            booking_input: Booking data from the presentation layer
+            
+        Returns:
+            Appointment output schema with the booked appointment
+            
+        Raises:
+            ObjectNotFound: If the service does not exist
+            BusinessRuleViolation: If the service is inactive or the time is not bookable
+            AppointmentConflict: If the staff member is already booked at this time
+        """
+        service = await self.availability_repository.get_staff_service(service_id=booking_input.service_id)
+        if service is None:
+            raise ObjectNotFound(f"Service with id {booking_input.service_id} not found.")
+        if not service.is_active:
+            raise BusinessRuleViolation(f"Service with id {service.id} is not active.")
+
+        appointment_start = _to_naive_utc(booking_input.appointment_start)
+        appointment_end = appointment_start + timedelta(minutes=service.duration)
+        earliest, horizon = booking_window(self.max_months_ahead)
+        if appointment_start < earliest:
+            raise BusinessRuleViolation("Cannot book appointment in the past.")
+        if appointment_start >= horizon:
+            raise BusinessRuleViolation(f"Appointments can be booked at most {self.max_months_ahead} months ahead.")
+
+        working_hours = await self.availability_repository.get_working_hours(staff_ids=[service.staff_id])
+        day_hours = next(
+            (hours for hours in working_hours if hours.day_of_week == WeekDay(appointment_start.weekday())), None
+        )
+        if (
+            day_hours is None
+            or appointment_start.time() < day_hours.start_time
+            or appointment_end.date() != appointment_start.date()
+            or appointment_end.time() > day_hours.end_time
+        ):
+            raise BusinessRuleViolation("Appointment is outside of the staff member's working hours.")
+
+        staff = await self.staff_repository.get_staff(staff_id=service.staff_id)
+        if staff is None:
+            raise ObjectNotFound(f"Staff member with id {service.staff_id} not found.")
+
+        appointment = DomainAppointment.create(
+            company_id=staff.company_id,
+            staff_id=service.staff_id,
+            user_id=booking_input.user_id,
+            service_id=service.id,
+            appointment_start=appointment_start,
+            appointment_end=appointment_end,
+            price=service.price,
+        )
+        created_appointment = await self.appointment_repository.create_appointment(appointment)
+
+        return AppointmentOutputSchema.from_domain(created_appointment)
+
+    async def list_appointments(
+        self, limit: int, cursor: str | None = None, company_id: UUID | None = None
+    ) -> PageSchema[AppointmentOutputSchema]:
+        """List appointments newest first.
+        
+        Args:
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            company_id: Only list appointments of this company
+            
+        Returns:
+            Page of appointments with the cursor of the next page
+        """
+        appointments, next_cursor = await self.appointment_repository.list_appointments(
+            limit=limit, cursor=cursor, company_id=company_id
+        )
+        return PageSchema[AppointmentOutputSchema](
+            items=[AppointmentOutputSchema.from_domain(appointment) for appointment in appointments],
+            next_cursor=next_cursor,
+        )
@@ -0,0 +1,136 @@
+import asyncio
+from typing import AsyncIterable
+
+from pydantic import BaseModel, ValidationError
+
+from src.application.interfaces.auth_security import AbstractAuthSecurity
+from src.application.interfaces.bulk_import_repository import AbstractBulkImportRepository
+from src.application.schemas.bulk_import import (
+    AppointmentImportSchema,
+    ImportEntity,
+    ImportRecord,
+    ImportReportSchema,
+    ImportRowErrorSchema,
+    StaffImportSchema,
+    StaffServiceImportSchema,
+    UserImportSchema,
+)
+from src.domain.exceptions import ServiceOverloaded
+
+_SCHEMAS: dict[ImportEntity, type[BaseModel]] = {
+    ImportEntity.USERS: UserImportSchema,
+    ImportEntity.STAFF: StaffImportSchema,
+    ImportEntity.SERVICES: StaffServiceImportSchema,
+    ImportEntity.APPOINTMENTS: AppointmentImportSchema,
+}
+
+# Keep the report bounded for files where every row is broken
+MAX_REPORTED_ERRORS = 1000
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc']) or 'row'}: {item['msg']}" for item in error.errors()
+    )
+
+
+class BulkImportService:
+    """Service for streaming bulk imports.
+    
+    Records are validated and written in chunks of ``chunk_size`` rows, each
+    chunk in a single multi-row insert. Bad rows are reported in the result
+    instead of aborting the import.
+    """
+
+    def __init__(
+        self,
+        bulk_import_repository: AbstractBulkImportRepository,
+        auth_security: AbstractAuthSecurity,
+        chunk_size: int = 1000,
+        hash_concurrency: int = 4,
+    ):
+        self.bulk_import_repository: AbstractBulkImportRepository = bulk_import_repository
+        self.auth_security: AbstractAuthSecurity = auth_security
+        self.chunk_size = chunk_size
+        self.hash_concurrency = hash_concurrency
+
+    async def import_records(
+        self, entity: ImportEntity, records: AsyncIterable[ImportRecord]
+    ) -> ImportReportSchema:
+        """Import a stream of records.
+        
+        Args:
+            entity: Entity the records describe
+            records: Parsed records from an import file
+            
+        Returns:
+            Import report with counts and per-row errors
+        """
+        report = ImportReportSchema(entity=entity)
+        chunk: list[ImportRecord] = []
+
+        async for record in records:
+            report.total += 1
+            if record.error is not None:
+                self._add_error(report, record.row_number, record.error)
+                continue
+            chunk.append(record)
+            if len(chunk) >= self.chunk_size:
+                await self._import_chunk(entity, chunk, report)
+                chunk = []
+
+        if chunk:
+            await self._import_chunk(entity, chunk, report)
+        return report
+
+    async def _import_chunk(self, entity: ImportEntity, chunk: list[ImportRecord], report: ImportReportSchema) -> None:
+        schema = _SCHEMAS[entity]
+        valid: list[tuple[int, BaseModel]] = []
+        for record in chunk:
+            try:
+                valid.append((record.row_number, schema.model_validate(record.data)))
+            except ValidationError as e:
+                self._add_error(report, record.row_number, _validation_message(e))
+
+        if entity == ImportEntity.USERS:
+            valid = await self._hash_passwords(valid, report)
+
+        if not valid:
+            return
+
+        rows = [item.model_dump() for _, item in valid]
+        results = await self.bulk_import_repository.insert_rows(entity=entity, rows=rows)
+        for (row_number, _), error in zip(valid, results):
+            if error is None:
+                report.imported += 1
+            else:
+                self._add_error(report, row_number, error)
+
+    async def _hash_passwords(
+        self, users: list[tuple[int, UserImportSchema]], report: ImportReportSchema
+    ) -> list[tuple[int, UserImportSchema]]:
+        """Hash plain passwords of a chunk in parallel, bounded by ``hash_concurrency``."""
+        semaphore = asyncio.Semaphore(self.hash_concurrency)
+
+        async def hash_one(user: UserImportSchema) -> None:
+            if user.password_hash:
+                return
+            async with semaphore:
+                user.password_hash = await self.auth_security.hash_password_async(user.password)
+
+        results = await asyncio.gather(*(hash_one(user) for _, user in users), return_exceptions=True)
+
+        hashed = []
+        for (row_number, user), result in zip(users, results):
+            if isinstance(result, ServiceOverloaded):
+                self._add_error(report, row_number, "Password hashing is overloaded, retry the row later")
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                hashed.append((row_number, user))
+        return hashed
+
+    def _add_error(self, report: ImportReportSchema, row_number: int, message: str) -> None:
+        report.failed += 1
+        if len(report.errors) < MAX_REPORTED_ERRORS:
+            report.errors.append(ImportRowErrorSchema(row=row_number, message=message))
@@ -0,0 +1,92 @@
+from uuid import UUID
+
+from src.application.interfaces.company_repository import AbstractCompanyRepository
+from src.application.interfaces.staff_repository import AbstractStaffRepository
+from src.application.interfaces.staff_service_repository import AbstractStaffServiceRepository
+from src.application.schemas.company import CompanyOutputSchema
+from src.application.schemas.pagination import PageSchema
+from src.application.schemas.staff import StaffOutputSchema
+from src.application.schemas.staff_service import StaffServiceOutputSchema
+from src.domain.exceptions import ObjectNotFound
+
+
+class CatalogService:
+    """Service for reading the booking catalog: companies, staff and their services."""
+
+    def __init__(
+        self,
+        company_repository: AbstractCompanyRepository,
+        staff_repository: AbstractStaffRepository,
+        staff_service_repository: AbstractStaffServiceRepository,
+    ):
+        self.company_repository: AbstractCompanyRepository = company_repository
+        self.staff_repository: AbstractStaffRepository = staff_repository
+        self.staff_service_repository: AbstractStaffServiceRepository = staff_service_repository
+
+    async def get_company(self, company_id: UUID) -> CompanyOutputSchema:
+        """Get a company by id.
+        
+        Raises:
+            ObjectNotFound: If the company does not exist
+        """
+        company = await self.company_repository.get_company(company_id=company_id)
+        if company is None:
+            raise ObjectNotFound(f"Company with id {company_id} not found.")
+        return CompanyOutputSchema.from_domain(company)
+
+    async def get_staff(self, staff_id: UUID) -> StaffOutputSchema:
+        """Get a staff member by id.
+        
+        Raises:
+            ObjectNotFound: If the staff member does not exist
+        """
+        staff = await self.staff_repository.get_staff(staff_id=staff_id)
+        if staff is None:
+            raise ObjectNotFound(f"Staff member with id {staff_id} not found.")
+        return StaffOutputSchema.from_domain(staff)
+
+    async def get_service(self, service_id: UUID) -> StaffServiceOutputSchema:
+        """Get a staff service by id.
+        
+        Raises:
+            ObjectNotFound: If the service does not exist
+        """
+        service = await self.staff_service_repository.get_service(service_id=service_id)
+        if service is None:
+            raise ObjectNotFound(f"Service with id {service_id} not found.")
+        return StaffServiceOutputSchema.from_domain(service)
+
+    async def list_companies(self, limit: int, cursor: str | None = None) -> PageSchema[CompanyOutputSchema]:
+        """List companies newest first."""
+        companies, next_cursor = await self.company_repository.list_companies(limit=limit, cursor=cursor)
+        return PageSchema[CompanyOutputSchema](
+            items=[CompanyOutputSchema.from_domain(company) for company in companies],
+            next_cursor=next_cursor,
+        )
+
+    async def list_staff(
+        self, limit: int, cursor: str | None = None, company_id: UUID | None = None
+    ) -> PageSchema[StaffOutputSchema]:
+        """List staff members newest first, optionally of one company."""
+        staff, next_cursor = await self.staff_repository.list_staff(limit=limit, cursor=cursor, company_id=company_id)
+        return PageSchema[StaffOutputSchema](
+            items=[StaffOutputSchema.from_domain(member) for member in staff],
+            next_cursor=next_cursor,
+        )
+
+    async def list_top_rated_staff(self, company_id: UUID, limit: int) -> list[StaffOutputSchema]:
+        """List a company's staff members best rated first."""
+        staff = await self.staff_repository.list_top_rated_staff(company_id=company_id, limit=limit)
+        return [StaffOutputSchema.from_domain(member) for member in staff]
+
+    async def list_services(
+        self, limit: int, cursor: str | None = None, staff_id: UUID | None = None
+    ) -> PageSchema[StaffServiceOutputSchema]:
+        """List staff services newest first, optionally of one staff member."""
+        services, next_cursor = await self.staff_service_repository.list_services(
+            limit=limit, cursor=cursor, staff_id=staff_id
+        )
+        return PageSchema[StaffServiceOutputSchema](
+            items=[StaffServiceOutputSchema.from_domain(service) for service in services],
+            next_cursor=next_cursor,
+        )
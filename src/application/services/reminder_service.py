@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from src.application.interfaces.reminder_repository import AbstractReminderRepository
+from src.application.interfaces.reminder_sender import AbstractReminderSender
+from src.application.interfaces.unit_of_work import AbstractUnitOfWork
+from src.application.schemas.reminder import AppointmentReminder, ReminderBatchResult
+
+logger = logging.getLogger(__name__)
+
+
+class ReminderService:
+    """Service sending reminders for upcoming appointments, one claimed batch at a time.
+    
+    The claim and the marking run in two short units of work, and the
+    reminders are sent in between, so no connection, transaction or lock is
+    held while waiting on the delivery channel. A claimed reminder is leased
+    until its next attempt time: other workers leave it alone meanwhile, and
+    if the send fails or the worker dies, it is claimed again after the
+    backoff, up to ``max_attempts`` times.
+    """
+
+    def __init__(
+        self,
+        reminder_repository: AbstractReminderRepository,
+        sender: AbstractReminderSender,
+        unit_of_work_factory: Callable[[], AbstractUnitOfWork],
+        lead_time: timedelta = timedelta(hours=24),
+        batch_size: int = 200,
+        send_concurrency: int = 20,
+        send_timeout_seconds: float = 10,
+        retry_delay: timedelta = timedelta(minutes=5),
+        max_attempts: int = 5,
+    ):
+        """Initialize reminder service.
+        
+        Args:
+            reminder_repository: Repository claiming and marking reminders
+            sender: Channel the reminders are delivered through
+            unit_of_work_factory: Creates the unit of work a batch runs in
+            lead_time: How long before the appointment the reminder is due
+            batch_size: Maximum reminders claimed at once
+            send_concurrency: Maximum reminders being sent at once
+            send_timeout_seconds: A send taking longer counts as failed
+            retry_delay: Backoff after the first failed attempt, doubled after every further one
+            max_attempts: Attempts before a reminder is given up
+        """
+        self.reminder_repository: AbstractReminderRepository = reminder_repository
+        self.sender: AbstractReminderSender = sender
+        self.unit_of_work_factory = unit_of_work_factory
+        self.lead_time = lead_time
+        self.batch_size = batch_size
+        self.send_concurrency = send_concurrency
+        self.send_timeout_seconds = send_timeout_seconds
+        self.retry_delay = retry_delay
+        self.max_attempts = max_attempts
+
+    async def _send(self, reminder: AppointmentReminder, semaphore: asyncio.Semaphore) -> bool:
+        async with semaphore:
+            try:
+                await asyncio.wait_for(self.sender.send(reminder), timeout=self.send_timeout_seconds)
+                return True
+            except Exception:
+                logger.warning("Sending the reminder of appointment %s failed", reminder.appointment_id, exc_info=True)
+                return False
+
+    async def send_due_reminders(self) -> ReminderBatchResult:
+        """Claim one batch of due reminders, send them and mark the sent ones.
+        
+        Returns:
+            How many reminders were claimed, sent and failed
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        async with self.unit_of_work_factory():
+            reminders = await self.reminder_repository.claim_due_reminders(
+                now=now,
+                due_before=now + self.lead_time,
+                limit=self.batch_size,
+                retry_delay=self.retry_delay,
+                max_attempts=self.max_attempts,
+            )
+        if not reminders:
+            return ReminderBatchResult(claimed=0, sent=0, failed=0)
+
+        semaphore = asyncio.Semaphore(self.send_concurrency)
+        outcomes = await asyncio.gather(*(self._send(reminder, semaphore) for reminder in reminders))
+        sent_ids = [reminder.appointment_id for reminder, sent in zip(reminders, outcomes) if sent]
+        if sent_ids:
+            async with self.unit_of_work_factory():
+                await self.reminder_repository.mark_reminders_sent(
+                    appointment_ids=sent_ids, sent_at=datetime.now(timezone.utc).replace(tzinfo=None)
+                )
+        return ReminderBatchResult(claimed=len(reminders), sent=len(sent_ids), failed=len(reminders) - len(sent_ids))
@@ -0,0 +1,67 @@
+from src.application.interfaces.search_repository import AbstractSearchRepository
+from src.application.schemas.company import CompanyOutputSchema
+from src.application.schemas.pagination import PageSchema
+from src.application.schemas.search import CompanySearchResultSchema, ServiceSearchResultSchema
+from src.application.schemas.staff_service import StaffServiceOutputSchema
+from src.domain.exceptions import ObjectValidationError
+
+MIN_QUERY_LENGTH = 2
+
+
+def _normalize_query(query: str) -> str:
+    normalized = " ".join(query.split())
+    if len(normalized) < MIN_QUERY_LENGTH:
+        raise ObjectValidationError(f"Search query must have at least {MIN_QUERY_LENGTH} characters.")
+    return normalized
+
+
+class SearchService:
+    """Service for fuzzy search over companies and their services."""
+
+    def __init__(self, search_repository: AbstractSearchRepository):
+        self.search_repository: AbstractSearchRepository = search_repository
+
+    async def search_companies(
+        self, query: str, limit: int, cursor: str | None = None
+    ) -> PageSchema[CompanySearchResultSchema]:
+        """Search companies by name and address, best match first.
+        
+        Raises:
+            ObjectValidationError: If the query is too short
+        """
+        hits, next_cursor = await self.search_repository.search_companies(
+            query=_normalize_query(query), limit=limit, cursor=cursor
+        )
+        return PageSchema[CompanySearchResultSchema](
+            items=[
+                CompanySearchResultSchema(
+                    company=CompanyOutputSchema.from_domain(hit.company), score=round(hit.similarity, 4)
+                )
+                for hit in hits
+            ],
+            next_cursor=next_cursor,
+        )
+
+    async def search_services(
+        self, query: str, limit: int, cursor: str | None = None
+    ) -> PageSchema[ServiceSearchResultSchema]:
+        """Search active staff services by name and description, best match first.
+        
+        Raises:
+            ObjectValidationError: If the query is too short
+        """
+        hits, next_cursor = await self.search_repository.search_services(
+            query=_normalize_query(query), limit=limit, cursor=cursor
+        )
+        return PageSchema[ServiceSearchResultSchema](
+            items=[
+                ServiceSearchResultSchema(
+                    service=StaffServiceOutputSchema.from_domain(hit.service),
+                    company_id=hit.company_id,
+                    company_name=hit.company_name,
+                    score=round(hit.similarity, 4),
+                )
+                for hit in hits
+            ],
+            next_cursor=next_cursor,
+        )
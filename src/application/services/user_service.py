@@ -1,8 +1,10 @@
 from src.application.interfaces.auth_security import AbstractAuthSecurity
+from src.application.interfaces.rate_limiter import AbstractRateLimiter
 from src.application.interfaces.user_repository import AbstractUserRepository
+from src.application.schemas.pagination import PageSchema
 from src.application.schemas.user import UserInputSchema, UserOutputSchema
 from src.domain.entities.domainuser import DomainUser
-from src.domain.exceptions import ObjectAlreadyExists
+from src.domain.exceptions import ObjectAlreadyExists, RateLimited
 
 
 class UserService:
@@ -10,11 +12,28 @@ class UserService:
     
     This service belongs to the application layer and orchestrates
     domain entities and repository operations.
+
+    Signup runs without a unit of work: the email probe and the insert each
+    use a short session of their own, so no database connection is held
+    while the password waits for and goes through bcrypt.
     """
     
-    def __init__(self, user_repository: AbstractUserRepository, auth_security: AbstractAuthSecurity):
+    def __init__(
+        self,
+        user_repository: AbstractUserRepository,
+        auth_security: AbstractAuthSecurity,
+        email_rate_limiter: AbstractRateLimiter | None = None,
+    ):
         self.user_repository: AbstractUserRepository = user_repository
         self.auth_security: AbstractAuthSecurity = auth_security
+        self.email_rate_limiter: AbstractRateLimiter | None = email_rate_limiter
+
+    async def _check_email_rate(self, email: str) -> None:
+        if self.email_rate_limiter is None:
+            return
+        retry_after = await self.email_rate_limiter.hit(email.lower())
+        if retry_after:
+            raise RateLimited("Too many attempts for this email, try again later.", retry_after=retry_after)
 
     async def create_user(self, user_input: UserInputSchema) -> UserOutputSchema:
         """Create a new user.
@@ -27,14 +46,18 @@ class UserService:
             
         Raises:
             ObjectAlreadyExists: If user with this email already exists
+            RateLimited: If this email was used for too many attempts recently
+            ServiceOverloaded: If the password hashing pool is saturated
         """
-        # Check if user already exists
-        existing_user = await self.user_repository.get_user(email=user_input.email)
-        if existing_user:
+        # Before any database or hashing work is spent on it
+        await self._check_email_rate(user_input.email)
+
+        # Cheap indexed probe so an obviously taken email doesn't pay for bcrypt; it doesn't keep its connection
+        if await self.user_repository.email_exists(email=user_input.email):
             raise ObjectAlreadyExists(f"User with this email: {user_input.email} already exists.")
 
-        # Hash password
-        password_hash = self.auth_security.hash_password(user_input.password)
+        # Hash password in the worker pool so the event loop stays free
+        password_hash = await self.auth_security.hash_password_async(user_input.password)
 
         # Create domain entity using factory method
         user = DomainUser.create(
@@ -45,8 +68,24 @@ class UserService:
             last_name=user_input.last_name,
         )
 
-        # Save through repository (returns domain entity with timestamps)
-        created_user = await self.user_repository.create_user(user)
+        # Insert atomically; a concurrent signup that wins the race surfaces as ObjectAlreadyExists
+        created_user = await self.user_repository.register_user(user)
 
         # Convert domain entity to output schema
-        return UserOutputSchema.model_validate(created_user.to_dict())
+        return UserOutputSchema.from_domain(created_user)
+
+    async def list_users(self, limit: int, cursor: str | None = None) -> PageSchema[UserOutputSchema]:
+        """List users newest first.
+        
+        Args:
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            
+        Returns:
+            Page of users with the cursor of the next page
+        """
+        users, next_cursor = await self.user_repository.list_users(limit=limit, cursor=cursor)
+        return PageSchema[UserOutputSchema](
+            items=[UserOutputSchema.from_domain(user) for user in users],
+            next_cursor=next_cursor,
+        )
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -13,6 +14,8 @@ class TokenSettings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(..., alias="ACCESS_TOKEN_EXPIRE_MINUTES")
     REFRESH_TOKEN_EXPIRE_MINUTES: int = Field(..., alias="REFRESH_TOKEN_EXPIRE_MINUTES")
     TOKEN_TYPE: str = Field(..., alias="TOKEN_TYPE")
+    CACHE_MAX_SIZE: int = Field(default=10_000, alias="TOKEN_CACHE_MAX_SIZE")
+    CACHE_MAX_TTL_SECONDS: int = Field(default=900, alias="TOKEN_CACHE_MAX_TTL_SECONDS")
 
     model_config = SettingsConfigDict(env_file=BASE_DIR / ".env", env_prefix="JWT_", extra="ignore")
 
@@ -26,6 +29,27 @@ class DatabaseSettings(BaseSettings):
     POSTGRES_PORT: int = Field(default=5432, alias="POSTGRES_PORT")
     POSTGRES_DB: str = Field(..., alias="POSTGRES_DB")
 
+    # Connection pool; set POSTGRES_POOL_ENABLED=false to fall back to NullPool
+    POSTGRES_POOL_ENABLED: bool = Field(default=True, alias="POSTGRES_POOL_ENABLED")
+    POSTGRES_POOL_SIZE: int = Field(default=10, alias="POSTGRES_POOL_SIZE")
+    POSTGRES_POOL_MAX_OVERFLOW: int = Field(default=10, alias="POSTGRES_POOL_MAX_OVERFLOW")
+    POSTGRES_POOL_RECYCLE_SECONDS: int = Field(default=1800, alias="POSTGRES_POOL_RECYCLE_SECONDS")
+    POSTGRES_POOL_PRE_PING: bool = Field(default=True, alias="POSTGRES_POOL_PRE_PING")
+    POSTGRES_POOL_TIMEOUT_SECONDS: float = Field(default=5.0, alias="POSTGRES_POOL_TIMEOUT_SECONDS")
+    # Connections opened and prepared per engine at worker startup, capped at the pool size
+    POSTGRES_POOL_WARMUP_CONNECTIONS: int = Field(default=4, alias="POSTGRES_POOL_WARMUP_CONNECTIONS")
+
+    # Streaming replicas for read-only sessions, comma-separated "host" or "host:port"; empty disables routing
+    POSTGRES_REPLICA_HOSTS: str = Field(default="", alias="POSTGRES_REPLICA_HOSTS")
+    POSTGRES_REPLICA_MAX_LAG_SECONDS: float = Field(default=5.0, alias="POSTGRES_REPLICA_MAX_LAG_SECONDS")
+    POSTGRES_REPLICA_LAG_CHECK_SECONDS: float = Field(default=2.0, alias="POSTGRES_REPLICA_LAG_CHECK_SECONDS")
+    # A lag probe taking longer marks the replica unfit until the next check
+    POSTGRES_REPLICA_LAG_CHECK_TIMEOUT_SECONDS: float = Field(
+        default=1.0, alias="POSTGRES_REPLICA_LAG_CHECK_TIMEOUT_SECONDS"
+    )
+    # How long a client that wrote keeps reading from the primary
+    POSTGRES_READ_YOUR_WRITES_SECONDS: float = Field(default=10.0, alias="POSTGRES_READ_YOUR_WRITES_SECONDS")
+
     model_config = SettingsConfigDict(env_file=BASE_DIR / ".env", env_prefix="POSTGRES_", extra="ignore")
 
     @property
@@ -35,6 +59,138 @@ class DatabaseSettings(BaseSettings):
             f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
+    @property
+    def REPLICA_URLS(self) -> list[str]:
+        urls = []
+        for replica in filter(None, (part.strip() for part in self.POSTGRES_REPLICA_HOSTS.split(","))):
+            host, _, port = replica.partition(":")
+            urls.append(
+                f"{self.POSTGRES_DRIVER}://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
+                f"@{host}:{port or self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+            )
+        return urls
+
+
+class SecuritySettings(BaseSettings):
+    """Password hashing worker pool settings."""
+
+    HASHING_EXECUTOR: Literal["thread", "process"] = Field(default="thread", alias="HASHING_EXECUTOR")
+    HASHING_MAX_WORKERS: int = Field(default=4, alias="HASHING_MAX_WORKERS")
+    HASHING_MAX_QUEUE_DEPTH: int = Field(default=32, alias="HASHING_MAX_QUEUE_DEPTH")
+
+    model_config = SettingsConfigDict(env_file=BASE_DIR / ".env", extra="ignore")
+
+
+class CacheSettings(BaseSettings):
+    """Catalog read-through cache settings."""
+
+    CATALOG_CACHE_MAX_SIZE: int = Field(default=10_000, alias="CATALOG_CACHE_MAX_SIZE")
+    CATALOG_CACHE_TTL_SECONDS: float = Field(default=300, alias="CATALOG_CACHE_TTL_SECONDS")
+    # Liveness probe of the idle LISTEN connection that invalidates the cache
+    CATALOG_CACHE_LISTEN_KEEPALIVE_SECONDS: float = Field(default=30, alias="CATALOG_CACHE_LISTEN_KEEPALIVE_SECONDS")
+
+    model_config = SettingsConfigDict(env_file=BASE_DIR / ".env", extra="ignore")
+
+
+class SearchSettings(BaseSettings):
+    """Catalog search settings."""
+
+    # Minimum pg_trgm word similarity (0-1) of a result; lower finds more typos and fewer precise matches
+    SEARCH_WORD_SIMILARITY_THRESHOLD: float = Field(default=0.5, alias="SEARCH_WORD_SIMILARITY_THRESHOLD")
+    # Results end after this many pages; each page rescans the matches ranked before it
+    SEARCH_MAX_PAGES: int = Field(default=10, alias="SEARCH_MAX_PAGES")
+
+    model_config = SettingsConfigDict(env_file=BASE_DIR / ".env", extra="ignore")
+
+
+class RateLimitSettings(BaseSettings):
+    """Rate limits and admission control of credential endpoints (signup, login)."""
+
+    RATE_LIMIT_ENABLED: bool = Field(default=True, alias="RATE_LIMIT_ENABLED")
+    CREDENTIAL_IP_RATE_PER_MINUTE: float = Field(default=30, alias="CREDENTIAL_IP_RATE_PER_MINUTE")
+    CREDENTIAL_IP_BURST: int = Field(default=10, alias="CREDENTIAL_IP_BURST")
+    CREDENTIAL_EMAIL_RATE_PER_MINUTE: float = Field(default=5, alias="CREDENTIAL_EMAIL_RATE_PER_MINUTE")
+    CREDENTIAL_EMAIL_BURST: int = Field(default=3, alias="CREDENTIAL_EMAIL_BURST")
+    # Buckets kept per limiter and worker; the least recently used are dropped beyond this
+    RATE_LIMIT_MAX_KEYS: int = Field(default=100_000, alias="RATE_LIMIT_MAX_KEYS")
+    # Take the client address from X-Forwarded-For; only behind a proxy that sets it
+    RATE_LIMIT_TRUST_FORWARDED_FOR: bool = Field(default=False, alias="RATE_LIMIT_TRUST_FORWARDED_FOR")
+
+    model_config = SettingsConfigDict(env_file=BASE_DIR / ".env", extra="ignore")
+
+
+class IdempotencySettings(BaseSettings):
+    """Idempotency-Key handling of unsafe requests."""
+
+    IDEMPOTENCY_ENABLED: bool = Field(default=True, alias="IDEMPOTENCY_ENABLED")
+    # Share claims and responses between worker processes and hosts through Postgres; without it
+    # duplicates are only caught within one process, so the app refuses to start with several workers
+    IDEMPOTENCY_SHARED: bool = Field(default=True, alias="IDEMPOTENCY_SHARED")
+    IDEMPOTENCY_TTL_SECONDS: float = Field(default=86_400, alias="IDEMPOTENCY_TTL_SECONDS")
+    IDEMPOTENCY_MAX_ENTRIES: int = Field(default=10_000, alias="IDEMPOTENCY_MAX_ENTRIES")
+    # Larger requests with an Idempotency-Key are rejected, larger responses are not stored
+    IDEMPOTENCY_MAX_BODY_BYTES: int = Field(default=1_048_576, alias="IDEMPOTENCY_MAX_BODY_BYTES")
+    # How long a duplicate waits for the in-flight original before giving up with 409
+    IDEMPOTENCY_WAIT_SECONDS: float = Field(default=30, alias="IDEMPOTENCY_WAIT_SECONDS")
+
+    model_config = SettingsConfigDict(env_file=BASE_DIR / ".env", extra="ignore")
+
+
+class ReminderSettings(BaseSettings):
+    """Appointment reminder scheduler settings."""
+
+    # Run the scheduler inside every web worker; it can also run on its own (src.presentation.cli.send_reminders)
+    REMINDERS_ENABLED: bool = Field(default=False, alias="REMINDERS_ENABLED")
+    # Appointments starting within this many minutes get their reminder
+    REMINDER_LEAD_MINUTES: int = Field(default=1440, alias="REMINDER_LEAD_MINUTES")
+    REMINDER_BATCH_SIZE: int = Field(default=200, alias="REMINDER_BATCH_SIZE")
+    REMINDER_POLL_SECONDS: float = Field(default=30, alias="REMINDER_POLL_SECONDS")
+    REMINDER_SEND_CONCURRENCY: int = Field(default=20, alias="REMINDER_SEND_CONCURRENCY")
+    REMINDER_SEND_TIMEOUT_SECONDS: float = Field(default=10, alias="REMINDER_SEND_TIMEOUT_SECONDS")
+    # Delay before retrying a reminder, doubled after every attempt. It is also how long a claim is held, so keep
+    # it above the time a batch takes to send.
+    REMINDER_RETRY_SECONDS: float = Field(default=300, alias="REMINDER_RETRY_SECONDS")
+    REMINDER_MAX_ATTEMPTS: int = Field(default=5, alias="REMINDER_MAX_ATTEMPTS")
+
+    model_config = SettingsConfigDict(env_file=BASE_DIR / ".env", extra="ignore")
+
+
+class PartitionSettings(BaseSettings):
+    """Appointment partition maintenance settings (src.presentation.cli.maintain_appointment_partitions)."""
+
+    # Monthly partitions kept ready beyond the current month
+    APPOINTMENT_PARTITIONS_AHEAD_MONTHS: int = Field(default=12, alias="APPOINTMENT_PARTITIONS_AHEAD_MONTHS")
+    # Partitions older than this many full months are detached into the archive schema; 0 keeps everything
+    APPOINTMENT_RETENTION_MONTHS: int = Field(default=24, alias="APPOINTMENT_RETENTION_MONTHS")
+    # DDL gives up instead of queuing bookings behind it while waiting for its lock
+    APPOINTMENT_PARTITION_LOCK_TIMEOUT_SECONDS: float = Field(
+        default=5, alias="APPOINTMENT_PARTITION_LOCK_TIMEOUT_SECONDS"
+    )
+
+    model_config = SettingsConfigDict(env_file=BASE_DIR / ".env", extra="ignore")
+
+
+class ServerSettings(BaseSettings):
+    """Production server settings."""
+
+    # 0 sizes the worker count to the CPUs available to the process
+    WEB_WORKERS: int = Field(default=0, alias="WEB_WORKERS")
+    WEB_GRACEFUL_SHUTDOWN_SECONDS: int = Field(default=30, alias="WEB_GRACEFUL_SHUTDOWN_SECONDS")
+    WEB_KEEPALIVE_SECONDS: int = Field(default=5, alias="WEB_KEEPALIVE_SECONDS")
+    WEB_BACKLOG: int = Field(default=2048, alias="WEB_BACKLOG")
+
+    model_config = SettingsConfigDict(env_file=BASE_DIR / ".env", extra="ignore")
+
+
+class ObservabilitySettings(BaseSettings):
+    """Request instrumentation settings."""
+
+    METRICS_ENABLED: bool = Field(default=True, alias="METRICS_ENABLED")
+    SLOW_REQUEST_THRESHOLD_MS: float = Field(default=500, alias="SLOW_REQUEST_THRESHOLD_MS")
+    SLOW_REQUEST_MAX_STATEMENTS: int = Field(default=50, alias="SLOW_REQUEST_MAX_STATEMENTS")
+
+    model_config = SettingsConfigDict(env_file=BASE_DIR / ".env", extra="ignore")
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables and a .env file."""
@@ -45,8 +201,20 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    # Validate output schemas built from domain entities; they are trusted and copied as-is otherwise
+    VALIDATE_OUTPUT_SCHEMAS: bool = False
 
+    token: TokenSettings = TokenSettings()
     database: DatabaseSettings = DatabaseSettings()
+    security: SecuritySettings = SecuritySettings()
+    cache: CacheSettings = CacheSettings()
+    observability: ObservabilitySettings = ObservabilitySettings()
+    server: ServerSettings = ServerSettings()
+    reminders: ReminderSettings = ReminderSettings()
+    idempotency: IdempotencySettings = IdempotencySettings()
+    rate_limit: RateLimitSettings = RateLimitSettings()
+    partitions: PartitionSettings = PartitionSettings()
+    search: SearchSettings = SearchSettings()
 
     model_config = SettingsConfigDict(
         env_file=BASE_DIR / ".env",
@@ -1,6 +1,23 @@
-"""Domain entities."""
+"""Domain entities.
 
+Entities are slotted plain classes. Repositories select table columns in the
+order of the constructor arguments and build entities positionally from the
+rows, so keep constructor arguments named after the table columns.
+"""
+
+from src.domain.entities.domainappointment import DomainAppointment
+from src.domain.entities.domaincompany import DomainCompany
+from src.domain.entities.domainstaff import DomainStaff
+from src.domain.entities.domainstaffservice import DomainStaffService
 from src.domain.entities.domainuser import DomainUser
+from src.domain.entities.domainworkinghours import DomainWorkingHours
 
-__all__ = ["DomainUser"]
+__all__ = [
+    "DomainUser",
+    "DomainCompany",
+    "DomainStaff",
+    "DomainStaffService",
+    "DomainWorkingHours",
+    "DomainAppointment",
+]
 
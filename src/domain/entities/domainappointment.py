@@ -0,0 +1,125 @@
+"""Appointment domain entity."""
+
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from src.domain.enums import AppointmentStatus
+
+
+class DomainAppointment:
+    """Domain entity representing a booked appointment."""
+
+    __slots__ = (
+        "id",
+        "company_id",
+        "staff_id",
+        "user_id",
+        "service_id",
+        "appointment_start",
+        "appointment_end",
+        "status",
+        "price",
+        "created_at",
+        "updated_at",
+    )
+
+    def __init__(
+        self,
+        id: UUID,
+        company_id: UUID,
+        staff_id: UUID | None,
+        user_id: UUID | None,
+        service_id: UUID | None,
+        appointment_start: datetime,
+        appointment_end: datetime,
+        status: AppointmentStatus = AppointmentStatus.SCHEDULED,
+        price: float | None = None,
+        created_at: datetime | None = None,
+        updated_at: datetime | None = None,
+    ):
+        """Initialize Appointment entity.
+        
+        Args:
+            id: Unique identifier
+            company_id: Company the appointment belongs to
+            staff_id: Staff member performing the service
+            user_id: Customer who booked the appointment
+            service_id: Booked staff service
+            appointment_start: Start of the appointment
+            appointment_end: End of the appointment
+            status: Appointment status
+            price: Price of the service when it was booked
+            created_at: Creation timestamp
+            updated_at: Last update timestamp
+        """
+        self.id = id
+        self.company_id = company_id
+        self.staff_id = staff_id
+        self.user_id = user_id
+        self.service_id = service_id
+        self.appointment_start = appointment_start
+        self.appointment_end = appointment_end
+        self.status = status
+        self.price = price
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    @classmethod
+    def create(
+        cls,
+        company_id: UUID,
+        staff_id: UUID,
+        user_id: UUID,
+        service_id: UUID,
+        appointment_start: datetime,
+        appointment_end: datetime,
+        price: float | None = None,
+    ) -> "DomainAppointment":
+        """Factory method to create a new scheduled Appointment entity.
+        
+        Args:
+            company_id: Company the appointment belongs to
+            staff_id: Staff member performing the service
+            user_id: Customer who booked the appointment
+            service_id: Booked staff service
+            appointment_start: Start of the appointment
+            appointment_end: End of the appointment
+            price: Price of the service at booking time
+            
+        Returns:
+            New DomainAppointment instance with generated ID
+        """
+        return cls(
+            id=uuid4(),
+            company_id=company_id,
+            staff_id=staff_id,
+            user_id=user_id,
+            service_id=service_id,
+            appointment_start=appointment_start,
+            appointment_end=appointment_end,
+            price=price,
+        )
+
+    def __repr__(self) -> str:
+        return f"<Appointment(id={self.id}, start={self.appointment_start}, status='{self.status}')>"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DomainAppointment):
+            return False
+        return self.id == other.id
+
+    def to_dict(self) -> dict:
+        """Convert Appointment entity to dictionary."""
+        return {
+            "id": self.id,
+            "company_id": self.company_id,
+            "staff_id": self.staff_id,
+            "user_id": self.user_id,
+            "service_id": self.service_id,
+            "appointment_start": self.appointment_start,
+            "appointment_end": self.appointment_end,
+            "status": self.status,
+            "price": self.price,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
@@ -0,0 +1,72 @@
+"""Company domain entity."""
+
+from datetime import datetime
+from uuid import UUID
+
+
+class DomainCompany:
+    """Domain entity representing a company (salon) offering services."""
+
+    __slots__ = (
+        "id",
+        "company_name",
+        "company_address",
+        "company_email",
+        "company_phone",
+        "company_logo_url",
+        "created_at",
+        "updated_at",
+    )
+
+    def __init__(
+        self,
+        id: UUID,
+        company_name: str,
+        company_address: str,
+        company_email: str | None = None,
+        company_phone: str | None = None,
+        company_logo_url: str | None = None,
+        created_at: datetime | None = None,
+        updated_at: datetime | None = None,
+    ):
+        """Initialize Company entity.
+        
+        Args:
+            id: Unique identifier
+            company_name: Company name
+            company_address: Company address
+            company_email: Contact email (optional)
+            company_phone: Contact phone (optional)
+            company_logo_url: Logo URL (optional)
+            created_at: Creation timestamp
+            updated_at: Last update timestamp
+        """
+        self.id = id
+        self.company_name = company_name
+        self.company_address = company_address
+        self.company_email = company_email
+        self.company_phone = company_phone
+        self.company_logo_url = company_logo_url
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    def __repr__(self) -> str:
+        return f"<Company(id={self.id}, name='{self.company_name}')>"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DomainCompany):
+            return False
+        return self.id == other.id
+
+    def to_dict(self) -> dict:
+        """Convert Company entity to dictionary."""
+        return {
+            "id": self.id,
+            "company_name": self.company_name,
+            "company_address": self.company_address,
+            "company_email": self.company_email,
+            "company_phone": self.company_phone,
+            "company_logo_url": self.company_logo_url,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
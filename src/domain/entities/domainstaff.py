@@ -0,0 +1,79 @@
+"""Staff domain entity."""
+
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.enums import StaffMemberRole
+
+
+class DomainStaff:
+    """Domain entity representing a user's membership in a company's staff."""
+
+    __slots__ = (
+        "id",
+        "user_id",
+        "company_id",
+        "role",
+        "avatar_url",
+        "rating_count",
+        "rating_average",
+        "created_at",
+        "updated_at",
+    )
+
+    def __init__(
+        self,
+        id: UUID,
+        user_id: UUID,
+        company_id: UUID,
+        role: StaffMemberRole = StaffMemberRole.MEMBER,
+        avatar_url: str | None = None,
+        rating_count: int = 0,
+        rating_average: float | None = None,
+        created_at: datetime | None = None,
+        updated_at: datetime | None = None,
+    ):
+        """Initialize Staff entity.
+        
+        Args:
+            id: Unique identifier
+            user_id: User who is the staff member
+            company_id: Company the staff member works for
+            role: Role within the company
+            avatar_url: Avatar URL (optional)
+            rating_count: Number of reviews
+            rating_average: Average review rating, None without reviews
+            created_at: Creation timestamp
+            updated_at: Last update timestamp
+        """
+        self.id = id
+        self.user_id = user_id
+        self.company_id = company_id
+        self.role = role
+        self.avatar_url = avatar_url
+        self.rating_count = rating_count
+        self.rating_average = rating_average
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    def __repr__(self) -> str:
+        return f"<Staff(id={self.id}, user_id={self.user_id}, company_id={self.company_id}, role='{self.role}')>"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DomainStaff):
+            return False
+        return self.id == other.id
+
+    def to_dict(self) -> dict:
+        """Convert Staff entity to dictionary."""
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "company_id": self.company_id,
+            "role": self.role,
+            "avatar_url": self.avatar_url,
+            "rating_count": self.rating_count,
+            "rating_average": self.rating_average,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
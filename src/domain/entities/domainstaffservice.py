@@ -0,0 +1,77 @@
+"""Staff service domain entity."""
+
+from datetime import datetime
+from uuid import UUID
+
+
+class DomainStaffService:
+    """Domain entity representing a service offered by a staff member."""
+
+    __slots__ = (
+        "id",
+        "staff_id",
+        "name",
+        "price",
+        "duration",
+        "description",
+        "is_active",
+        "created_at",
+        "updated_at",
+    )
+
+    def __init__(
+        self,
+        id: UUID,
+        staff_id: UUID,
+        name: str,
+        price: float,
+        duration: int,
+        description: str | None = None,
+        is_active: bool = True,
+        created_at: datetime | None = None,
+        updated_at: datetime | None = None,
+    ):
+        """Initialize StaffService entity.
+        
+        Args:
+            id: Unique identifier
+            staff_id: Staff member offering the service
+            name: Service name
+            price: Service price
+            duration: Duration of the service in minutes
+            description: Service description (optional)
+            is_active: Whether the service can be booked
+            created_at: Creation timestamp
+            updated_at: Last update timestamp
+        """
+        self.id = id
+        self.staff_id = staff_id
+        self.name = name
+        self.price = price
+        self.duration = duration
+        self.description = description
+        self.is_active = is_active
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    def __repr__(self) -> str:
+        return f"<StaffService(id={self.id}, name='{self.name}', duration={self.duration})>"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DomainStaffService):
+            return False
+        return self.id == other.id
+
+    def to_dict(self) -> dict:
+        """Convert StaffService entity to dictionary."""
+        return {
+            "id": self.id,
+            "staff_id": self.staff_id,
+            "name": self.name,
+            "description": self.description,
+            "price": self.price,
+            "duration": self.duration,
+            "is_active": self.is_active,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
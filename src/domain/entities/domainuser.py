@@ -10,6 +10,17 @@ class DomainUser:
     This is a pure domain model without any infrastructure dependencies.
     It represents the business concept of a User in the system.
     """
+
+    __slots__ = (
+        "id",
+        "email",
+        "phone",
+        "password_hash",
+        "first_name",
+        "last_name",
+        "created_at",
+        "updated_at",
+    )
     
     def __init__(
         self,
@@ -0,0 +1,72 @@
+"""Working hours domain entity."""
+
+from datetime import datetime, time
+from uuid import UUID
+
+from src.domain.enums import WeekDay
+
+
+class DomainWorkingHours:
+    """Domain entity representing a staff member's working hours on one weekday."""
+
+    __slots__ = (
+        "id",
+        "staff_id",
+        "day_of_week",
+        "start_time",
+        "end_time",
+        "created_at",
+        "updated_at",
+    )
+
+    def __init__(
+        self,
+        id: UUID,
+        staff_id: UUID,
+        day_of_week: WeekDay,
+        start_time: time,
+        end_time: time,
+        created_at: datetime | None = None,
+        updated_at: datetime | None = None,
+    ):
+        """Initialize WorkingHours entity.
+        
+        Args:
+            id: Unique identifier
+            staff_id: Staff member the hours belong to
+            day_of_week: Weekday the hours apply to
+            start_time: Start of the working day
+            end_time: End of the working day
+            created_at: Creation timestamp
+            updated_at: Last update timestamp
+        """
+        self.id = id
+        self.staff_id = staff_id
+        self.day_of_week = day_of_week
+        self.start_time = start_time
+        self.end_time = end_time
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    def __repr__(self) -> str:
+        return (
+            f"<WorkingHours(staff_id={self.staff_id}, day_of_week={self.day_of_week}, "
+            f"start_time={self.start_time}, end_time={self.end_time})>"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DomainWorkingHours):
+            return False
+        return self.id == other.id
+
+    def to_dict(self) -> dict:
+        """Convert WorkingHours entity to dictionary."""
+        return {
+            "id": self.id,
+            "staff_id": self.staff_id,
+            "day_of_week": self.day_of_week,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
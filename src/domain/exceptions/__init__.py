@@ -7,10 +7,12 @@ Exceptions are organized by their purpose and can be imported from here.
 from src.domain.exceptions.auth import InvalidCredentials
 from src.domain.exceptions.base import DomainException
 from src.domain.exceptions.business import (
+    AppointmentConflict,
     BusinessRuleViolation,
     InsufficientPermissions,
     InvalidOperation,
 )
+from src.domain.exceptions.capacity import RateLimited, ServiceOverloaded
 from src.domain.exceptions.entity import (
     ObjectAlreadyExists,
     ObjectNotFound,
@@ -25,6 +27,9 @@ __all__ = [
     "BusinessRuleViolation",
     "InsufficientPermissions",
     "InvalidOperation",
+    "AppointmentConflict",
     "InvalidCredentials",
+    "ServiceOverloaded",
+    "RateLimited",
 ]
 
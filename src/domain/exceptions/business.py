@@ -32,3 +32,12 @@ class InvalidOperation(DomainException):
     """
     pass
 
+
+class AppointmentConflict(DomainException):
+    """Raised when an appointment overlaps another booking of the same staff member.
+    
+    Example:
+        raise AppointmentConflict("Staff member is already booked at this time")
+    """
+    pass
+
@@ -0,0 +1,31 @@
+"""Capacity and overload exceptions."""
+
+from src.domain.exceptions.base import DomainException
+
+
+class ServiceOverloaded(DomainException):
+    """Raised when a bounded resource is saturated and the request is shed.
+
+    Example:
+        raise ServiceOverloaded("Password hashing queue is full")
+    """
+    pass
+
+
+
+class RateLimited(DomainException):
+    """Raised when a client exceeds its request budget.
+
+    Example:
+        raise RateLimited("Too many signup attempts", retry_after=12.5)
+    """
+
+    def __init__(self, message: str, retry_after: float):
+        """Initialize rate limit exception.
+
+        Args:
+            message: Human-readable error message
+            retry_after: Seconds until the client may try again
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -0,0 +1,96 @@
+"""Streaming readers for bulk import files.
+
+Both readers consume an async iterable of raw byte chunks (a request body or
+a file read piece by piece) and yield ``ImportRecord`` objects one at a time,
+so memory use does not depend on the size of the file.
+"""
+
+import codecs
+import csv
+import json
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator
+
+import anyio
+
+from src.application.schemas.bulk_import import ImportFormat, ImportRecord
+
+READ_CHUNK_SIZE = 64 * 1024
+
+
+async def iter_file_chunks(path: Path, chunk_size: int = READ_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Read a file in chunks without blocking the event loop."""
+    async with await anyio.open_file(path, "rb") as file:
+        while chunk := await file.read(chunk_size):
+            yield chunk
+
+
+async def _iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+async def _iter_ndjson(chunks: AsyncIterable[bytes]) -> AsyncIterator[ImportRecord]:
+    row_number = 0
+    async for line in _iter_lines(chunks):
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            yield ImportRecord(row_number=row_number, error=f"Invalid JSON: {e}")
+            continue
+        if not isinstance(data, dict):
+            yield ImportRecord(row_number=row_number, error="Expected a JSON object")
+            continue
+        yield ImportRecord(row_number=row_number, data=data)
+
+
+async def _iter_csv(chunks: AsyncIterable[bytes]) -> AsyncIterator[ImportRecord]:
+    header: list[str] | None = None
+    row_number = 0
+    pending = ""
+    async for line in _iter_lines(chunks):
+        # A quoted field may contain newlines; keep reading until quotes balance
+        pending = f"{pending}\n{line}" if pending else line
+        if pending.count('"') % 2:
+            continue
+        text, pending = pending, ""
+        if not text.strip():
+            continue
+
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+
+        row_number += 1
+        if len(values) != len(header):
+            yield ImportRecord(
+                row_number=row_number, error=f"Expected {len(header)} columns, got {len(values)}"
+            )
+            continue
+        # Empty cells mean "not set" so optional fields fall back to their defaults
+        yield ImportRecord(
+            row_number=row_number,
+            data={name: value for name, value in zip(header, values) if value != ""},
+        )
+
+    if pending:
+        yield ImportRecord(row_number=row_number + 1, error="Unterminated quoted field")
+
+
+def iter_records(chunks: AsyncIterable[bytes], file_format: ImportFormat) -> AsyncIterator[ImportRecord]:
+    """Parse a stream of bytes into import records."""
+    if file_format == ImportFormat.NDJSON:
+        return _iter_ndjson(chunks)
+    return _iter_csv(chunks)
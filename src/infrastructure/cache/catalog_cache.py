@@ -0,0 +1,131 @@
+"""In-process read-through cache for catalog data.
+
+Lookups go to a per-worker TTL/LRU tier and only on a miss to the loader
+(Postgres). Triggers on the catalog tables send a ``NOTIFY`` for every
+changed row, which Postgres delivers to all listeners once the writing
+transaction commits, whichever process wrote it; ``CatalogInvalidationListener``
+drops the matching entries in each worker. The TTL only bounds staleness
+while a worker's listener is disconnected.
+"""
+
+from typing import Awaitable, Callable, Hashable, Iterable, TypeVar
+
+from src.config import settings
+from src.config.settings import CacheSettings
+from src.infrastructure.cache.ttl_cache import MISSING, TTLCache
+
+T = TypeVar("T")
+
+COMPANY = "company"
+STAFF = "staff"
+STAFF_SERVICE = "staff_service"
+WORKING_HOURS = "working_hours"
+
+
+class CatalogCache:
+    """Read-through cache invalidated by catalog change notifications."""
+
+    def __init__(self, max_size: int = 10_000, ttl_seconds: float = 300):
+        """Initialize catalog cache.
+
+        Args:
+            max_size: Maximum cached entries
+            ttl_seconds: Lifetime of cached values
+        """
+        self.local = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        # Bumped by every invalidation; a load that overlapped one may have read the old row
+        self._generation = 0
+
+    @classmethod
+    def from_settings(cls, cache: CacheSettings) -> "CatalogCache":
+        return cls(max_size=cache.CATALOG_CACHE_MAX_SIZE, ttl_seconds=cache.CATALOG_CACHE_TTL_SECONDS)
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        id: Hashable,
+        loader: Callable[[], Awaitable[T]],
+        cache_none: bool = False,
+    ) -> T:
+        """Return the cached value for (namespace, id), loading it on a miss.
+
+        Args:
+            namespace: Entity kind, e.g. COMPANY
+            id: Entity identifier
+            loader: Coroutine factory reading the value from the database
+            cache_none: Whether a None result may be cached
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        entry = self.local.get((namespace, id))
+        if entry is not MISSING:
+            return entry
+
+        generation = self._generation
+        value = await loader()
+        if (value is not None or cache_none) and generation == self._generation:
+            self.local.set((namespace, id), value)
+        return value
+
+    async def get_many_or_load(
+        self,
+        namespace: str,
+        ids: Iterable[Hashable],
+        loader: Callable[[list[Hashable]], Awaitable[dict[Hashable, T]]],
+        default: Callable[[], T] | None = None,
+    ) -> dict[Hashable, T]:
+        """Batch variant of get_or_load; all misses are loaded with one loader call.
+
+        Args:
+            namespace: Entity kind
+            ids: Entity identifiers
+            loader: Coroutine loading a mapping of id to value for the missing ids
+            default: Factory for ids the loader returns nothing for (cached too)
+
+        Returns:
+            Mapping of id to value for every id found or defaulted
+        """
+        found: dict[Hashable, T] = {}
+        missing: list[Hashable] = []
+        for id in dict.fromkeys(ids):
+            entry = self.local.get((namespace, id))
+            if entry is not MISSING:
+                found[id] = entry
+            else:
+                missing.append(id)
+
+        if not missing:
+            return found
+
+        generation = self._generation
+        loaded = await loader(missing)
+        for id in missing:
+            if id in loaded:
+                value = loaded[id]
+            elif default is not None:
+                value = default()
+            else:
+                continue
+            found[id] = value
+            if generation == self._generation:
+                self.local.set((namespace, id), value)
+        return found
+
+    def invalidate(self, namespace: str, ids: Iterable[Hashable]) -> None:
+        """Drop the cached copies of the given entities."""
+        self._generation += 1
+        for id in ids:
+            self.local.delete((namespace, id))
+
+    def clear(self) -> None:
+        """Drop every cached entry, e.g. after notifications may have been missed."""
+        self._generation += 1
+        self.local.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size."""
+        return self.local.stats()
+
+
+catalog_cache = CatalogCache.from_settings(settings.cache)
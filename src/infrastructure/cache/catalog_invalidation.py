@@ -0,0 +1,116 @@
+"""Cross-process invalidation of ``CatalogCache`` via Postgres LISTEN/NOTIFY.
+
+Triggers on companies, staff, staff_services and working_hours notify
+``CATALOG_CHANNEL`` with ``<namespace>:<id>`` for every changed row (see
+migration 00008). Notifications are only delivered once the writing
+transaction commits, so invalidation never runs ahead of the data, and they
+cover every writer: API workers, CLI imports, manual SQL.
+
+Each worker keeps one dedicated connection listening. Notifications sent
+while it is disconnected are lost, so the whole cache is cleared on every
+(re)connect. When reads may go to a replica, each entry is dropped a second
+time after the maximum tolerated replication lag, in case it was reloaded
+from a replica that had not replayed the change yet.
+"""
+
+import asyncio
+import logging
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from src.config import settings
+from src.config.settings import CacheSettings, DatabaseSettings
+from src.infrastructure.cache.catalog_cache import CatalogCache, catalog_cache
+
+logger = logging.getLogger(__name__)
+
+CATALOG_CHANNEL = "catalog_changes"
+
+
+class CatalogInvalidationListener:
+    """Keeps a LISTEN connection open and drops the notified cache entries."""
+
+    def __init__(
+        self,
+        dsn: str,
+        cache: CatalogCache = catalog_cache,
+        replica_lag_seconds: float = 0,
+        keepalive_seconds: float = 30,
+        reconnect_seconds: float = 5,
+    ):
+        """Initialize catalog invalidation listener.
+
+        Args:
+            dsn: libpq connection string of the primary
+            cache: Cache to invalidate
+            replica_lag_seconds: Delay of the second invalidation, 0 without replicas
+            keepalive_seconds: Interval of the liveness probe on the idle connection
+            reconnect_seconds: Pause before reconnecting after a failure
+        """
+        self.dsn = dsn
+        self.cache = cache
+        self.replica_lag_seconds = replica_lag_seconds
+        self.keepalive_seconds = keepalive_seconds
+        self.reconnect_seconds = reconnect_seconds
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @classmethod
+    def from_settings(cls, database: DatabaseSettings, cache: CacheSettings) -> "CatalogInvalidationListener":
+        return cls(
+            dsn=make_url(database.DATABASE_URL).set(drivername="postgresql").render_as_string(hide_password=False),
+            replica_lag_seconds=database.POSTGRES_REPLICA_MAX_LAG_SECONDS if database.REPLICA_URLS else 0,
+            keepalive_seconds=cache.CATALOG_CACHE_LISTEN_KEEPALIVE_SECONDS,
+        )
+
+    def _on_notification(self, connection: asyncpg.Connection, pid: int, channel: str, payload: str) -> None:
+        namespace, _, id = payload.partition(":")
+        try:
+            ids = [UUID(id)]
+        except ValueError:
+            logger.warning("Ignoring malformed catalog notification %r", payload)
+            return
+        self.cache.invalidate(namespace, ids)
+        if self.replica_lag_seconds > 0:
+            asyncio.get_running_loop().call_later(self.replica_lag_seconds, self.cache.invalidate, namespace, ids)
+
+    async def _listen(self) -> None:
+        connection = await asyncpg.connect(self.dsn)
+        try:
+            await connection.add_listener(CATALOG_CHANNEL, self._on_notification)
+            self.cache.clear()
+            while not self._stopping.is_set():
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.keepalive_seconds)
+                except asyncio.TimeoutError:
+                    # A half-open connection would otherwise go unnoticed while nothing is notified
+                    await connection.execute("SELECT 1", timeout=self.keepalive_seconds)
+        finally:
+            connection.terminate()
+
+    async def run(self) -> None:
+        """Listen, reconnecting after failures, until ``stop`` is called."""
+        while not self._stopping.is_set():
+            try:
+                await self._listen()
+            except Exception:
+                logger.warning("Catalog invalidation listener disconnected", exc_info=True)
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.reconnect_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        """Run the listener as a background task of the current event loop."""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self.run(), name="catalog-invalidation")
+
+    async def stop(self) -> None:
+        """Close the connection and wait for the task to finish."""
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
@@ -0,0 +1,163 @@
+"""Storage of responses to requests sent with an ``Idempotency-Key``.
+
+Completed responses are kept for ``ttl_seconds`` in an in-process TTL/LRU
+tier and, unless IDEMPOTENCY_SHARED is off, in the shared tier
+(``PostgresCacheBackend``) so that every worker and host can replay them.
+
+Requests still being processed are tracked as well: within a process a
+duplicate awaits the original's future; across processes the original holds
+a claim counter in the shared tier and duplicates poll, reading only, until
+the claim is gone and its response is stored.
+"""
+
+import asyncio
+import base64
+import json
+from dataclasses import dataclass
+
+from src.application.interfaces.cache_backend import AbstractCacheBackend
+from src.config import settings
+from src.config.settings import IdempotencySettings
+from src.infrastructure.cache.postgres_backend import PostgresCacheBackend
+from src.infrastructure.cache.ttl_cache import MISSING, TTLCache
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResponse:
+    """A complete response and the fingerprint of the request that produced it."""
+
+    fingerprint: str
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+
+    def dumps(self) -> bytes:
+        """JSON encoding for the shared tier; plain data, unlike pickle, so a stored value can't run code."""
+        return json.dumps({
+            "fingerprint": self.fingerprint,
+            "status": self.status,
+            # Header bytes are latin-1 in ASGI, which maps every byte to one code point
+            "headers": [[name.decode("latin-1"), value.decode("latin-1")] for name, value in self.headers],
+            "body": base64.b64encode(self.body).decode("ascii"),
+        }, separators=(",", ":")).encode("utf-8")
+
+    @classmethod
+    def loads(cls, raw: bytes) -> "StoredResponse":
+        """Decode a value written by ``dumps``."""
+        payload = json.loads(raw)
+        return cls(
+            fingerprint=payload["fingerprint"],
+            status=int(payload["status"]),
+            headers=[(name.encode("latin-1"), value.encode("latin-1")) for name, value in payload["headers"]],
+            body=base64.b64decode(payload["body"]),
+        )
+
+
+class IdempotencyStore:
+    """Two-tier response store with in-flight tracking."""
+
+    def __init__(
+        self,
+        shared: AbstractCacheBackend | None = None,
+        max_size: int = 10_000,
+        ttl_seconds: float = 86_400,
+        claim_ttl_seconds: float = 60,
+    ):
+        """Initialize idempotency store.
+
+        Args:
+            shared: Optional cross-process tier; without it responses and claims are per process
+            max_size: Maximum responses in the in-process tier
+            ttl_seconds: How long responses are replayed
+            claim_ttl_seconds: Lifetime of a shared claim, bounds the wait after a worker died mid-request
+        """
+        self.shared = shared
+        self.ttl_seconds = ttl_seconds
+        self.claim_ttl_seconds = claim_ttl_seconds
+        self.local = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self._in_flight: dict[str, asyncio.Future] = {}
+
+    @classmethod
+    def from_settings(
+        cls, idempotency: IdempotencySettings, shared: AbstractCacheBackend | None = None
+    ) -> "IdempotencyStore":
+        return cls(
+            shared=shared,
+            max_size=idempotency.IDEMPOTENCY_MAX_ENTRIES,
+            ttl_seconds=idempotency.IDEMPOTENCY_TTL_SECONDS,
+            claim_ttl_seconds=idempotency.IDEMPOTENCY_WAIT_SECONDS * 2,
+        )
+
+    @staticmethod
+    def _value_key(key: str) -> str:
+        return f"idempotency:val:{key}"
+
+    @staticmethod
+    def _claim_key(key: str) -> str:
+        return f"idempotency:claim:{key}"
+
+    async def get(self, key: str) -> StoredResponse | None:
+        """Stored response for ``key``, if any."""
+        response = self.local.get(key)
+        if response is not MISSING:
+            return response
+        if self.shared is None:
+            return None
+
+        raw = await self.shared.get(self._value_key(key))
+        if raw is None:
+            return None
+        response = StoredResponse.loads(raw)
+        self.local.set(key, response)
+        return response
+
+    def in_flight(self, key: str) -> asyncio.Future | None:
+        """Future of the request with ``key`` being processed in this process, if any."""
+        return self._in_flight.get(key)
+
+    async def claim(self, key: str) -> bool:
+        """Mark ``key`` as being processed; False if another request already holds it.
+
+        Returns False only for another in-process request or, with a shared
+        tier, one in another process.
+        """
+        if key in self._in_flight:
+            return False
+        self._in_flight[key] = asyncio.get_running_loop().create_future()
+        if self.shared is None:
+            return True
+
+        # The claim expires in case this worker dies holding it
+        if await self.shared.incr(self._claim_key(key), ttl_seconds=self.claim_ttl_seconds) == 1:
+            return True
+        # Waiters of this process re-check the store and find the other process's claim
+        self._in_flight.pop(key).set_result(None)
+        return False
+
+    async def claimed_elsewhere(self, key: str) -> bool:
+        """Whether another process holds the claim on ``key``; a read, unlike ``claim``."""
+        if self.shared is None:
+            return False
+        return await self.shared.get(self._claim_key(key)) is not None
+
+    async def release(self, key: str, response: StoredResponse | None) -> None:
+        """End processing of ``key``, storing ``response`` unless it is None.
+
+        Requests waiting on the key are woken up either way.
+        """
+        try:
+            if response is not None:
+                self.local.set(key, response)
+                if self.shared is not None:
+                    await self.shared.set(self._value_key(key), response.dumps(), ttl_seconds=self.ttl_seconds)
+            if self.shared is not None:
+                await self.shared.delete(self._claim_key(key))
+        finally:
+            future = self._in_flight.pop(key, None)
+            if future is not None and not future.done():
+                future.set_result(response)
+
+
+idempotency_store = IdempotencyStore.from_settings(
+    settings.idempotency, shared=PostgresCacheBackend() if settings.idempotency.IDEMPOTENCY_SHARED else None
+)
@@ -0,0 +1,49 @@
+"""In-memory implementation of the shared cache interface.
+
+Stands in for Redis in tests and single-process deployments; it is not
+shared between worker processes.
+"""
+
+import time
+
+from src.application.interfaces.cache_backend import AbstractCacheBackend
+
+
+class InMemoryCacheBackend(AbstractCacheBackend):
+    """Dictionary-backed cache backend with expiry."""
+
+    def __init__(self):
+        self._values: dict[str, tuple[float | None, bytes | int]] = {}
+
+    def _live(self, key: str) -> bytes | int | None:
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._values[key]
+            return None
+        return value
+
+    async def get(self, key: str) -> bytes | None:
+        value = self._live(key)
+        if isinstance(value, int):
+            return str(value).encode()
+        return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float | None = None) -> None:
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds is not None else None
+        self._values[key] = (expires_at, value)
+
+    async def delete(self, key: str) -> None:
+        self._values.pop(key, None)
+
+    async def incr(self, key: str, ttl_seconds: float | None = None) -> int:
+        current = self._live(key)
+        if current is None:
+            expires_at = time.monotonic() + ttl_seconds if ttl_seconds is not None else None
+        else:
+            expires_at = self._values[key][0]
+        value = int(current or 0) + 1
+        self._values[key] = (expires_at, value)
+        return value
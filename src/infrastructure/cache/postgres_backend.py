@@ -0,0 +1,95 @@
+"""Shared cache interface implemented on a Postgres table.
+
+Every worker process and host already talks to the primary, so entries
+stored here are shared without running another service. Each call is a
+short transaction of its own, committed before it returns even inside a
+unit of work: a claim must be visible to other processes before the request
+holding it proceeds.
+"""
+
+from datetime import timedelta
+
+from sqlalchemy import BigInteger, Text, case, cast, delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.cache_backend import AbstractCacheBackend
+from src.infrastructure.database import SharedCacheEntry
+from src.infrastructure.database.session_manager import create_async_session
+
+
+class PostgresCacheBackend(AbstractCacheBackend):
+    """Cache backend on the shared_cache table.
+
+    Expired rows are ignored by reads and overwritten by writes; every
+    ``purge_every`` writes of a process also delete up to ``purge_batch``
+    of them, so keys that are never written again don't pile up.
+    """
+
+    def __init__(self, purge_every: int = 1000, purge_batch: int = 1000):
+        self.purge_every = purge_every
+        self.purge_batch = purge_batch
+        self._writes = 0
+
+    @staticmethod
+    def _live():
+        return or_(SharedCacheEntry.expires_at.is_(None), SharedCacheEntry.expires_at > func.now())
+
+    def _purge_due(self) -> bool:
+        self._writes += 1
+        return self._writes % self.purge_every == 0
+
+    async def _purge(self, session: AsyncSession) -> None:
+        expired = (
+            select(SharedCacheEntry.id)
+            .where(SharedCacheEntry.expires_at <= func.now())
+            .limit(self.purge_batch)
+        )
+        await session.execute(delete(SharedCacheEntry).where(SharedCacheEntry.id.in_(expired)))
+
+    async def get(self, key: str) -> bytes | None:
+        async with create_async_session() as session:
+            return await session.scalar(
+                select(SharedCacheEntry.value).where(SharedCacheEntry.key == key, self._live())
+            )
+
+    @staticmethod
+    def _expires_at(ttl_seconds: float | None):
+        return func.now() + timedelta(seconds=ttl_seconds) if ttl_seconds is not None else None
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float | None = None) -> None:
+        expires_at = self._expires_at(ttl_seconds)
+        stmt = insert(SharedCacheEntry).values(key=key, value=value, expires_at=expires_at)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SharedCacheEntry.key],
+            set_={"value": stmt.excluded.value, "expires_at": stmt.excluded.expires_at, "updated_at": func.now()},
+        )
+        async with create_async_session() as session:
+            await session.execute(stmt)
+            if self._purge_due():
+                await self._purge(session)
+
+    async def delete(self, key: str) -> None:
+        async with create_async_session() as session:
+            await session.execute(delete(SharedCacheEntry).where(SharedCacheEntry.key == key))
+
+    async def incr(self, key: str, ttl_seconds: float | None = None) -> int:
+        # Counters are stored as decimal text; an expired row starts over, a live one keeps its expiry
+        live = self._live()
+        incremented = func.convert_to(
+            cast(cast(func.convert_from(SharedCacheEntry.value, "UTF8"), BigInteger) + 1, Text), "UTF8"
+        )
+        stmt = insert(SharedCacheEntry).values(key=key, value=b"1", expires_at=self._expires_at(ttl_seconds))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SharedCacheEntry.key],
+            set_={
+                "value": case((live, incremented), else_=stmt.excluded.value),
+                "expires_at": case((live, SharedCacheEntry.expires_at), else_=stmt.excluded.expires_at),
+                "updated_at": func.now(),
+            },
+        ).returning(SharedCacheEntry.value)
+        async with create_async_session() as session:
+            value = await session.scalar(stmt)
+            if self._purge_due():
+                await self._purge(session)
+        return int(value)
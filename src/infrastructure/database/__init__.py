@@ -1,6 +1,8 @@
 from src.infrastructure.database.base import BaseModelMixin
 
-from src.infrastructure.database.models import User, Staff, StaffService, Review, Company, Appointment, WorkingHours
+from src.infrastructure.database.models import (
+    User, Staff, StaffService, Review, Company, Appointment, WorkingHours, AppointmentDailyStats, SharedCacheEntry
+)
 
 __all__ = [
     "BaseModelMixin",
@@ -11,5 +13,7 @@ __all__ = [
     "Company",
     "Appointment",
     "WorkingHours",
+    "AppointmentDailyStats",
+    "SharedCacheEntry",
 
 ]
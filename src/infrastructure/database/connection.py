@@ -1,10 +1,42 @@
 from sqlalchemy import NullPool
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from src.config import settings
+from src.config.settings import DatabaseSettings
+from src.infrastructure.database.pool import InstrumentedAsyncQueuePool
+from src.infrastructure.observability.sqlalchemy_events import instrument_engine
 
-engine = create_async_engine(settings.database.DATABASE_URL, echo=False, poolclass=NullPool)
+
+def build_engine(database: DatabaseSettings, url: str | None = None) -> AsyncEngine:
+    """Create the async engine, pooled unless pooling is disabled in settings.
+
+    Args:
+        database: Database settings
+        url: Database URL, the primary's by default
+    """
+    url = url or database.DATABASE_URL
+    if not database.POSTGRES_POOL_ENABLED:
+        engine = create_async_engine(url, echo=False, poolclass=NullPool)
+        instrument_engine(engine)
+        return engine
+
+    engine = create_async_engine(
+        url,
+        echo=False,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=database.POSTGRES_POOL_SIZE,
+        max_overflow=database.POSTGRES_POOL_MAX_OVERFLOW,
+        pool_recycle=database.POSTGRES_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=database.POSTGRES_POOL_PRE_PING,
+        pool_timeout=database.POSTGRES_POOL_TIMEOUT_SECONDS,
+    )
+    instrument_engine(engine)
+    return engine
+
+
+engine = build_engine(settings.database)
+replica_engines = [build_engine(settings.database, url) for url in settings.database.REPLICA_URLS]
 
 DeclarativeBase = declarative_base()
 
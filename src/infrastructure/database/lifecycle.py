@@ -0,0 +1,89 @@
+"""Startup warm-up and shutdown of the database engines.
+
+Warm-up opens pool connections ahead of traffic and runs the hot lookup
+statements once on each of them. asyncpg prepares and caches statements per
+connection and SQLAlchemy caches their compiled form, so the first real
+requests after a deploy don't pay for connecting, authenticating and
+preparing.
+"""
+
+import asyncio
+import logging
+from uuid import UUID
+
+from sqlalchemy import Executable, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.infrastructure.database import Company, Staff, StaffService, WorkingHours
+from src.infrastructure.database.connection import engine, replica_engines
+from src.infrastructure.repositories.availability_repository import WORKING_HOURS_COLUMNS
+from src.infrastructure.repositories.company_repository import COMPANY_COLUMNS
+from src.infrastructure.repositories.mapping import matches_any
+from src.infrastructure.repositories.staff_repository import STAFF_COLUMNS
+from src.infrastructure.repositories.staff_service_repository import STAFF_SERVICE_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+NIL_UUID = UUID(int=0)
+
+# Same statement text as the batched repository lookups (get_*_by_ids, get_working_hours) requests go
+# through, so their prepared statements are reused
+WARMUP_STATEMENTS: list[Executable] = [
+    select(*COMPANY_COLUMNS).where(matches_any(Company.id, [NIL_UUID])),
+    select(*STAFF_COLUMNS).where(matches_any(Staff.id, [NIL_UUID])),
+    select(*STAFF_SERVICE_COLUMNS).where(matches_any(StaffService.id, [NIL_UUID])),
+    select(*WORKING_HOURS_COLUMNS).where(matches_any(WorkingHours.staff_id, [NIL_UUID])),
+]
+
+
+async def _warm_connection(conn: AsyncConnection, statements: list[Executable]) -> None:
+    for statement in statements:
+        await conn.execute(statement)
+
+
+async def warm_up_engine(
+    target: AsyncEngine, connections: int, statements: list[Executable] = WARMUP_STATEMENTS
+) -> int:
+    """Open up to ``connections`` pooled connections and prepare ``statements`` on each.
+
+    Failures are logged, not raised: a database that is briefly unavailable
+    at boot must not keep the worker from starting.
+
+    Returns:
+        Number of connections warmed
+    """
+    if connections <= 0:
+        return 0
+
+    # Hold every connection until all are open, otherwise the pool hands out the same one again
+    all_open = asyncio.Event()
+    opened = 0
+
+    async def warm_one() -> bool:
+        nonlocal opened
+        try:
+            async with target.connect() as conn:
+                await _warm_connection(conn, statements)
+                opened += 1
+                if opened == connections:
+                    all_open.set()
+                await all_open.wait()
+            return True
+        except Exception:
+            logger.warning("Warming a connection to %s failed", target.url.host, exc_info=True)
+            all_open.set()
+            return False
+
+    results = await asyncio.gather(*(warm_one() for _ in range(connections)))
+    return sum(results)
+
+
+async def warm_up_database(connections: int) -> None:
+    """Warm the primary and every replica engine."""
+    warmed = await asyncio.gather(*(warm_up_engine(target, connections) for target in [engine, *replica_engines]))
+    logger.info("Warmed %s database connections", sum(warmed))
+
+
+async def dispose_database() -> None:
+    """Close every pooled connection of the primary and replica engines."""
+    await asyncio.gather(*(target.dispose() for target in [engine, *replica_engines]))
@@ -1,8 +1,11 @@
-from datetime import time, datetime
+from datetime import date, datetime, time
 from uuid import UUID
 from pydantic import EmailStr
 
-from sqlalchemy import Enum, ForeignKey, String, UniqueConstraint
+from sqlalchemy import (
+    CheckConstraint, Computed, Enum, ForeignKey, Index, LargeBinary, PrimaryKeyConstraint, String, Text,
+    UniqueConstraint, text
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.domain.enums import StaffMemberRole, AppointmentStatus, WeekDay
@@ -30,14 +33,18 @@ class Review(BaseModelMixin):
     __tablename__ = "reviews"
 
     staff_id: Mapped[UUID] = mapped_column(ForeignKey("staff.id", ondelete="CASCADE"))
-    appointment_id: Mapped[UUID] = mapped_column(ForeignKey("appointments.id", ondelete="CASCADE"))
+    # No foreign key: appointments is partitioned and its primary key includes appointment_start.
+    # Deleting an appointment deletes its reviews through a trigger instead (migration 00006).
+    appointment_id: Mapped[UUID] = mapped_column(index=True)
 
     rating: Mapped[float] = mapped_column()
     comment: Mapped[str | None] = mapped_column(String(500))
 
     # Relations
     staff: Mapped["Staff"] = relationship("Staff", back_populates="reviews")
-    appointment: Mapped["Appointment"] = relationship("Appointment", back_populates="reviews")
+    appointment: Mapped["Appointment"] = relationship(
+        "Appointment", back_populates="reviews", primaryjoin="foreign(Review.appointment_id) == Appointment.id"
+    )
 
     def __repr__(self):
         return f"<Review(id={self.id}, rating={self.rating})>"
@@ -51,6 +58,8 @@ class Company(BaseModelMixin):
     company_email: Mapped[EmailStr | None] = mapped_column(String(200))
     company_phone: Mapped[str | None] = mapped_column(String(25))
     company_logo_url: Mapped[str | None] = mapped_column(String(200))
+    # Trigram-indexed text searched by SearchRepository
+    search_text: Mapped[str] = mapped_column(Text, Computed("company_name || ' ' || company_address", persisted=True))
 
     # Relations
     staff: Mapped[list["Staff"]] = relationship(
@@ -61,6 +70,13 @@ class Company(BaseModelMixin):
     )
     appointments: Mapped[list["Appointment"]] = relationship("Appointment", back_populates="company")
 
+    __table_args__ = (
+        Index(
+            "ix_companies_search_text_trgm", "search_text",
+            postgresql_using="gist", postgresql_ops={"search_text": "gist_trgm_ops"},
+        ),
+    )
+
     def __repr__(self):
         return f"<Company(id={self.id}, name='{self.company_name}')>"
 
@@ -79,6 +95,11 @@ class Staff(BaseModelMixin):
         nullable=False
     )
 
+    # Rating aggregates of the staff member's reviews, maintained by triggers on reviews (migration 00003)
+    rating_count: Mapped[int] = mapped_column(default=0, server_default=text("0"))
+    rating_sum: Mapped[float] = mapped_column(default=0, server_default=text("0"))
+    rating_average: Mapped[float | None] = mapped_column()
+
     # Relations
     user: Mapped["User"] = relationship("User", back_populates="staff_memberships")
     company: Mapped["Company"] = relationship("Company", back_populates="staff")
@@ -93,6 +114,9 @@ class Staff(BaseModelMixin):
 
     __table_args__ = (
         UniqueConstraint("user_id", "company_id", name="uq_user_company"),
+        Index("ix_staff_company_id_rating_average", "company_id", text("rating_average DESC NULLS LAST")),
+        # Keyset pagination of a company's staff
+        Index("ix_staff_company_id_created_at_id", "company_id", "created_at", "id"),
     )
 
     def __repr__(self):
@@ -109,16 +133,35 @@ class StaffService(BaseModelMixin):
     price: Mapped[float] = mapped_column()
     duration: Mapped[int] = mapped_column(comment="Duration of the service in minutes")
     is_active: Mapped[bool] = mapped_column(default=True)
+    # Trigram-indexed text searched by SearchRepository
+    search_text: Mapped[str] = mapped_column(
+        Text, Computed("name || ' ' || coalesce(description, '')", persisted=True)
+    )
 
     # Relations
     staff: Mapped["Staff"] = relationship("Staff", back_populates="services")
     appointments: Mapped[list["Appointment"]] = relationship("Appointment", back_populates="service")
 
+    __table_args__ = (
+        Index(
+            "ix_staff_services_search_text_trgm", "search_text",
+            postgresql_using="gist", postgresql_ops={"search_text": "gist_trgm_ops"},
+        ),
+        # Keyset pagination of a staff member's services
+        Index("ix_staff_services_staff_id_created_at_id", "staff_id", "created_at", "id"),
+    )
+
     def __repr__(self):
         return f"<StaffService(id={self.id}, name='{self.name}', price={self.price})>"
 
 
 class Appointment(BaseModelMixin):
+    """Appointments, range-partitioned by month on appointment_start.
+
+    Partitions are created ahead and archived by
+    src.presentation.cli.maintain_appointment_partitions.
+    """
+
     __tablename__ = "appointments"
 
     company_id: Mapped[UUID] = mapped_column(ForeignKey("companies.id", ondelete="CASCADE"))
@@ -126,20 +169,56 @@ class Appointment(BaseModelMixin):
     user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     service_id: Mapped[UUID] = mapped_column(ForeignKey("staff_services.id", ondelete="SET NULL"), nullable=True)
 
-    appointment_start: Mapped[datetime] = mapped_column()
+    appointment_start: Mapped[datetime] = mapped_column(primary_key=True)
     appointment_end: Mapped[datetime] = mapped_column()
     status: Mapped[AppointmentStatus] = mapped_column(
         Enum(AppointmentStatus, name="appointment_status", native_enum=True),
         default=AppointmentStatus.SCHEDULED,
         nullable=False
     )
+    reminder_sent_at: Mapped[datetime | None] = mapped_column()
+    # Claims of the reminder so far; a claim leases the row until reminder_next_attempt_at
+    reminder_attempts: Mapped[int] = mapped_column(default=0, server_default=text("0"))
+    reminder_next_attempt_at: Mapped[datetime | None] = mapped_column()
+    # Service price when booked, so later price changes don't rewrite revenue
+    price: Mapped[float | None] = mapped_column()
 
     # Relations
     company: Mapped["Company"] = relationship("Company", back_populates="appointments")
     staff: Mapped["Staff"] = relationship("Staff", back_populates="appointments")
     user: Mapped["User"] = relationship("User", back_populates="appointments")
     service: Mapped["StaffService"] = relationship("StaffService", back_populates="appointments")
-    reviews: Mapped[list["Review"]] = relationship("Review", back_populates="appointment", cascade="all, delete-orphan")
+    reviews: Mapped[list["Review"]] = relationship(
+        "Review",
+        back_populates="appointment",
+        cascade="all, delete-orphan",
+        primaryjoin="Appointment.id == foreign(Review.appointment_id)",
+    )
+
+    __table_args__ = (
+        # Unique constraints on a partitioned table must include the partition key
+        PrimaryKeyConstraint("id", "appointment_start", name="appointments_pkey"),
+        CheckConstraint("appointment_end > appointment_start", name="ck_appointments_end_after_start"),
+        # Every appointment lies within its partition's month, so the per-partition overlap constraints
+        # (ex_appointments_YYYY_MM_staff_overlap, see create_appointments_partition()) cover all bookings
+        CheckConstraint(
+            "appointment_end <= date_trunc('month', appointment_start) + interval '1 month'",
+            name="ck_appointments_within_month",
+        ),
+        Index("ix_appointments_staff_id_appointment_start", "staff_id", "appointment_start"),
+        Index("ix_appointments_company_id_appointment_start", "company_id", "appointment_start"),
+        Index("ix_appointments_user_id_appointment_start", "user_id", "appointment_start"),
+        # Keyset pagination of a company's appointments
+        Index("ix_appointments_company_id_created_at_id", "company_id", "created_at", "id"),
+        # Reminder scheduler: only appointments still waiting for their reminder are indexed
+        Index(
+            "ix_appointments_status_appointment_start",
+            "status",
+            "appointment_start",
+            postgresql_where=text("reminder_sent_at IS NULL"),
+        ),
+        {"postgresql_partition_by": "RANGE (appointment_start)"},
+    )
 
     def __repr__(self):
         return f"<Appointment(id={self.id}, start={self.appointment_start}, end={self.appointment_end}, status='{self.status}')>"
@@ -165,3 +244,51 @@ class WorkingHours(BaseModelMixin):
 
     def __repr__(self):
         return f"<WorkingHours(id={self.id}, staff_id={self.staff_id}, day_of_week={self.day_of_week}, start_time={self.start_time}, end_time={self.end_time})>"
+
+
+class AppointmentDailyStats(BaseModelMixin):
+    """Per company, day, staff member and status rollup of appointments.
+
+    Maintained by triggers on appointments (migration 00005) and rebuilt by
+    src.presentation.cli.reconcile_analytics; analytics endpoints read only
+    this table. No foreign keys: rows of deleted companies or staff net out
+    to zero instead of blocking the cascade.
+    """
+
+    __tablename__ = "appointment_daily_stats"
+
+    company_id: Mapped[UUID] = mapped_column()
+    # Nil UUID for appointments without a staff member
+    staff_id: Mapped[UUID] = mapped_column()
+    day: Mapped[date] = mapped_column()
+    status: Mapped[AppointmentStatus] = mapped_column(
+        Enum(AppointmentStatus, name="appointment_status", native_enum=True, create_type=False),
+        nullable=False
+    )
+    booking_count: Mapped[int] = mapped_column(default=0, server_default=text("0"))
+    revenue: Mapped[float] = mapped_column(default=0, server_default=text("0"))
+    booked_minutes: Mapped[int] = mapped_column(default=0, server_default=text("0"))
+
+    __table_args__ = (
+        UniqueConstraint("company_id", "day", "staff_id", "status", name="uq_appointment_daily_stats_key"),
+    )
+
+    def __repr__(self):
+        return f"<AppointmentDailyStats(company_id={self.company_id}, day={self.day}, staff_id={self.staff_id}, status='{self.status}')>"
+
+
+class SharedCacheEntry(BaseModelMixin):
+    """Entries of the cache shared by all worker processes (PostgresCacheBackend).
+
+    Expired rows are skipped when read and purged in batches by the writers.
+    """
+
+    __tablename__ = "shared_cache"
+
+    key: Mapped[str] = mapped_column(String(255), unique=True)
+    value: Mapped[bytes] = mapped_column(LargeBinary)
+    # NULL never expires
+    expires_at: Mapped[datetime | None] = mapped_column(index=True)
+
+    def __repr__(self):
+        return f"<SharedCacheEntry(key='{self.key}', expires_at={self.expires_at})>"
@@ -0,0 +1,95 @@
+"""Connection pool instrumentation.
+
+The pooled engine uses ``InstrumentedAsyncQueuePool`` so that the time spent
+waiting for a free connection is tracked next to the regular QueuePool
+counters. ``get_pool_stats`` turns both into a plain snapshot that can be
+exposed by the API.
+"""
+
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+
+from src.infrastructure.observability.request_stats import record_pool_wait
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long checkouts wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self.acquisitions += 1
+                self.total_wait += waited
+                self.max_wait = max(self.max_wait, waited)
+            record_pool_wait(waited)
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Point-in-time snapshot of the engine connection pool."""
+
+    pool_class: str
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    acquisitions: int
+    timeouts: int
+    total_wait_seconds: float
+    avg_wait_seconds: float
+    max_wait_seconds: float
+
+    def to_dict(self) -> dict:
+        """Convert pool stats to dictionary."""
+        return asdict(self)
+
+
+def get_pool_stats(engine: AsyncEngine) -> PoolStats:
+    """Collect live counters from the pool behind ``engine``.
+
+    Pools without queue semantics (e.g. ``NullPool``) report zeros for the
+    queue counters, so callers don't need to care which mode is active.
+    """
+    pool = engine.pool
+    size = checked_out = idle = overflow = 0
+    if isinstance(pool, QueuePool):
+        size = pool.size()
+        checked_out = pool.checkedout()
+        idle = pool.checkedin()
+        overflow = max(pool.overflow(), 0)
+
+    acquisitions = getattr(pool, "acquisitions", 0)
+    total_wait = getattr(pool, "total_wait", 0.0)
+    return PoolStats(
+        pool_class=type(pool).__name__,
+        size=size,
+        checked_out=checked_out,
+        idle=idle,
+        overflow=overflow,
+        acquisitions=acquisitions,
+        timeouts=getattr(pool, "timeouts", 0),
+        total_wait_seconds=total_wait,
+        avg_wait_seconds=total_wait / acquisitions if acquisitions else 0.0,
+        max_wait_seconds=getattr(pool, "max_wait", 0.0),
+    )
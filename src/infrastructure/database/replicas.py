@@ -0,0 +1,177 @@
+"""Routing of read-only sessions to streaming replicas.
+
+Read-only sessions (``provide_async_session(read_only=True)``) go to a
+replica picked round-robin among those whose replication lag is within
+``POSTGRES_REPLICA_MAX_LAG_SECONDS``, and to the primary when none is.
+
+Lag is measured lazily: a replica whose last measurement is older than
+``POSTGRES_REPLICA_LAG_CHECK_SECONDS`` gets probed in a background task
+started by the next read that picks it. Reads never wait for a probe, they
+use the previous measurement; a replica not measured yet counts as unfit.
+A replica that fails the probe or doesn't answer within
+``POSTGRES_REPLICA_LAG_CHECK_TIMEOUT_SECONDS`` is skipped until the next
+check.
+
+Read-your-writes: once a request has written to the primary, the rest of
+that request reads from the primary too, and so does the same client for
+``POSTGRES_READ_YOUR_WRITES_SECONDS`` afterwards (carried by a cookie set by
+``ReadYourWritesMiddleware``).
+"""
+
+import asyncio
+import itertools
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.config import settings
+from src.config.settings import DatabaseSettings
+from src.infrastructure.database.connection import engine, replica_engines
+
+# 0 when the replica has replayed everything it received, otherwise the age of the last replayed transaction
+REPLICATION_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+@dataclass
+class RoutingState:
+    """Read routing state of one request."""
+
+    sticky_until: float = 0.0
+    has_written: bool = False
+
+    def reads_from_primary(self) -> bool:
+        return self.has_written or time.time() < self.sticky_until
+
+
+current_routing: ContextVar[RoutingState | None] = ContextVar("current_routing", default=None)
+
+
+@dataclass
+class ReplicaState:
+    """Last known health of one replica."""
+
+    engine: AsyncEngine
+    lag_seconds: float | None = None
+    checked_at: float = float("-inf")
+    healthy: bool = False
+    checking: bool = False
+
+    @property
+    def name(self) -> str:
+        url = self.engine.url
+        return f"{url.host}:{url.port}"
+
+
+class ReplicaRouter:
+    """Round-robin replica picker with lag-aware fallback to the primary."""
+
+    def __init__(
+        self,
+        replicas: list[AsyncEngine],
+        max_lag_seconds: float = 5.0,
+        lag_check_seconds: float = 2.0,
+        lag_check_timeout_seconds: float = 1.0,
+    ):
+        """Initialize replica router.
+
+        Args:
+            replicas: Engines of the streaming replicas
+            max_lag_seconds: Replicas lagging more than this are not used
+            lag_check_seconds: How long a lag measurement is trusted
+            lag_check_timeout_seconds: Time limit of one lag probe
+        """
+        self.replicas = [ReplicaState(engine=replica) for replica in replicas]
+        self.max_lag_seconds = max_lag_seconds
+        self.lag_check_seconds = lag_check_seconds
+        self.lag_check_timeout_seconds = lag_check_timeout_seconds
+        self._next = itertools.cycle(range(len(self.replicas)))
+        # Running probes; the event loop only keeps weak references to tasks
+        self._checks: set[asyncio.Task] = set()
+
+    @classmethod
+    def from_settings(cls, database: DatabaseSettings, replicas: list[AsyncEngine]) -> "ReplicaRouter":
+        return cls(
+            replicas=replicas,
+            max_lag_seconds=database.POSTGRES_REPLICA_MAX_LAG_SECONDS,
+            lag_check_seconds=database.POSTGRES_REPLICA_LAG_CHECK_SECONDS,
+            lag_check_timeout_seconds=database.POSTGRES_REPLICA_LAG_CHECK_TIMEOUT_SECONDS,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+
+    async def _measure_lag(self, replica: ReplicaState) -> float:
+        async with replica.engine.connect() as conn:
+            return float((await conn.execute(REPLICATION_LAG_QUERY)).scalar() or 0)
+
+    async def _check(self, replica: ReplicaState) -> None:
+        try:
+            lag = await asyncio.wait_for(self._measure_lag(replica), timeout=self.lag_check_timeout_seconds)
+            replica.lag_seconds = lag
+            replica.healthy = lag <= self.max_lag_seconds
+        except Exception:
+            replica.lag_seconds = None
+            replica.healthy = False
+        finally:
+            replica.checked_at = time.monotonic()
+            replica.checking = False
+
+    def _start_check(self, replica: ReplicaState) -> None:
+        replica.checking = True
+        task = asyncio.create_task(self._check(replica), name=f"replica-lag-check-{replica.name}")
+        self._checks.add(task)
+        task.add_done_callback(self._checks.discard)
+
+    async def pick(self) -> AsyncEngine | None:
+        """Engine of a replica fit for reading, or None to read from the primary."""
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[next(self._next)]
+            stale = time.monotonic() - replica.checked_at >= self.lag_check_seconds
+            if stale and not replica.checking:
+                self._start_check(replica)
+            if replica.healthy:
+                return replica.engine
+        return None
+
+    def status(self) -> list[dict]:
+        """Last known lag and health of every replica."""
+        return [
+            {"replica": replica.name, "healthy": replica.healthy, "lag_seconds": replica.lag_seconds}
+            for replica in self.replicas
+        ]
+
+    async def dispose(self) -> None:
+        for task in self._checks:
+            task.cancel()
+        await asyncio.gather(*self._checks, return_exceptions=True)
+        await asyncio.gather(*(replica.engine.dispose() for replica in self.replicas))
+
+
+def _mark_written(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and (context.isinsert or context.isupdate or context.isdelete):
+        state = current_routing.get()
+        if state is not None:
+            state.has_written = True
+
+
+def track_writes(primary: AsyncEngine) -> None:
+    """Flag the current request as written to whenever DML runs on ``primary``."""
+    event.listen(primary.sync_engine, "after_cursor_execute", _mark_written)
+
+
+def reads_from_primary() -> bool:
+    """Whether read-only sessions of the current request must use the primary."""
+    state = current_routing.get()
+    return state is not None and state.reads_from_primary()
+
+
+replica_router = ReplicaRouter.from_settings(settings.database, replica_engines)
+if replica_router.enabled:
+    track_writes(engine)
@@ -1,49 +1,92 @@
 import contextlib
+import inspect
+from contextvars import ContextVar
 from functools import wraps
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from src.infrastructure.database.connection import AsyncSessionLocal
+from src.infrastructure.database.replicas import reads_from_primary, replica_router
+
+# Session of the unit of work active in the current request/task, if any
+current_session: ContextVar[AsyncSession | None] = ContextVar("current_session", default=None)
+
+
+async def _pick_read_engine() -> AsyncEngine | None:
+    if not replica_router.enabled or reads_from_primary():
+        return None
+    return await replica_router.pick()
 
 
 @contextlib.asynccontextmanager
-async def create_async_session() -> AsyncGenerator[AsyncSession, None]:
+async def create_async_session(read_only: bool = False) -> AsyncGenerator[AsyncSession, None]:
     """
     Async contextmanager that will create and teardown a session.
+    Read-only sessions are bound to a replica when one is fit for reading.
     """
-    async with AsyncSessionLocal() as session:
+    bind = await _pick_read_engine() if read_only else None
+    session_kwargs = {"bind": bind} if bind is not None else {}
+    async with AsyncSessionLocal(**session_kwargs) as session:
         try:
             yield session
             await session.commit()
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
 
 
-def provide_async_session(func):
+def provide_async_session(func=None, *, read_only: bool = False):
     """
     Function decorator that provides an async session if it isn't provided.
     If you want to reuse a session or run the function as part of a
-    database transaction, you pass it to the function, if not this wrapper
-    will create one and close it for you.
+    database transaction, you pass it to the function. Otherwise the session
+    of the active unit of work is used, and only when there is none this
+    wrapper will create one and close it for you.
+
+    With ``read_only=True`` the function gets its own session on a replica
+    instead, unless no replica is fit or the request must read its own writes;
+    then it behaves as above.
     """
+    if func is None:
+        return lambda f: provide_async_session(f, read_only=read_only)
+
+    arg_session = "session"
+
+    # Resolve where ``session`` sits in the signature once, not on every call
+    func_params = list(inspect.signature(func).parameters.values())
+    session_position = next(
+        (
+            position
+            for position, param in enumerate(func_params)
+            if param.name == arg_session
+            and param.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        ),
+        None,
+    )
 
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        arg_session = "session"
-
-        func_params = func.__code__.co_varnames
-        session_in_args = arg_session in func_params and func_params.index(arg_session) < len(args)
+        session_in_args = session_position is not None and session_position < len(args)
         session_in_kwargs = arg_session in kwargs
 
         if session_in_kwargs or session_in_args:
             return await func(*args, **kwargs)
-        else:
-            async with create_async_session() as session:
-                kwargs[arg_session] = session
-                return await func(*args, **kwargs)
+
+        if read_only:
+            bind = await _pick_read_engine()
+            if bind is not None:
+                async with AsyncSessionLocal(bind=bind) as session:
+                    kwargs[arg_session] = session
+                    return await func(*args, **kwargs)
+
+        session = current_session.get()
+        if session is not None:
+            kwargs[arg_session] = session
+            return await func(*args, **kwargs)
+
+        async with create_async_session() as session:
+            kwargs[arg_session] = session
+            return await func(*args, **kwargs)
 
     return wrapper
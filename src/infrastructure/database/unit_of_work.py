@@ -0,0 +1,41 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.unit_of_work import AbstractUnitOfWork
+from src.infrastructure.database.connection import AsyncSessionLocal
+from src.infrastructure.database.session_manager import current_session
+
+
+class UnitOfWork(AbstractUnitOfWork):
+    """SQLAlchemy unit of work.
+    
+    Opens one session for the duration of the ``async with`` block and makes
+    it the ambient session picked up by ``provide_async_session``, so every
+    repository call inside the block runs in the same transaction. The block
+    commits once on success and rolls back on error.
+    """
+
+    def __init__(self, session_factory=AsyncSessionLocal):
+        self._session_factory = session_factory
+        self._token = None
+        self.session: AsyncSession | None = None
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self.session = self._session_factory()
+        self._token = current_session.set(self.session)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            current_session.reset(self._token)
+            await self.session.close()
+
+    async def commit(self) -> None:
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
@@ -0,0 +1,150 @@
+"""Streaming writers for appointment exports.
+
+Both writers consume an async iterable of ``AppointmentExportRow`` and yield
+encoded byte chunks of up to ``rows_per_chunk`` rows, so memory use does not
+depend on the size of the export and the response is not flushed once per row.
+"""
+
+import csv
+import io
+from datetime import datetime, timezone
+from typing import AsyncIterable, AsyncIterator
+
+from src.application.schemas.appointment_export import AppointmentExportRow, ExportFormat
+from src.domain.enums import AppointmentStatus
+
+ROWS_PER_CHUNK = 500
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.ICS: "text/calendar; charset=utf-8",
+}
+
+CSV_HEADER = (
+    "id",
+    "appointment_start",
+    "appointment_end",
+    "status",
+    "service",
+    "price",
+    "staff_first_name",
+    "staff_last_name",
+    "customer_first_name",
+    "customer_last_name",
+)
+
+ICAL_STATUS = {
+    AppointmentStatus.SCHEDULED: "CONFIRMED",
+    AppointmentStatus.COMPLETED: "CONFIRMED",
+    AppointmentStatus.CANCELED: "CANCELLED",
+}
+
+# RFC 5545 content lines are folded at 75 octets
+ICAL_LINE_OCTETS = 75
+
+
+async def iter_csv(
+    rows: AsyncIterable[AppointmentExportRow], rows_per_chunk: int = ROWS_PER_CHUNK
+) -> AsyncIterator[bytes]:
+    """Encode rows as CSV with a header line."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+    pending = 0
+    async for row in rows:
+        writer.writerow((
+            row.id,
+            row.appointment_start.isoformat(),
+            row.appointment_end.isoformat(),
+            row.status.value,
+            row.service_name,
+            row.service_price,
+            row.staff_first_name,
+            row.staff_last_name,
+            row.customer_first_name,
+            row.customer_last_name,
+        ))
+        pending += 1
+        if pending >= rows_per_chunk:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue().encode("utf-8")
+
+
+def _ical_text(value: str) -> str:
+    return value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _ical_time(value: datetime) -> str:
+    # Stored as naive UTC
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+
+def _ical_line(name: str, value: str) -> str:
+    line = f"{name}:{value}".encode("utf-8")
+    if len(line) <= ICAL_LINE_OCTETS:
+        return line.decode("utf-8") + "\r\n"
+
+    parts = []
+    start, limit = 0, ICAL_LINE_OCTETS
+    while start < len(line):
+        end = min(start + limit, len(line))
+        # Never split a multi-byte character
+        while end < len(line) and line[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(line[start:end].decode("utf-8"))
+        # Continuation lines start with a space, which counts towards their length
+        start, limit = end, ICAL_LINE_OCTETS - 1
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _full_name(first_name: str | None, last_name: str | None) -> str:
+    return " ".join(part for part in (first_name, last_name) if part)
+
+
+def _ical_event(row: AppointmentExportRow, stamp: str) -> str:
+    customer = _full_name(row.customer_first_name, row.customer_last_name)
+    staff = _full_name(row.staff_first_name, row.staff_last_name)
+    summary = " - ".join(part for part in (row.service_name, customer) if part) or "Appointment"
+    description = "\n".join(
+        line
+        for line in (
+            f"Staff: {staff}" if staff else None,
+            f"Customer: {customer}" if customer else None,
+        )
+        if line
+    )
+    return "".join((
+        "BEGIN:VEVENT\r\n",
+        _ical_line("UID", f"{row.id}@bookme"),
+        _ical_line("DTSTAMP", stamp),
+        _ical_line("DTSTART", _ical_time(row.appointment_start)),
+        _ical_line("DTEND", _ical_time(row.appointment_end)),
+        _ical_line("SUMMARY", _ical_text(summary)),
+        _ical_line("DESCRIPTION", _ical_text(description)) if description else "",
+        _ical_line("STATUS", ICAL_STATUS[row.status]),
+        "END:VEVENT\r\n",
+    ))
+
+
+async def iter_ical(
+    rows: AsyncIterable[AppointmentExportRow], rows_per_chunk: int = ROWS_PER_CHUNK
+) -> AsyncIterator[bytes]:
+    """Encode rows as one iCalendar (RFC 5545) calendar with an event per appointment."""
+    stamp = _ical_time(datetime.now(timezone.utc).replace(tzinfo=None))
+    events = ["BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//BookMe//Appointment export//EN\r\nCALSCALE:GREGORIAN\r\n"]
+    async for row in rows:
+        events.append(_ical_event(row, stamp))
+        if len(events) >= rows_per_chunk:
+            yield "".join(events).encode("utf-8")
+            events.clear()
+    events.append("END:VCALENDAR\r\n")
+    yield "".join(events).encode("utf-8")
+
+
+WRITERS = {
+    ExportFormat.CSV: iter_csv,
+    ExportFormat.ICS: iter_ical,
+}
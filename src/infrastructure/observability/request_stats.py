@@ -0,0 +1,58 @@
+"""Per-request performance counters.
+
+The metrics middleware puts a ``RequestStats`` into ``current_request_stats``
+for the duration of a request; the database event listeners, the connection
+pool and the hashing pool add to it through the ``record_*`` helpers. Outside
+a request (CLI, background jobs) there is no stats object and only the
+process-wide histograms are updated.
+"""
+
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from src.infrastructure.observability.metrics import db_pool_wait, db_query_duration, password_hashing_duration
+
+STATEMENT_MAX_LENGTH = 1000
+
+
+@dataclass
+class RequestStats:
+    """Time and work attributed to a single request."""
+
+    max_statements: int = 50
+    query_count: int = 0
+    query_seconds: float = 0.0
+    pool_wait_seconds: float = 0.0
+    hashing_seconds: float = 0.0
+    statements: list[tuple[float, str]] = field(default_factory=list)
+
+
+current_request_stats: ContextVar[RequestStats | None] = ContextVar("current_request_stats", default=None)
+
+
+def record_query(statement: str, elapsed: float) -> None:
+    """Record one executed database statement."""
+    db_query_duration.observe(elapsed)
+    stats = current_request_stats.get()
+    if stats is None:
+        return
+    stats.query_count += 1
+    stats.query_seconds += elapsed
+    if len(stats.statements) < stats.max_statements:
+        stats.statements.append((elapsed, statement[:STATEMENT_MAX_LENGTH]))
+
+
+def record_pool_wait(elapsed: float) -> None:
+    """Record time spent waiting for a pooled connection."""
+    db_pool_wait.observe(elapsed)
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.pool_wait_seconds += elapsed
+
+
+def record_hashing(operation: str, elapsed: float) -> None:
+    """Record time spent on a password hashing job."""
+    password_hashing_duration.observe(elapsed, operation=operation)
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.hashing_seconds += elapsed
@@ -0,0 +1,36 @@
+"""SQLAlchemy engine event listeners feeding the request stats and metrics."""
+
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.observability.request_stats import record_query
+
+_QUERY_STARTED = "query_started"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_QUERY_STARTED, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info[_QUERY_STARTED].pop()
+    record_query(statement, time.perf_counter() - started)
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute; account for it here
+    conn = exception_context.connection
+    if conn is not None and conn.info.get(_QUERY_STARTED):
+        started = conn.info[_QUERY_STARTED].pop()
+        record_query(exception_context.statement or "", time.perf_counter() - started)
+
+
+def instrument_engine(engine: AsyncEngine | Engine) -> None:
+    """Time every statement executed through ``engine``."""
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
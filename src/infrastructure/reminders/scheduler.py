@@ -0,0 +1,83 @@
+"""Background loop driving ``ReminderService``.
+
+While batches come back full the next one is claimed right away, so a
+backlog drains at full speed; once a batch comes back short the loop sleeps
+for the poll interval. Any number of schedulers can run at once, in web
+workers or in dedicated processes: the claim skips rows locked by others.
+"""
+
+import asyncio
+import logging
+from datetime import timedelta
+
+from src.application.services.reminder_service import ReminderService
+from src.config.settings import ReminderSettings
+from src.infrastructure.database.unit_of_work import UnitOfWork
+from src.infrastructure.observability.metrics import reminders_total
+from src.infrastructure.reminders.senders import LoggingReminderSender
+from src.infrastructure.repositories.reminder_repository import ReminderRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ReminderScheduler:
+    """Polls for due reminders until stopped."""
+
+    def __init__(self, service: ReminderService, poll_seconds: float = 30):
+        """Initialize reminder scheduler.
+
+        Args:
+            service: Service claiming and sending the batches
+            poll_seconds: Pause after a batch that was not full
+        """
+        self.service = service
+        self.poll_seconds = poll_seconds
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @classmethod
+    def from_settings(cls, reminders: ReminderSettings, service: ReminderService | None = None) -> "ReminderScheduler":
+        service = service or ReminderService(
+            reminder_repository=ReminderRepository(),
+            sender=LoggingReminderSender(),
+            unit_of_work_factory=UnitOfWork,
+            lead_time=timedelta(minutes=reminders.REMINDER_LEAD_MINUTES),
+            batch_size=reminders.REMINDER_BATCH_SIZE,
+            send_concurrency=reminders.REMINDER_SEND_CONCURRENCY,
+            send_timeout_seconds=reminders.REMINDER_SEND_TIMEOUT_SECONDS,
+            retry_delay=timedelta(seconds=reminders.REMINDER_RETRY_SECONDS),
+            max_attempts=reminders.REMINDER_MAX_ATTEMPTS,
+        )
+        return cls(service=service, poll_seconds=reminders.REMINDER_POLL_SECONDS)
+
+    async def run(self) -> None:
+        """Process batches until ``stop`` is called."""
+        while not self._stopping.is_set():
+            try:
+                result = await self.service.send_due_reminders()
+            except Exception:
+                logger.exception("Reminder batch failed")
+                full = False
+            else:
+                reminders_total.inc(result.sent, outcome="sent")
+                reminders_total.inc(result.failed, outcome="failed")
+                # Don't spin on a full batch that keeps failing
+                full = result.claimed >= self.service.batch_size and result.sent > 0
+            if not full:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        """Run the loop as a background task of the current event loop."""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self.run(), name="reminder-scheduler")
+
+    async def stop(self) -> None:
+        """Finish the batch in progress, then stop."""
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
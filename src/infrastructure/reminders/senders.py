@@ -0,0 +1,48 @@
+"""Reminder senders.
+
+``LoggingReminderSender`` is the default until a real delivery channel
+(e-mail or SMS provider) is plugged in through ``AbstractReminderSender``;
+``InMemoryReminderSender`` collects reminders for tests and local runs.
+"""
+
+import asyncio
+import logging
+
+from src.application.interfaces.reminder_sender import AbstractReminderSender
+from src.application.schemas.reminder import AppointmentReminder
+
+logger = logging.getLogger(__name__)
+
+
+class LoggingReminderSender(AbstractReminderSender):
+    """Sender writing every reminder to the log."""
+
+    async def send(self, reminder: AppointmentReminder) -> None:
+        logger.info(
+            "Reminder for appointment %s at %s to %s",
+            reminder.appointment_id,
+            reminder.appointment_start.isoformat(),
+            reminder.customer_email or reminder.customer_phone,
+        )
+
+
+class InMemoryReminderSender(AbstractReminderSender):
+    """Sender keeping reminders in a list, optionally slow or failing."""
+
+    def __init__(self, delay_seconds: float = 0.0, fail: bool = False):
+        """Initialize in-memory sender.
+
+        Args:
+            delay_seconds: Simulated delivery latency
+            fail: Raise on every send
+        """
+        self.delay_seconds = delay_seconds
+        self.fail = fail
+        self.sent: list[AppointmentReminder] = []
+
+    async def send(self, reminder: AppointmentReminder) -> None:
+        if self.delay_seconds:
+            await asyncio.sleep(self.delay_seconds)
+        if self.fail:
+            raise RuntimeError("Reminder delivery failed")
+        self.sent.append(reminder)
@@ -0,0 +1,139 @@
+from datetime import date, datetime, time, timedelta
+from uuid import UUID
+
+from sqlalchemy import Date, Integer, and_, cast, func, insert, literal, select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.analytics_repository import AbstractAnalyticsRepository
+from src.application.schemas.analytics import DailyStatusTotals, StaffBookedTotals
+from src.domain.enums import AppointmentStatus
+from src.infrastructure.database import Appointment, AppointmentDailyStats, Staff
+from src.infrastructure.database.session_manager import provide_async_session
+
+# Rollup key of appointments without a staff member
+UNASSIGNED_STAFF_ID = UUID(int=0)
+
+ROLLUP_COLUMNS = (
+    AppointmentDailyStats.id,
+    AppointmentDailyStats.company_id,
+    AppointmentDailyStats.staff_id,
+    AppointmentDailyStats.day,
+    AppointmentDailyStats.status,
+    AppointmentDailyStats.booking_count,
+    AppointmentDailyStats.revenue,
+    AppointmentDailyStats.booked_minutes,
+)
+
+
+class AnalyticsRepository(AbstractAnalyticsRepository):
+    """Repository implementation for the appointment rollups.
+    
+    ``appointment_daily_stats`` holds one row per company, day, staff member
+    and status. Triggers on appointments apply every insert, delete and
+    change of status, staff, time or price as a -1/+1 delta in the same
+    transaction, using the price stored on the appointment, so reads cover a
+    handful of rows per day no matter how much history the company has.
+    
+    Every delta takes a shared advisory lock keyed by company and day
+    (``appointment_daily_stats_lock_key``); reconciliation takes the same key
+    exclusively, so it waits for writers that already touched those rollups
+    and queues new ones behind the rebuild. Bookings of other companies and
+    days are never blocked, and no delta is lost or counted twice.
+    """
+
+    @provide_async_session(read_only=True)
+    async def get_daily_totals(
+        self, company_id: UUID, date_from: date, date_to: date, session: AsyncSession
+    ) -> list[DailyStatusTotals]:
+        stmt = (
+            select(
+                AppointmentDailyStats.day,
+                AppointmentDailyStats.status,
+                func.sum(AppointmentDailyStats.booking_count),
+                func.sum(AppointmentDailyStats.revenue),
+                func.sum(AppointmentDailyStats.booked_minutes),
+            )
+            .where(
+                AppointmentDailyStats.company_id == company_id,
+                AppointmentDailyStats.day >= date_from,
+                AppointmentDailyStats.day <= date_to,
+            )
+            .group_by(AppointmentDailyStats.day, AppointmentDailyStats.status)
+            .order_by(AppointmentDailyStats.day)
+        )
+        result = await session.execute(stmt)
+        return [DailyStatusTotals(*row) for row in result]
+
+    @provide_async_session(read_only=True)
+    async def get_staff_booked_totals(
+        self, company_id: UUID, date_from: date, date_to: date, session: AsyncSession
+    ) -> list[StaffBookedTotals]:
+        stmt = (
+            select(
+                Staff.id,
+                func.coalesce(func.sum(AppointmentDailyStats.booking_count), 0),
+                func.coalesce(func.sum(AppointmentDailyStats.booked_minutes), 0),
+            )
+            .select_from(Staff)
+            .outerjoin(
+                AppointmentDailyStats,
+                and_(
+                    AppointmentDailyStats.company_id == company_id,
+                    AppointmentDailyStats.day >= date_from,
+                    AppointmentDailyStats.day <= date_to,
+                    AppointmentDailyStats.staff_id == Staff.id,
+                    AppointmentDailyStats.status != AppointmentStatus.CANCELED,
+                ),
+            )
+            .where(Staff.company_id == company_id)
+            .group_by(Staff.id)
+            .order_by(Staff.id)
+        )
+        result = await session.execute(stmt)
+        return [StaffBookedTotals(*row) for row in result]
+
+    @provide_async_session(read_only=True)
+    async def get_company_ids_for_day(self, day: date, session: AsyncSession) -> list[UUID]:
+        day_start = datetime.combine(day, time.min)
+        stmt = union(
+            select(Appointment.company_id).where(
+                Appointment.appointment_start >= day_start,
+                Appointment.appointment_start < day_start + timedelta(days=1),
+            ),
+            select(AppointmentDailyStats.company_id).where(AppointmentDailyStats.day == day),
+        )
+        result = await session.execute(stmt)
+        return list(result.scalars())
+
+    @provide_async_session
+    async def reconcile_day(self, company_id: UUID, day: date, session: AsyncSession) -> int:
+        await session.execute(select(func.pg_advisory_xact_lock(func.appointment_daily_stats_lock_key(company_id, day))))
+
+        await session.execute(
+            AppointmentDailyStats.__table__.delete().where(
+                AppointmentDailyStats.company_id == company_id, AppointmentDailyStats.day == day
+            )
+        )
+
+        day_start = datetime.combine(day, time.min)
+        minutes = cast(func.extract("epoch", Appointment.appointment_end - Appointment.appointment_start) / 60, Integer)
+        totals = (
+            select(
+                func.gen_random_uuid(),
+                Appointment.company_id,
+                func.coalesce(Appointment.staff_id, UNASSIGNED_STAFF_ID),
+                literal(day, Date),
+                Appointment.status,
+                func.count(),
+                func.coalesce(func.sum(Appointment.price), 0),
+                func.sum(minutes),
+            )
+            .where(
+                Appointment.company_id == company_id,
+                Appointment.appointment_start >= day_start,
+                Appointment.appointment_start < day_start + timedelta(days=1),
+            )
+            .group_by(Appointment.company_id, Appointment.staff_id, Appointment.status)
+        )
+        result = await session.execute(insert(AppointmentDailyStats).from_select(ROLLUP_COLUMNS, totals))
+        return result.rowcount
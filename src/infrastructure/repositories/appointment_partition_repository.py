@@ -0,0 +1,64 @@
+from datetime import date, datetime
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.appointment_partition_repository import AbstractAppointmentPartitionRepository
+from src.config import settings
+from src.infrastructure.database import Appointment
+from src.infrastructure.database.session_manager import provide_async_session
+
+ARCHIVE_SCHEMA = "archive"
+
+# Partition names are set by create_appointments_partition() (migration 00006)
+PARTITION_NAME_FORMAT = f"{Appointment.__tablename__}_%Y_%m"
+
+
+class AppointmentPartitionRepository(AbstractAppointmentPartitionRepository):
+    """Repository implementation for the monthly partitions of the appointments table.
+    
+    Creating or detaching a partition locks the whole appointments table, so
+    every change runs in its own short transaction with a lock timeout:
+    behind a long-running query the DDL fails and can be retried instead of
+    holding up bookings queued after it.
+    """
+
+    def __init__(self, lock_timeout_seconds: float = settings.partitions.APPOINTMENT_PARTITION_LOCK_TIMEOUT_SECONDS):
+        self.lock_timeout_seconds = lock_timeout_seconds
+
+    async def _set_lock_timeout(self, session: AsyncSession) -> None:
+        await session.execute(
+            select(func.set_config("lock_timeout", f"{int(self.lock_timeout_seconds * 1000)}ms", True))
+        )
+
+    @provide_async_session
+    async def create_partitions(self, month_from: date, month_to: date, *, session: AsyncSession) -> list[str]:
+        await self._set_lock_timeout(session)
+        result = await session.execute(
+            text(
+                "SELECT create_appointments_partition(month::date) "
+                "FROM generate_series(date_trunc('month', CAST(:month_from AS date)), "
+                "CAST(:month_to AS date), interval '1 month') AS month"
+            ),
+            {"month_from": month_from, "month_to": month_to},
+        )
+        return [name for name in result.scalars() if name is not None]
+
+    @provide_async_session(read_only=True)
+    async def list_partitions(self, session: AsyncSession) -> dict[str, date]:
+        result = await session.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = CAST(:parent AS regclass) ORDER BY child.relname"
+            ),
+            {"parent": Appointment.__tablename__},
+        )
+        return {name: datetime.strptime(name, PARTITION_NAME_FORMAT).date() for name in result.scalars()}
+
+    @provide_async_session
+    async def archive_partition(self, name: str, *, session: AsyncSession) -> None:
+        await self._set_lock_timeout(session)
+        quote = session.get_bind().dialect.identifier_preparer.quote
+        await session.execute(text(f"ALTER TABLE {Appointment.__tablename__} DETACH PARTITION {quote(name)}"))
+        await session.execute(text(f"ALTER TABLE {quote(name)} SET SCHEMA {ARCHIVE_SCHEMA}"))
@@ -0,0 +1,141 @@
+from datetime import datetime
+from typing import AsyncIterator
+from uuid import UUID
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from src.application.interfaces.appointment_repository import AbstractAppointmentRepository
+from src.application.schemas.appointment_export import AppointmentExportRow
+from src.domain.entities import DomainAppointment
+from src.domain.exceptions import AppointmentConflict, BusinessRuleViolation, ObjectNotFound
+from src.infrastructure.database import Appointment, Staff, StaffService, User
+from src.infrastructure.database.session_manager import create_async_session, provide_async_session
+from src.infrastructure.repositories.mapping import entity_columns, rows_to_entities
+from src.infrastructure.repositories.pagination import paginate
+
+# SQLSTATEs raised by Postgres when an exclusion or a foreign key constraint is violated, and when a check
+# constraint is or no partition covers the row
+EXCLUSION_VIOLATION = "23P01"
+FOREIGN_KEY_VIOLATION = "23503"
+CHECK_VIOLATION = "23514"
+
+APPOINTMENT_COLUMNS = entity_columns(Appointment, DomainAppointment)
+
+# Rows fetched from the server-side cursor per round trip when exporting
+EXPORT_FETCH_SIZE = 1000
+
+StaffUser = aliased(User, name="staff_user")
+Customer = aliased(User, name="customer")
+
+# In the field order of AppointmentExportRow
+EXPORT_COLUMNS = (
+    Appointment.id,
+    Appointment.appointment_start,
+    Appointment.appointment_end,
+    Appointment.status,
+    StaffService.name,
+    Appointment.price,
+    StaffUser.first_name,
+    StaffUser.last_name,
+    Customer.first_name,
+    Customer.last_name,
+)
+
+
+class AppointmentRepository(AbstractAppointmentRepository):
+    """Repository implementation for Appointment domain entity.
+    
+    Double booking is prevented by the per-partition
+    ``ex_appointments_YYYY_MM_staff_overlap`` exclusion constraints, so
+    inserts need no locking on the application side. Queries bounded on
+    ``appointment_start`` only touch the partitions of those months.
+    """
+
+    @provide_async_session
+    async def create_appointment(self, appointment: DomainAppointment, session: AsyncSession) -> DomainAppointment:
+        """Insert an appointment, mapping constraint violations to domain exceptions.
+        
+        Args:
+            appointment: Appointment domain entity to create
+            session: Database session
+            
+        Returns:
+            Created Appointment domain entity with generated timestamps
+            
+        Raises:
+            AppointmentConflict: If the staff member already has an overlapping booking
+            ObjectNotFound: If the user, or a concurrently deleted staff member or service, does not exist
+            BusinessRuleViolation: If no partition has been created for the appointment's month yet
+        """
+        stmt = (
+            insert(Appointment)
+            .values(
+                id=appointment.id,
+                company_id=appointment.company_id,
+                staff_id=appointment.staff_id,
+                user_id=appointment.user_id,
+                service_id=appointment.service_id,
+                appointment_start=appointment.appointment_start,
+                appointment_end=appointment.appointment_end,
+                status=appointment.status,
+                price=appointment.price,
+            )
+            .returning(Appointment.created_at, Appointment.updated_at)
+        )
+        try:
+            result = await session.execute(stmt)
+        except IntegrityError as e:
+            sqlstate = getattr(e.orig, "sqlstate", None)
+            if sqlstate == EXCLUSION_VIOLATION:
+                raise AppointmentConflict("Staff member is already booked at this time.") from e
+            if sqlstate == FOREIGN_KEY_VIOLATION:
+                # The driver's own exception carries the constraint name, that of the partition's copy
+                constraint = getattr(e.orig.__cause__, "constraint_name", None) or ""
+                if constraint.endswith("user_id_fkey"):
+                    raise ObjectNotFound(f"User with id {appointment.user_id} not found.") from e
+                raise ObjectNotFound("Company, staff member or service of the appointment not found.") from e
+            if sqlstate == CHECK_VIOLATION:
+                raise BusinessRuleViolation("Appointments are not taken for this month yet.") from e
+            raise
+
+        row = result.one()
+        appointment.created_at = row.created_at
+        appointment.updated_at = row.updated_at
+        return appointment
+
+    @provide_async_session(read_only=True)
+    async def list_appointments(
+        self, limit: int, cursor: str | None = None, company_id: UUID | None = None, *, session: AsyncSession
+    ) -> tuple[list[DomainAppointment], str | None]:
+        stmt = select(*APPOINTMENT_COLUMNS)
+        if company_id is not None:
+            stmt = stmt.where(Appointment.company_id == company_id)
+        rows, next_cursor = await paginate(session, stmt, Appointment, limit=limit, cursor=cursor)
+        return rows_to_entities(DomainAppointment, rows), next_cursor
+
+    async def stream_export_rows(
+        self, company_id: UUID, start_from: datetime, start_to: datetime
+    ) -> AsyncIterator[AppointmentExportRow]:
+        stmt = (
+            select(*EXPORT_COLUMNS)
+            .outerjoin(StaffService, StaffService.id == Appointment.service_id)
+            .outerjoin(Staff, Staff.id == Appointment.staff_id)
+            .outerjoin(StaffUser, StaffUser.id == Staff.user_id)
+            .outerjoin(Customer, Customer.id == Appointment.user_id)
+            .where(
+                Appointment.company_id == company_id,
+                Appointment.appointment_start >= start_from,
+                Appointment.appointment_start < start_to,
+            )
+            .order_by(Appointment.appointment_start, Appointment.id)
+            .execution_options(yield_per=EXPORT_FETCH_SIZE)
+        )
+        # Own session rather than the request's: the generator is consumed while the response is sent
+        async with create_async_session(read_only=True) as session:
+            result = await session.stream(stmt)
+            async for partition in result.partitions():
+                for row in partition:
+                    yield AppointmentExportRow(*row)
@@ -0,0 +1,52 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.availability_repository import AbstractAvailabilityRepository, BusyInterval
+from src.domain.entities import DomainStaffService, DomainWorkingHours
+from src.domain.enums import AppointmentStatus
+from src.infrastructure.database import Appointment, StaffService, WorkingHours
+from src.infrastructure.database.session_manager import provide_async_session
+from src.infrastructure.repositories.mapping import entity_columns, matches_any, row_to_entity, rows_to_entities
+from src.infrastructure.repositories.staff_service_repository import STAFF_SERVICE_COLUMNS
+
+WORKING_HOURS_COLUMNS = entity_columns(WorkingHours, DomainWorkingHours)
+
+
+class AvailabilityRepository(AbstractAvailabilityRepository):
+    """Repository implementation for availability search data."""
+
+    @provide_async_session(read_only=True)
+    async def get_staff_service(self, service_id: UUID, session: AsyncSession) -> DomainStaffService | None:
+        result = await session.execute(select(*STAFF_SERVICE_COLUMNS).where(StaffService.id == service_id))
+        row = result.one_or_none()
+        return row_to_entity(DomainStaffService, row) if row is not None else None
+
+    @provide_async_session(read_only=True)
+    async def get_working_hours(self, staff_ids: list[UUID], session: AsyncSession) -> list[DomainWorkingHours]:
+        stmt = select(*WORKING_HOURS_COLUMNS).where(matches_any(WorkingHours.staff_id, staff_ids))
+        result = await session.execute(stmt)
+        return rows_to_entities(DomainWorkingHours, result)
+
+    @provide_async_session(read_only=True)
+    async def get_busy_intervals(
+        self, staff_ids: list[UUID], range_start: datetime, range_end: datetime, session: AsyncSession
+    ) -> list[BusyInterval]:
+        # Only the three columns the sweep needs; no ORM objects are built.
+        # ck_appointments_within_month means nothing starting before range_start's month can overlap,
+        # and the lower bound on the partition key lets the planner skip every older partition.
+        stmt = (
+            select(Appointment.staff_id, Appointment.appointment_start, Appointment.appointment_end)
+            .where(
+                matches_any(Appointment.staff_id, staff_ids),
+                Appointment.status != AppointmentStatus.CANCELED,
+                Appointment.appointment_start >= range_start.replace(day=1, hour=0, minute=0, second=0, microsecond=0),
+                Appointment.appointment_start < range_end,
+                Appointment.appointment_end > range_start,
+            )
+            .order_by(Appointment.staff_id, Appointment.appointment_start)
+        )
+        result = await session.execute(stmt)
+        return [(row.staff_id, row.appointment_start, row.appointment_end) for row in result]
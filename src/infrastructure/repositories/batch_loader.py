@@ -0,0 +1,115 @@
+"""DataLoader-style batching of single-key lookups.
+
+A lookup that finds the loader idle runs its query right away, in the
+caller's own coroutine, so a lone ``get_*`` costs no more than calling the
+repository. Lookups arriving while a query is in flight (concurrent callers,
+e.g. ``asyncio.gather``) queue up and are answered together by the next
+call of the batch function, which repositories implement with a single
+``WHERE key = ANY(:keys)`` query; ``load_many`` hands all its keys over at
+once. Batches run one after the other, never concurrently, so they can
+share the request's session. Results are cached by key for the lifetime of
+the loader, so a key is fetched at most once; loaders are created per
+repository instance, and repositories per request.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, Iterable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """Coalesce concurrent single-key lookups into batched calls."""
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[K]], Awaitable[dict[K, V]]],
+        max_batch_size: int = 500,
+        cache: bool = True,
+    ):
+        """Initialize batch loader.
+
+        Args:
+            batch_fn: Coroutine loading a mapping of key to value for a list of keys
+            max_batch_size: Maximum number of keys passed to one ``batch_fn`` call
+            cache: Whether results are kept and reused for repeated keys
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.cache = cache
+        self._futures: dict[K, asyncio.Future] = {}
+        self._queue: list[tuple[K, asyncio.Future]] = []
+        self._draining = False
+        # Only set when a cancelled caller hands its queue over
+        self._runner: asyncio.Task | None = None
+
+    def _future(self, key: K) -> asyncio.Future:
+        future = self._futures.get(key) if self.cache else None
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            if self.cache:
+                self._futures[key] = future
+            self._queue.append((key, future))
+        return future
+
+    async def load(self, key: K) -> V | None:
+        """Value for ``key``, or None if the batch function returned nothing for it."""
+        future = self._future(key)
+        if self._queue and not self._draining:
+            await self._drain()
+        return await future
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        """Values for ``keys`` in order, loaded in as few batches as possible."""
+        futures = [self._future(key) for key in keys]
+        if self._queue and not self._draining:
+            await self._drain()
+        return [await future for future in futures]
+
+    def prime(self, key: K, value: V) -> None:
+        """Seed the cache with a known value, e.g. a freshly written entity."""
+        if not self.cache:
+            return
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._futures[key] = future
+
+    def clear(self, key: K) -> None:
+        """Forget the cached value of ``key``."""
+        self._futures.pop(key, None)
+
+    def clear_all(self) -> None:
+        self._futures.clear()
+
+    async def _drain(self) -> None:
+        self._draining = True
+        try:
+            while self._queue:
+                batch, self._queue = self._queue[:self.max_batch_size], self._queue[self.max_batch_size:]
+                await self._run_batch(batch)
+        finally:
+            self._draining = False
+            if self._queue:
+                # The caller running the batches was cancelled; the other waiters still need theirs
+                self._runner = asyncio.get_running_loop().create_task(self._drain())
+
+    async def _run_batch(self, batch: list[tuple[K, asyncio.Future]]) -> None:
+        keys = list(dict.fromkeys(key for key, _ in batch))
+        try:
+            values = await self.batch_fn(keys)
+        except asyncio.CancelledError:
+            self._queue[:0] = [(key, future) for key, future in batch if not future.done()]
+            raise
+        except Exception as e:
+            for key, future in batch:
+                # Failures are not cached, the next load retries
+                if self._futures.get(key) is future:
+                    del self._futures[key]
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in batch:
+            if not future.done():
+                future.set_result(values.get(key))
@@ -0,0 +1,120 @@
+"""Batching wrappers around the repositories' single-entity lookups.
+
+Each wrapper implements the same interface as the repository it wraps and
+routes single-key gets through a ``BatchLoader``, so lookups issued
+concurrently within a request (``asyncio.gather`` over many ids, or several
+services resolving the same staff member) share ``= ANY(...)`` queries run
+one at a time on the request's session, and repeated keys are served from
+the loader's per-request cache.
+"""
+
+from uuid import UUID
+
+from src.application.interfaces.company_repository import AbstractCompanyRepository
+from src.application.interfaces.staff_repository import AbstractStaffRepository
+from src.application.interfaces.staff_service_repository import AbstractStaffServiceRepository
+from src.application.interfaces.user_repository import AbstractUserRepository
+from src.domain.entities import DomainCompany, DomainStaff, DomainStaffService, DomainUser
+from src.infrastructure.repositories.batch_loader import BatchLoader
+
+
+class BatchingUserRepository(AbstractUserRepository):
+    """User repository batching get_user lookups by email."""
+
+    def __init__(self, repository: AbstractUserRepository):
+        self.repository = repository
+        self._by_email: BatchLoader[str, DomainUser] = BatchLoader(self._load_by_email)
+
+    async def _load_by_email(self, emails: list[str]) -> dict[str, DomainUser]:
+        return {user.email: user for user in await self.repository.get_users_by_email(emails=emails)}
+
+    async def create_user(self, user: DomainUser) -> DomainUser:
+        created_user = await self.repository.create_user(user)
+        self._by_email.prime(created_user.email, created_user)
+        return created_user
+
+    async def get_user(self, email: str) -> DomainUser | None:
+        return await self._by_email.load(email)
+
+    async def get_users_by_email(self, emails: list[str]) -> list[DomainUser]:
+        return [user for user in await self._by_email.load_many(emails) if user is not None]
+
+    async def register_user(self, user: DomainUser) -> DomainUser:
+        registered_user = await self.repository.register_user(user)
+        self._by_email.prime(registered_user.email, registered_user)
+        return registered_user
+
+    async def email_exists(self, email: str) -> bool:
+        return await self.repository.email_exists(email=email)
+
+    async def list_users(self, limit: int, cursor: str | None = None) -> tuple[list[DomainUser], str | None]:
+        return await self.repository.list_users(limit=limit, cursor=cursor)
+
+
+class BatchingCompanyRepository(AbstractCompanyRepository):
+    """Company repository batching get_company lookups."""
+
+    def __init__(self, repository: AbstractCompanyRepository):
+        self.repository = repository
+        self._by_id: BatchLoader[UUID, DomainCompany] = BatchLoader(self._load_by_id)
+
+    async def _load_by_id(self, company_ids: list[UUID]) -> dict[UUID, DomainCompany]:
+        companies = await self.repository.get_companies_by_ids(company_ids=company_ids)
+        return {company.id: company for company in companies}
+
+    async def get_company(self, company_id: UUID) -> DomainCompany | None:
+        return await self._by_id.load(company_id)
+
+    async def get_companies_by_ids(self, company_ids: list[UUID]) -> list[DomainCompany]:
+        return [company for company in await self._by_id.load_many(company_ids) if company is not None]
+
+    async def list_companies(self, limit: int, cursor: str | None = None) -> tuple[list[DomainCompany], str | None]:
+        return await self.repository.list_companies(limit=limit, cursor=cursor)
+
+
+class BatchingStaffRepository(AbstractStaffRepository):
+    """Staff repository batching get_staff lookups."""
+
+    def __init__(self, repository: AbstractStaffRepository):
+        self.repository = repository
+        self._by_id: BatchLoader[UUID, DomainStaff] = BatchLoader(self._load_by_id)
+
+    async def _load_by_id(self, staff_ids: list[UUID]) -> dict[UUID, DomainStaff]:
+        return {member.id: member for member in await self.repository.get_staff_by_ids(staff_ids=staff_ids)}
+
+    async def get_staff(self, staff_id: UUID) -> DomainStaff | None:
+        return await self._by_id.load(staff_id)
+
+    async def get_staff_by_ids(self, staff_ids: list[UUID]) -> list[DomainStaff]:
+        return [member for member in await self._by_id.load_many(staff_ids) if member is not None]
+
+    async def list_staff(
+        self, limit: int, cursor: str | None = None, company_id: UUID | None = None
+    ) -> tuple[list[DomainStaff], str | None]:
+        return await self.repository.list_staff(limit=limit, cursor=cursor, company_id=company_id)
+
+    async def list_top_rated_staff(self, company_id: UUID, limit: int) -> list[DomainStaff]:
+        return await self.repository.list_top_rated_staff(company_id=company_id, limit=limit)
+
+
+class BatchingStaffServiceRepository(AbstractStaffServiceRepository):
+    """Staff service repository batching get_service lookups."""
+
+    def __init__(self, repository: AbstractStaffServiceRepository):
+        self.repository = repository
+        self._by_id: BatchLoader[UUID, DomainStaffService] = BatchLoader(self._load_by_id)
+
+    async def _load_by_id(self, service_ids: list[UUID]) -> dict[UUID, DomainStaffService]:
+        services = await self.repository.get_services_by_ids(service_ids=service_ids)
+        return {service.id: service for service in services}
+
+    async def get_service(self, service_id: UUID) -> DomainStaffService | None:
+        return await self._by_id.load(service_id)
+
+    async def get_services_by_ids(self, service_ids: list[UUID]) -> list[DomainStaffService]:
+        return [service for service in await self._by_id.load_many(service_ids) if service is not None]
+
+    async def list_services(
+        self, limit: int, cursor: str | None = None, staff_id: UUID | None = None
+    ) -> tuple[list[DomainStaffService], str | None]:
+        return await self.repository.list_services(limit=limit, cursor=cursor, staff_id=staff_id)
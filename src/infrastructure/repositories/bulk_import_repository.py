@@ -0,0 +1,61 @@
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.bulk_import_repository import AbstractBulkImportRepository
+from src.application.schemas.bulk_import import ImportEntity
+from src.infrastructure.database import Appointment, Staff, StaffService, User
+from src.infrastructure.database.session_manager import provide_async_session
+
+_MODELS = {
+    ImportEntity.USERS: User,
+    ImportEntity.STAFF: Staff,
+    ImportEntity.SERVICES: StaffService,
+    ImportEntity.APPOINTMENTS: Appointment,
+}
+
+CONFLICT_MESSAGE = "Conflicts with an existing record"
+
+
+def _error_message(error: DBAPIError) -> str:
+    """First line of the driver error, without the SQL and parameters."""
+    return str(error.orig).splitlines()[0]
+
+
+class BulkImportRepository(AbstractBulkImportRepository):
+    """Repository implementation for bulk imports.
+    
+    A chunk is written with one multi-row ``INSERT ... ON CONFLICT DO NOTHING
+    RETURNING id``; rows missing from RETURNING hit a unique or exclusion
+    constraint. Only when the chunk fails as a whole (e.g. a foreign key
+    violation) is it retried row by row under savepoints to isolate the bad rows.
+    Without an active unit of work every chunk is committed on its own.
+    """
+
+    @provide_async_session
+    async def insert_rows(self, entity: ImportEntity, rows: list[dict], session: AsyncSession) -> list[str | None]:
+        if not rows:
+            return []
+
+        model = _MODELS[entity]
+        stmt = insert(model).on_conflict_do_nothing().returning(model.id)
+        try:
+            async with session.begin_nested():
+                result = await session.execute(stmt, rows)
+                inserted = set(result.scalars())
+            errors = [None if row["id"] in inserted else CONFLICT_MESSAGE for row in rows]
+        except DBAPIError:
+            errors = await self._insert_one_by_one(model, rows, session)
+        return errors
+
+    async def _insert_one_by_one(self, model, rows: list[dict], session: AsyncSession) -> list[str | None]:
+        errors = []
+        for row in rows:
+            stmt = insert(model).values(**row).on_conflict_do_nothing().returning(model.id)
+            try:
+                async with session.begin_nested():
+                    result = await session.execute(stmt)
+                    errors.append(None if result.scalar_one_or_none() is not None else CONFLICT_MESSAGE)
+            except DBAPIError as e:
+                errors.append(_error_message(e))
+        return errors
@@ -0,0 +1,136 @@
+"""Read-through caching wrappers around the catalog repositories.
+
+Each wrapper implements the same interface as the repository it wraps and
+serves single-entity reads from ``CatalogCache``; listings and anything
+time-dependent (appointments) always go to the wrapped repository.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from uuid import UUID
+
+from src.application.interfaces.availability_repository import AbstractAvailabilityRepository, BusyInterval
+from src.application.interfaces.company_repository import AbstractCompanyRepository
+from src.application.interfaces.staff_repository import AbstractStaffRepository
+from src.application.interfaces.staff_service_repository import AbstractStaffServiceRepository
+from src.domain.entities import DomainCompany, DomainStaff, DomainStaffService, DomainWorkingHours
+from src.infrastructure.cache.catalog_cache import (
+    COMPANY,
+    STAFF,
+    STAFF_SERVICE,
+    WORKING_HOURS,
+    CatalogCache,
+    catalog_cache,
+)
+
+
+class CachedCompanyRepository(AbstractCompanyRepository):
+    """Company repository serving get_company from the catalog cache."""
+
+    def __init__(self, repository: AbstractCompanyRepository, cache: CatalogCache = catalog_cache):
+        self.repository = repository
+        self.cache = cache
+
+    async def get_company(self, company_id: UUID) -> DomainCompany | None:
+        return await self.cache.get_or_load(
+            COMPANY, company_id, lambda: self.repository.get_company(company_id=company_id)
+        )
+
+    async def get_companies_by_ids(self, company_ids: list[UUID]) -> list[DomainCompany]:
+        async def load(missing_ids: list[UUID]) -> dict[UUID, DomainCompany]:
+            companies = await self.repository.get_companies_by_ids(company_ids=missing_ids)
+            return {company.id: company for company in companies}
+
+        return list((await self.cache.get_many_or_load(COMPANY, company_ids, load)).values())
+
+    async def list_companies(self, limit: int, cursor: str | None = None) -> tuple[list[DomainCompany], str | None]:
+        return await self.repository.list_companies(limit=limit, cursor=cursor)
+
+
+class CachedStaffRepository(AbstractStaffRepository):
+    """Staff repository serving get_staff from the catalog cache.
+
+    Meant for lookups of company and role on the booking path. The rating
+    fields of cached members can lag behind the reviews; anything showing
+    ratings reads through the wrapped repository instead.
+    """
+
+    def __init__(self, repository: AbstractStaffRepository, cache: CatalogCache = catalog_cache):
+        self.repository = repository
+        self.cache = cache
+
+    async def get_staff(self, staff_id: UUID) -> DomainStaff | None:
+        return await self.cache.get_or_load(STAFF, staff_id, lambda: self.repository.get_staff(staff_id=staff_id))
+
+    async def get_staff_by_ids(self, staff_ids: list[UUID]) -> list[DomainStaff]:
+        async def load(missing_ids: list[UUID]) -> dict[UUID, DomainStaff]:
+            return {member.id: member for member in await self.repository.get_staff_by_ids(staff_ids=missing_ids)}
+
+        return list((await self.cache.get_many_or_load(STAFF, staff_ids, load)).values())
+
+    async def list_staff(
+        self, limit: int, cursor: str | None = None, company_id: UUID | None = None
+    ) -> tuple[list[DomainStaff], str | None]:
+        return await self.repository.list_staff(limit=limit, cursor=cursor, company_id=company_id)
+
+    async def list_top_rated_staff(self, company_id: UUID, limit: int) -> list[DomainStaff]:
+        return await self.repository.list_top_rated_staff(company_id=company_id, limit=limit)
+
+
+class CachedStaffServiceRepository(AbstractStaffServiceRepository):
+    """Staff service repository serving get_service from the catalog cache."""
+
+    def __init__(self, repository: AbstractStaffServiceRepository, cache: CatalogCache = catalog_cache):
+        self.repository = repository
+        self.cache = cache
+
+    async def get_service(self, service_id: UUID) -> DomainStaffService | None:
+        return await self.cache.get_or_load(
+            STAFF_SERVICE, service_id, lambda: self.repository.get_service(service_id=service_id)
+        )
+
+    async def get_services_by_ids(self, service_ids: list[UUID]) -> list[DomainStaffService]:
+        async def load(missing_ids: list[UUID]) -> dict[UUID, DomainStaffService]:
+            services = await self.repository.get_services_by_ids(service_ids=missing_ids)
+            return {service.id: service for service in services}
+
+        return list((await self.cache.get_many_or_load(STAFF_SERVICE, service_ids, load)).values())
+
+    async def list_services(
+        self, limit: int, cursor: str | None = None, staff_id: UUID | None = None
+    ) -> tuple[list[DomainStaffService], str | None]:
+        return await self.repository.list_services(limit=limit, cursor=cursor, staff_id=staff_id)
+
+
+class CachedAvailabilityRepository(AbstractAvailabilityRepository):
+    """Availability repository serving services and working hours from the catalog cache.
+
+    Working hours are cached per staff member, including members without any,
+    so repeated searches over the same staff need no working-hours query.
+    """
+
+    def __init__(self, repository: AbstractAvailabilityRepository, cache: CatalogCache = catalog_cache):
+        self.repository = repository
+        self.cache = cache
+
+    async def get_staff_service(self, service_id: UUID) -> DomainStaffService | None:
+        return await self.cache.get_or_load(
+            STAFF_SERVICE, service_id, lambda: self.repository.get_staff_service(service_id=service_id)
+        )
+
+    async def get_working_hours(self, staff_ids: list[UUID]) -> list[DomainWorkingHours]:
+        async def load(missing_ids: list[UUID]) -> dict[UUID, list[DomainWorkingHours]]:
+            by_staff: dict[UUID, list[DomainWorkingHours]] = defaultdict(list)
+            for hours in await self.repository.get_working_hours(staff_ids=missing_ids):
+                by_staff[hours.staff_id].append(hours)
+            return by_staff
+
+        cached = await self.cache.get_many_or_load(WORKING_HOURS, staff_ids, load, default=list)
+        return [hours for staff_hours in cached.values() for hours in staff_hours]
+
+    async def get_busy_intervals(
+        self, staff_ids: list[UUID], range_start: datetime, range_end: datetime
+    ) -> list[BusyInterval]:
+        return await self.repository.get_busy_intervals(
+            staff_ids=staff_ids, range_start=range_start, range_end=range_end
+        )
@@ -0,0 +1,35 @@
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.company_repository import AbstractCompanyRepository
+from src.domain.entities import DomainCompany
+from src.infrastructure.database import Company
+from src.infrastructure.database.session_manager import provide_async_session
+from src.infrastructure.repositories.mapping import entity_columns, matches_any, row_to_entity, rows_to_entities
+from src.infrastructure.repositories.pagination import paginate
+
+COMPANY_COLUMNS = entity_columns(Company, DomainCompany)
+
+
+class CompanyRepository(AbstractCompanyRepository):
+    """Repository implementation for Company domain entity."""
+
+    @provide_async_session(read_only=True)
+    async def list_companies(
+        self, limit: int, cursor: str | None = None, *, session: AsyncSession
+    ) -> tuple[list[DomainCompany], str | None]:
+        rows, next_cursor = await paginate(session, select(*COMPANY_COLUMNS), Company, limit=limit, cursor=cursor)
+        return rows_to_entities(DomainCompany, rows), next_cursor
+
+    @provide_async_session(read_only=True)
+    async def get_company(self, company_id: UUID, session: AsyncSession) -> DomainCompany | None:
+        result = await session.execute(select(*COMPANY_COLUMNS).where(Company.id == company_id))
+        row = result.one_or_none()
+        return row_to_entity(DomainCompany, row) if row is not None else None
+
+    @provide_async_session(read_only=True)
+    async def get_companies_by_ids(self, company_ids: list[UUID], session: AsyncSession) -> list[DomainCompany]:
+        result = await session.execute(select(*COMPANY_COLUMNS).where(matches_any(Company.id, company_ids)))
+        return rows_to_entities(DomainCompany, result)
@@ -0,0 +1,43 @@
+"""Column-level mapping between tables and domain entities.
+
+Read paths select plain columns instead of mapped objects, so rows skip the
+identity map, attribute instrumentation and change tracking of the ORM and go
+straight into the (slotted) domain entity.
+"""
+
+import inspect
+from typing import Any, Iterable, TypeVar
+
+from sqlalchemy import ColumnElement, Row, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+
+EntityT = TypeVar("EntityT")
+
+
+def entity_columns(model: Any, entity_cls: type) -> tuple:
+    """Columns of ``model`` in the order of the ``entity_cls`` constructor arguments.
+
+    Rows selected with these columns can be passed positionally to the entity
+    constructor, see ``rows_to_entities``.
+    """
+    names = [name for name in inspect.signature(entity_cls).parameters]
+    return tuple(getattr(model, name) for name in names)
+
+
+def row_to_entity(entity_cls: type[EntityT], row: Row) -> EntityT:
+    """Build an entity from a row selected with ``entity_columns``."""
+    return entity_cls(*row)
+
+
+def rows_to_entities(entity_cls: type[EntityT], rows: Iterable[Row]) -> list[EntityT]:
+    """Build entities from rows selected with ``entity_columns``."""
+    return [entity_cls(*row) for row in rows]
+
+
+def matches_any(column: Any, values: Iterable) -> ColumnElement[bool]:
+    """``column = ANY(:values)`` with the values bound as one array parameter.
+
+    Unlike ``IN (...)`` the statement text is the same for any number of
+    values, so it is compiled and prepared once.
+    """
+    return column == any_(bindparam(None, list(values), type_=ARRAY(column.type)))
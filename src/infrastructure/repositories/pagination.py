@@ -0,0 +1,156 @@
+"""Keyset pagination shared by the listing repositories.
+
+Pages are ordered newest first by ``(created_at, id)`` and continue from an
+opaque cursor holding the last row's key, instead of using OFFSET. The
+predicate keeps a plain ``created_at <= :cursor`` bound next to the tie-break
+so Postgres can seek ``ix_<table>_created_at``, or for listings filtered by
+a parent the ``(<parent>_id, created_at, id)`` index (migration 00011);
+page N costs the same as page 1. Search results are paged by ``(distance, id)``,
+but there page N does cost N pages, see ``paginate_by_distance``.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Select, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.exceptions import ObjectValidationError
+
+MAX_PAGE_SIZE = 100
+
+
+def _encode(payload: dict) -> str:
+    data = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode(cursor: str) -> dict:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """Build an opaque cursor pointing after the given row key."""
+    return _encode({"c": created_at.isoformat(), "i": str(id)})
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Read the row key from a cursor.
+
+    Raises:
+        ObjectValidationError: If the cursor is malformed
+    """
+    try:
+        payload = _decode(cursor)
+        return datetime.fromisoformat(payload["c"]), UUID(payload["i"])
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+        raise ObjectValidationError("Invalid pagination cursor.")
+
+
+def encode_distance_cursor(distance: float, id: UUID, page: int) -> str:
+    """Build an opaque cursor pointing after the given ranked row key, to the given page number."""
+    return _encode({"d": distance, "i": str(id), "p": page})
+
+
+def decode_distance_cursor(cursor: str) -> tuple[float, UUID, int]:
+    """Read the ranked row key and the page number from a cursor.
+
+    Raises:
+        ObjectValidationError: If the cursor is malformed
+    """
+    try:
+        payload = _decode(cursor)
+        return float(payload["d"]), UUID(payload["i"]), int(payload["p"])
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+        raise ObjectValidationError("Invalid pagination cursor.")
+
+
+async def paginate(
+    session: AsyncSession, stmt: Select, model: Any, limit: int, cursor: str | None = None
+) -> tuple[list[Any], str | None]:
+    """Fetch one page of ``stmt`` ordered by ``(created_at, id)`` descending.
+
+    Args:
+        session: Database session
+        stmt: Select of ``model`` columns (including ``created_at`` and ``id``) with any filters applied
+        model: Mapped class the columns belong to
+        limit: Page size, capped at MAX_PAGE_SIZE
+        cursor: Cursor returned with the previous page
+
+    Returns:
+        Rows of the page and the cursor for the next page, None on the last page
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    if cursor is not None:
+        created_at, id = decode_cursor(cursor)
+        stmt = stmt.where(
+            model.created_at <= created_at,
+            or_(model.created_at < created_at, and_(model.created_at == created_at, model.id < id)),
+        )
+
+    stmt = stmt.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1)
+    result = await session.execute(stmt)
+    rows = result.all()
+
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
+
+
+async def paginate_by_distance(
+    session: AsyncSession,
+    stmt: Select,
+    distance: Any,
+    id: Any,
+    limit: int,
+    cursor: str | None = None,
+    max_pages: int = 10,
+) -> tuple[list[Any], str | None]:
+    """Fetch one page of ``stmt`` ordered by ``(distance, id)`` ascending, best match first.
+
+    With ``distance`` being an index-ordered operator (e.g. pg_trgm's ``<<->``
+    on a GiST column) Postgres walks the index nearest first and stops after
+    the page instead of ranking every match. A distance ordered index can't
+    seek to the cursor, though: the scan starts at the best match again and
+    filters out the rows of the earlier pages, so page N reads N pages of
+    index entries. Results therefore end after ``max_pages`` pages.
+
+    Args:
+        session: Database session
+        stmt: Select whose last column is ``distance``, with any filters applied
+        distance: Distance expression, smaller is better
+        id: Unique tie-break column
+        limit: Page size, capped at MAX_PAGE_SIZE
+        cursor: Cursor returned with the previous page
+        max_pages: Number of pages served for one query
+
+    Returns:
+        Rows of the page and the cursor for the next page, None on the last page
+
+    Raises:
+        ObjectValidationError: If the cursor is malformed or points beyond ``max_pages``
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    page = 1
+    if cursor is not None:
+        last_distance, last_id, page = decode_distance_cursor(cursor)
+        if not 1 < page <= max_pages:
+            raise ObjectValidationError("Invalid pagination cursor.")
+        stmt = stmt.where(
+            distance >= last_distance, or_(distance > last_distance, and_(distance == last_distance, id > last_id))
+        )
+
+    stmt = stmt.order_by(distance, id).limit(limit + 1)
+    result = await session.execute(stmt)
+    rows = result.all()
+
+    if len(rows) <= limit or page >= max_pages:
+        return rows[:limit], None
+    rows = rows[:limit]
+    return rows, encode_distance_cursor(rows[-1][-1], rows[-1]._mapping[id], page + 1)
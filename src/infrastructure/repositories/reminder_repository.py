@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import DateTime, Interval, func, literal, or_, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.reminder_repository import AbstractReminderRepository
+from src.application.schemas.reminder import AppointmentReminder
+from src.domain.enums import AppointmentStatus
+from src.infrastructure.database import Appointment, Staff, StaffService
+from src.infrastructure.database.session_manager import provide_async_session
+from src.infrastructure.repositories.appointment_repository import Customer, StaffUser
+from src.infrastructure.repositories.mapping import matches_any
+
+# In the field order of AppointmentReminder
+REMINDER_COLUMNS = (
+    Appointment.id,
+    Appointment.appointment_start,
+    Appointment.appointment_end,
+    StaffService.name,
+    StaffUser.first_name,
+    StaffUser.last_name,
+    Customer.first_name,
+    Customer.email,
+    Customer.phone,
+)
+
+
+class ReminderRepository(AbstractReminderRepository):
+    """Repository implementation for appointment reminders.
+    
+    Due reminders are found through the partial index
+    ``ix_appointments_status_appointment_start`` (only appointments with
+    ``reminder_sent_at IS NULL``). A claim locks them with ``FOR NO KEY UPDATE
+    SKIP LOCKED``, so concurrent workers never wait on each other, and leases
+    them by counting the attempt and moving ``reminder_next_attempt_at``
+    ahead with exponential backoff. Committed right away, the lease keeps
+    other workers off while the reminders are sent outside any transaction,
+    and a failed or abandoned send is simply retried once it expires.
+    ``NO KEY`` keeps the lock from blocking inserts that reference the
+    appointment.
+    """
+
+    @provide_async_session
+    async def claim_due_reminders(
+        self,
+        now: datetime,
+        due_before: datetime,
+        limit: int,
+        retry_delay: timedelta,
+        max_attempts: int,
+        session: AsyncSession,
+    ) -> list[AppointmentReminder]:
+        due = (
+            select(Appointment.id, Appointment.appointment_start)
+            .where(
+                Appointment.status == AppointmentStatus.SCHEDULED,
+                Appointment.reminder_sent_at.is_(None),
+                Appointment.appointment_start > now,
+                Appointment.appointment_start <= due_before,
+                Appointment.reminder_attempts < max_attempts,
+                or_(Appointment.reminder_next_attempt_at.is_(None), Appointment.reminder_next_attempt_at <= now),
+            )
+            .order_by(Appointment.appointment_start)
+            .limit(limit)
+            .with_for_update(skip_locked=True, key_share=True)
+        )
+        claimed = await session.execute(
+            update(Appointment)
+            .where(tuple_(Appointment.id, Appointment.appointment_start).in_(due))
+            .values(
+                reminder_attempts=Appointment.reminder_attempts + 1,
+                reminder_next_attempt_at=literal(now, DateTime)
+                + literal(retry_delay, Interval) * func.power(2, Appointment.reminder_attempts),
+            )
+            .returning(Appointment.id)
+        )
+        claimed_ids = list(claimed.scalars())
+        if not claimed_ids:
+            return []
+
+        stmt = (
+            select(*REMINDER_COLUMNS)
+            .outerjoin(StaffService, StaffService.id == Appointment.service_id)
+            .outerjoin(Staff, Staff.id == Appointment.staff_id)
+            .outerjoin(StaffUser, StaffUser.id == Staff.user_id)
+            .outerjoin(Customer, Customer.id == Appointment.user_id)
+            .where(matches_any(Appointment.id, claimed_ids))
+            .order_by(Appointment.appointment_start)
+        )
+        result = await session.execute(stmt)
+        return [AppointmentReminder(*row) for row in result]
+
+    @provide_async_session
+    async def mark_reminders_sent(self, appointment_ids: list[UUID], sent_at: datetime, session: AsyncSession) -> None:
+        if not appointment_ids:
+            return
+        await session.execute(
+            update(Appointment).where(matches_any(Appointment.id, appointment_ids)).values(reminder_sent_at=sent_at)
+        )
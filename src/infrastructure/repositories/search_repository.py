@@ -0,0 +1,83 @@
+from sqlalchemy import Float, Text, bindparam, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.search_repository import AbstractSearchRepository
+from src.application.schemas.search import CompanySearchHit, ServiceSearchHit
+from src.config import settings
+from src.domain.entities import DomainCompany, DomainStaffService
+from src.infrastructure.database import Company, Staff, StaffService
+from src.infrastructure.database.session_manager import provide_async_session
+from src.infrastructure.repositories.company_repository import COMPANY_COLUMNS
+from src.infrastructure.repositories.pagination import paginate_by_distance
+from src.infrastructure.repositories.staff_service_repository import STAFF_SERVICE_COLUMNS
+
+
+def _matches(query, column):
+    """``query <% column``: some extent of the column is at least threshold-similar to the query."""
+    return query.op("<%", is_comparison=True)(column)
+
+
+def _distance(query, column):
+    """``query <<-> column``: one minus the word similarity, index-ordered by gist_trgm_ops."""
+    return query.op("<<->", return_type=Float)(column)
+
+
+class SearchRepository(AbstractSearchRepository):
+    """Repository implementation for fuzzy catalog search.
+    
+    ``search_text`` (generated from the searched columns) carries a
+    ``gist_trgm_ops`` index. Word similarity compares the query with the
+    best matching extent of the text, so "manic" finds "Manicure" and small
+    typos still match. The index both filters (``<%``) and returns rows
+    nearest first (``<<->``), so a page of a common term costs the same as a
+    page of a rare one. Later pages cost more, each rescans the pages before
+    it; results end after ``max_pages`` pages.
+    """
+
+    def __init__(
+        self,
+        threshold: float = settings.search.SEARCH_WORD_SIMILARITY_THRESHOLD,
+        max_pages: int = settings.search.SEARCH_MAX_PAGES,
+    ):
+        self.threshold = threshold
+        self.max_pages = max_pages
+
+    async def _set_threshold(self, session: AsyncSession) -> None:
+        # Read by the <% operator; local to the transaction
+        await session.execute(select(func.set_config("pg_trgm.word_similarity_threshold", str(self.threshold), True)))
+
+    @provide_async_session(read_only=True)
+    async def search_companies(
+        self, query: str, limit: int, cursor: str | None = None, *, session: AsyncSession
+    ) -> tuple[list[CompanySearchHit], str | None]:
+        await self._set_threshold(session)
+        query_text = bindparam("query", query, type_=Text)
+        distance = _distance(query_text, Company.search_text)
+        stmt = select(*COMPANY_COLUMNS, distance).where(_matches(query_text, Company.search_text))
+        rows, next_cursor = await paginate_by_distance(
+            session, stmt, distance, Company.id, limit=limit, cursor=cursor, max_pages=self.max_pages
+        )
+        width = len(COMPANY_COLUMNS)
+        return [CompanySearchHit(DomainCompany(*row[:width]), 1 - row[width]) for row in rows], next_cursor
+
+    @provide_async_session(read_only=True)
+    async def search_services(
+        self, query: str, limit: int, cursor: str | None = None, *, session: AsyncSession
+    ) -> tuple[list[ServiceSearchHit], str | None]:
+        await self._set_threshold(session)
+        query_text = bindparam("query", query, type_=Text)
+        distance = _distance(query_text, StaffService.search_text)
+        stmt = (
+            select(*STAFF_SERVICE_COLUMNS, Staff.company_id, Company.company_name, distance)
+            .join(Staff, Staff.id == StaffService.staff_id)
+            .join(Company, Company.id == Staff.company_id)
+            .where(_matches(query_text, StaffService.search_text), StaffService.is_active.is_(True))
+        )
+        rows, next_cursor = await paginate_by_distance(
+            session, stmt, distance, StaffService.id, limit=limit, cursor=cursor, max_pages=self.max_pages
+        )
+        width = len(STAFF_SERVICE_COLUMNS)
+        return [
+            ServiceSearchHit(DomainStaffService(*row[:width]), row[width], row[width + 1], 1 - row[width + 2])
+            for row in rows
+        ], next_cursor
@@ -0,0 +1,63 @@
+from uuid import UUID
+
+from sqlalchemy import exists, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.staff_rating_repository import AbstractStaffRatingRepository
+from src.infrastructure.database import Review, Staff
+from src.infrastructure.database.session_manager import provide_async_session
+from src.infrastructure.repositories.mapping import matches_any
+
+
+class StaffRatingRepository(AbstractStaffRatingRepository):
+    """Repository implementation for the per-staff rating aggregates.
+    
+    Reviews keep ``staff.rating_count``, ``rating_sum`` and ``rating_average``
+    up to date through triggers in the same transaction. The rebuild is for
+    backfills and for correcting drift (e.g. rows written with the triggers
+    disabled); it only rewrites staff rows whose aggregates differ.
+
+    The rebuild locks the staff rows before counting: the triggers update
+    the same rows, so reviews written meanwhile wait for the rebuild to
+    commit and are then added on top of totals that don't include them,
+    instead of being overwritten by totals counted before they committed.
+    """
+
+    @provide_async_session
+    async def rebuild_ratings(self, staff_ids: list[UUID] | None = None, *, session: AsyncSession) -> list[UUID]:
+        locked = select(Staff.id).order_by(Staff.id).with_for_update()
+        if staff_ids is not None:
+            locked = locked.where(matches_any(Staff.id, staff_ids))
+        await session.execute(locked)
+
+        # A later statement, so its snapshot includes every review committed before the lock was granted
+        totals = select(
+            Review.staff_id, func.count().label("count"), func.sum(Review.rating).label("total")
+        ).group_by(Review.staff_id)
+        if staff_ids is not None:
+            totals = totals.where(matches_any(Review.staff_id, staff_ids))
+        totals = totals.subquery()
+
+        reviewed = await session.execute(
+            update(Staff)
+            .where(
+                Staff.id == totals.c.staff_id,
+                (Staff.rating_count != totals.c.count) | (Staff.rating_sum != totals.c.total),
+            )
+            .values(
+                rating_count=totals.c.count,
+                rating_sum=totals.c.total,
+                rating_average=totals.c.total / totals.c.count,
+            )
+            .returning(Staff.id)
+        )
+        unreviewed = update(Staff).where(
+            Staff.rating_count != 0, ~exists().where(Review.staff_id == Staff.id)
+        )
+        if staff_ids is not None:
+            unreviewed = unreviewed.where(matches_any(Staff.id, staff_ids))
+        reset = await session.execute(
+            unreviewed.values(rating_count=0, rating_sum=0, rating_average=None).returning(Staff.id)
+        )
+
+        return [*reviewed.scalars(), *reset.scalars()]
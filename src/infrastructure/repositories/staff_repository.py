@@ -0,0 +1,49 @@
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.staff_repository import AbstractStaffRepository
+from src.domain.entities import DomainStaff
+from src.infrastructure.database import Staff
+from src.infrastructure.database.session_manager import provide_async_session
+from src.infrastructure.repositories.mapping import entity_columns, matches_any, row_to_entity, rows_to_entities
+from src.infrastructure.repositories.pagination import MAX_PAGE_SIZE, paginate
+
+STAFF_COLUMNS = entity_columns(Staff, DomainStaff)
+
+
+class StaffRepository(AbstractStaffRepository):
+    """Repository implementation for Staff domain entity."""
+
+    @provide_async_session(read_only=True)
+    async def list_staff(
+        self, limit: int, cursor: str | None = None, company_id: UUID | None = None, *, session: AsyncSession
+    ) -> tuple[list[DomainStaff], str | None]:
+        stmt = select(*STAFF_COLUMNS)
+        if company_id is not None:
+            stmt = stmt.where(Staff.company_id == company_id)
+        rows, next_cursor = await paginate(session, stmt, Staff, limit=limit, cursor=cursor)
+        return rows_to_entities(DomainStaff, rows), next_cursor
+
+    @provide_async_session(read_only=True)
+    async def get_staff(self, staff_id: UUID, session: AsyncSession) -> DomainStaff | None:
+        result = await session.execute(select(*STAFF_COLUMNS).where(Staff.id == staff_id))
+        row = result.one_or_none()
+        return row_to_entity(DomainStaff, row) if row is not None else None
+
+    @provide_async_session(read_only=True)
+    async def get_staff_by_ids(self, staff_ids: list[UUID], session: AsyncSession) -> list[DomainStaff]:
+        result = await session.execute(select(*STAFF_COLUMNS).where(matches_any(Staff.id, staff_ids)))
+        return rows_to_entities(DomainStaff, result)
+
+    @provide_async_session(read_only=True)
+    async def list_top_rated_staff(self, company_id: UUID, limit: int, session: AsyncSession) -> list[DomainStaff]:
+        # Served by ix_staff_company_id_rating_average, the aggregates are kept on the staff row
+        result = await session.execute(
+            select(*STAFF_COLUMNS)
+            .where(Staff.company_id == company_id)
+            .order_by(Staff.rating_average.desc().nulls_last(), Staff.rating_count.desc(), Staff.id)
+            .limit(max(1, min(limit, MAX_PAGE_SIZE)))
+        )
+        return rows_to_entities(DomainStaff, result)
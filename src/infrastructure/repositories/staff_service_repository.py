@@ -0,0 +1,38 @@
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.staff_service_repository import AbstractStaffServiceRepository
+from src.domain.entities import DomainStaffService
+from src.infrastructure.database import StaffService
+from src.infrastructure.database.session_manager import provide_async_session
+from src.infrastructure.repositories.mapping import entity_columns, matches_any, row_to_entity, rows_to_entities
+from src.infrastructure.repositories.pagination import paginate
+
+STAFF_SERVICE_COLUMNS = entity_columns(StaffService, DomainStaffService)
+
+
+class StaffServiceRepository(AbstractStaffServiceRepository):
+    """Repository implementation for StaffService domain entity."""
+
+    @provide_async_session(read_only=True)
+    async def list_services(
+        self, limit: int, cursor: str | None = None, staff_id: UUID | None = None, *, session: AsyncSession
+    ) -> tuple[list[DomainStaffService], str | None]:
+        stmt = select(*STAFF_SERVICE_COLUMNS)
+        if staff_id is not None:
+            stmt = stmt.where(StaffService.staff_id == staff_id)
+        rows, next_cursor = await paginate(session, stmt, StaffService, limit=limit, cursor=cursor)
+        return rows_to_entities(DomainStaffService, rows), next_cursor
+
+    @provide_async_session(read_only=True)
+    async def get_service(self, service_id: UUID, session: AsyncSession) -> DomainStaffService | None:
+        result = await session.execute(select(*STAFF_SERVICE_COLUMNS).where(StaffService.id == service_id))
+        row = result.one_or_none()
+        return row_to_entity(DomainStaffService, row) if row is not None else None
+
+    @provide_async_session(read_only=True)
+    async def get_services_by_ids(self, service_ids: list[UUID], session: AsyncSession) -> list[DomainStaffService]:
+        result = await session.execute(select(*STAFF_SERVICE_COLUMNS).where(matches_any(StaffService.id, service_ids)))
+        return rows_to_entities(DomainStaffService, result)
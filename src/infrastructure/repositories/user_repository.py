@@ -1,10 +1,16 @@
-from sqlalchemy import select
+from sqlalchemy import exists, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.interfaces.user_repository import AbstractUserRepository
 from src.domain.entities.domainuser import DomainUser
+from src.domain.exceptions import ObjectAlreadyExists
 from src.infrastructure.database import User
 from src.infrastructure.database.session_manager import provide_async_session
+from src.infrastructure.repositories.mapping import entity_columns, matches_any, row_to_entity, rows_to_entities
+from src.infrastructure.repositories.pagination import paginate
+
+USER_COLUMNS = entity_columns(User, DomainUser)
 
 
 class UserRepository(AbstractUserRepository):
@@ -14,77 +20,129 @@ class UserRepository(AbstractUserRepository):
     It belongs to the infrastructure layer and implements the application layer interface.
     """
 
-    def _to_domain(self, db_user: User) -> DomainUser:
-        """Convert SQLAlchemy model to domain entity.
+    def _insert_values(self, user: DomainUser) -> dict:
+        """Column values of a new user row."""
+        return {
+            "id": user.id,
+            "email": user.email,
+            "phone": user.phone,
+            "password_hash": user.password_hash,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+        }
+
+    @provide_async_session
+    async def create_user(self, user: DomainUser, session: AsyncSession) -> DomainUser:
+        """Create a new user in the database.
         
         Args:
-            db_user: SQLAlchemy User model
+            user: User domain entity to create
+            session: Database session
             
         Returns:
-            User domain entity
+            Created User domain entity with generated ID and timestamps
         """
-        return DomainUser(
-            id=db_user.id,
-            email=db_user.email,
-            phone=db_user.phone,
-            password_hash=db_user.password_hash,
-            first_name=db_user.first_name,
-            last_name=db_user.last_name,
-            created_at=db_user.created_at,
-            updated_at=db_user.updated_at,
-        )
+        # Committing is up to the caller's unit of work / session scope
+        stmt = insert(User).values(**self._insert_values(user)).returning(*USER_COLUMNS)
+        result = await session.execute(stmt)
+        return row_to_entity(DomainUser, result.one())
 
-    def _to_db(self, domain_user: DomainUser) -> User:
-        """Convert domain entity to SQLAlchemy model.
+    @provide_async_session
+    async def get_user(self, email: str, session: AsyncSession) -> DomainUser | None:
+        """Retrieve a user by email.
         
         Args:
-            domain_user: User domain entity
+            email: User email address
+            session: Database session
             
         Returns:
-            SQLAlchemy User model
+            User domain entity if found, None otherwise
         """
-        return User(
-            id=domain_user.id,
-            email=domain_user.email,
-            phone=domain_user.phone,
-            password_hash=domain_user.password_hash,
-            first_name=domain_user.first_name,
-            last_name=domain_user.last_name,
-        )
+        stmt = select(*USER_COLUMNS).where(User.email == email)
+        result = await session.execute(stmt)
+        row = result.one_or_none()
+        
+        if row is None:
+            return None
+        
+        return row_to_entity(DomainUser, row)
 
     @provide_async_session
-    async def create_user(self, user: DomainUser, session: AsyncSession) -> DomainUser:
-        """Create a new user in the database.
+    async def register_user(self, user: DomainUser, session: AsyncSession) -> DomainUser:
+        """Insert a user in a single INSERT ... ON CONFLICT DO NOTHING RETURNING.
+        
+        The unique index on email does the duplicate check, so concurrent
+        signups for the same email can't both succeed and no refresh is needed.
         
         Args:
             user: User domain entity to create
             session: Database session
             
         Returns:
-            Created User domain entity with generated ID and timestamps
+            Created User domain entity with generated timestamps
+            
+        Raises:
+            ObjectAlreadyExists: If a user with this email already exists
         """
-        db_user = self._to_db(user)
-        session.add(db_user)
-        await session.commit()
-        await session.refresh(db_user)
-        return self._to_domain(db_user)
+        stmt = (
+            insert(User)
+            .values(**self._insert_values(user))
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User.created_at, User.updated_at)
+        )
+        result = await session.execute(stmt)
+        row = result.one_or_none()
+
+        if row is None:
+            raise ObjectAlreadyExists(f"User with this email: {user.email} already exists.")
+
+        user.created_at = row.created_at
+        user.updated_at = row.updated_at
+        return user
 
     @provide_async_session
-    async def get_user(self, email: str, session: AsyncSession) -> DomainUser | None:
-        """Retrieve a user by email.
+    async def email_exists(self, email: str, session: AsyncSession) -> bool:
+        """Check whether a user with this email exists.
         
         Args:
             email: User email address
             session: Database session
             
         Returns:
-            User domain entity if found, None otherwise
+            True if the email is taken, False otherwise
         """
-        stmt = select(User).where(User.email == email)
+        stmt = select(exists().where(User.email == email))
         result = await session.execute(stmt)
-        db_user = result.scalar_one_or_none()
+        return bool(result.scalar())
+
+    @provide_async_session(read_only=True)
+    async def list_users(
+        self, limit: int, cursor: str | None = None, *, session: AsyncSession
+    ) -> tuple[list[DomainUser], str | None]:
+        """List users newest first, one keyset page at a time.
         
-        if db_user is None:
-            return None
+        Args:
+            limit: Page size
+            session: Database session
+            cursor: Cursor returned with the previous page
+            
+        Returns:
+            Users of the page and the cursor of the next page, if any
+        """
+        rows, next_cursor = await paginate(session, select(*USER_COLUMNS), User, limit=limit, cursor=cursor)
+        return rows_to_entities(DomainUser, rows), next_cursor
+
+    @provide_async_session
+    async def get_users_by_email(self, emails: list[str], session: AsyncSession) -> list[DomainUser]:
+        """Retrieve the users with any of the given emails in one query.
         
-        return self._to_domain(db_user)
\ No newline at end of file
+        Args:
+            emails: User email addresses
+            session: Database session
+            
+        Returns:
+            Users found, in no particular order
+        """
+        stmt = select(*USER_COLUMNS).where(matches_any(User.email, emails))
+        result = await session.execute(stmt)
+        return rows_to_entities(DomainUser, result)
@@ -1,17 +1,22 @@
 from datetime import datetime, timedelta, timezone
 
-import bcrypt
 import jwt
 
 from src.application.interfaces.auth_security import AbstractAuthSecurity
 from src.config import settings
 from src.domain.enums import TokenType
 from src.domain.exceptions import InvalidCredentials
+from src.infrastructure.security.hashing_pool import HashingPool, bcrypt_check, bcrypt_hash, hashing_pool
+from src.infrastructure.security.token_cache import VerifiedTokenCache, verified_token_cache
 
 
 class AuthSecurity(AbstractAuthSecurity):
     """Security service for password hashing and token management."""
 
+    def __init__(self, pool: HashingPool = hashing_pool, token_cache: VerifiedTokenCache = verified_token_cache):
+        self.pool = pool
+        self.token_cache = token_cache
+
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a plain password against a hashed password.
         
@@ -22,10 +27,7 @@ class AuthSecurity(AbstractAuthSecurity):
         Returns:
             True if password matches, False otherwise
         """
-        return bcrypt.checkpw(
-            plain_password.encode('utf-8'),
-            hashed_password.encode('utf-8')
-        )
+        return bcrypt_check(plain_password, hashed_password)
 
     def hash_password(self, password: str) -> str:
         """Hash a plain password using bcrypt.
@@ -36,10 +38,23 @@ class AuthSecurity(AbstractAuthSecurity):
         Returns:
             Hashed password string
         """
-        # Generate salt and hash password
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return hashed.decode('utf-8')
+        return bcrypt_hash(password)
+
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password in the hashing pool instead of on the event loop.
+
+        Raises:
+            ServiceOverloaded: If the hashing pool is saturated
+        """
+        return await self.pool.run(bcrypt_check, plain_password, hashed_password)
+
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a password in the hashing pool instead of on the event loop.
+
+        Raises:
+            ServiceOverloaded: If the hashing pool is saturated
+        """
+        return await self.pool.run(bcrypt_hash, password)
 
     def create_token(self, payload: dict, token_type: TokenType, expire_minutes: int) -> str:
         to_encode = payload.copy()
@@ -48,8 +63,15 @@ class AuthSecurity(AbstractAuthSecurity):
         return jwt.encode(to_encode, settings.token.SECRET_KEY, algorithm=settings.token.ALGORITHM)
 
     def decode_token(self, token: str, key: str, options: dict, algorithms: list[str]) -> dict:
+        # Tokens verified before are served from the cache until their exp
+        cache_key = self.token_cache.make_key(token, key, options, algorithms)
+        cached_payload = self.token_cache.get(cache_key)
+        if cached_payload is not None:
+            return cached_payload
+
         try:
             payload = jwt.decode(jwt=token, key=key, algorithms=algorithms, options=options)
+            self.token_cache.put(cache_key, payload)
             return payload
         except jwt.ExpiredSignatureError:
             raise InvalidCredentials("Token has expired")
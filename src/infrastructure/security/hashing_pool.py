@@ -0,0 +1,135 @@
+"""Bounded worker pool for CPU-bound password hashing.
+
+bcrypt deliberately burns ~100ms of CPU per call. Running it on the event
+loop stalls every other request on the worker, so the async entry points in
+``AuthSecurity`` hand the work to this pool instead. The pool admits at most
+``max_workers + max_queue_depth`` jobs at a time and rejects the rest right
+away with ``ServiceOverloaded`` rather than letting a burst queue up unbounded.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Literal, TypeVar
+
+import bcrypt
+
+from src.config import settings
+from src.config.settings import SecuritySettings
+from src.domain.exceptions import ServiceOverloaded
+from src.infrastructure.observability.request_stats import record_hashing
+
+T = TypeVar("T")
+
+
+def bcrypt_hash(password: str) -> str:
+    """Hash a plain password with a fresh bcrypt salt."""
+    salt = bcrypt.gensalt()
+    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
+
+def bcrypt_check(plain_password: str, hashed_password: str) -> bool:
+    """Check a plain password against a bcrypt hash."""
+    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+class HashingPool:
+    """Thread or process pool with a hard cap on in-flight hashing jobs."""
+
+    def __init__(
+        self,
+        executor_kind: Literal["thread", "process"] = "thread",
+        max_workers: int = 4,
+        max_queue_depth: int = 32,
+    ):
+        """Initialize hashing pool.
+
+        Args:
+            executor_kind: "thread" (bcrypt releases the GIL) or "process"
+            max_workers: Number of worker threads/processes
+            max_queue_depth: Jobs allowed to wait for a free worker
+        """
+        self.executor_kind = executor_kind
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self._executor: Executor | None = None
+        self._in_flight = 0
+        # Jobs finish on executor threads
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, security: SecuritySettings) -> "HashingPool":
+        return cls(
+            executor_kind=security.HASHING_EXECUTOR,
+            max_workers=security.HASHING_MAX_WORKERS,
+            max_queue_depth=security.HASHING_MAX_QUEUE_DEPTH,
+        )
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of jobs running or queued at once."""
+        return self.max_workers + self.max_queue_depth
+
+    @property
+    def in_flight(self) -> int:
+        """Jobs currently running or waiting for a worker."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Jobs waiting for a free worker."""
+        return max(self._in_flight - self.max_workers, 0)
+
+    def is_saturated(self) -> bool:
+        """True when a new job would be rejected."""
+        return self._in_flight >= self.capacity
+
+    def _get_executor(self) -> Executor:
+        # Created lazily so that importing the module never forks or spawns threads
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="hashing")
+        return self._executor
+
+    def _job_done(self, future: Future | None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        """Run ``func(*args)`` in the pool.
+
+        A job counts as in flight until the executor is done with it: when
+        the caller is cancelled, a job that already started keeps its worker
+        until it finishes and stays counted.
+
+        Raises:
+            ServiceOverloaded: If the pool already holds ``capacity`` jobs
+        """
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                raise ServiceOverloaded("Password hashing pool is saturated, try again later.")
+            self._in_flight += 1
+
+        started = time.perf_counter()
+        try:
+            future = self._get_executor().submit(func, *args)
+        except BaseException:
+            self._job_done(None)
+            raise
+        future.add_done_callback(self._job_done)
+        try:
+            return await asyncio.wrap_future(future)
+        finally:
+            record_hashing(getattr(func, "__name__", "unknown"), time.perf_counter() - started)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the underlying executor."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+hashing_pool = HashingPool.from_settings(settings.security)
@@ -0,0 +1,65 @@
+"""In-process token bucket rate limiting.
+
+Every key has a bucket holding up to ``burst`` tokens that refills at
+``rate_per_second``; a request spends one token or is rejected with the time
+until one is available. Buckets are spread over shards, each a bounded LRU,
+so bookkeeping stays O(1) per request and an attacker cycling through keys
+only evicts the idlest buckets of one shard instead of growing memory.
+"""
+
+import time
+from collections import OrderedDict
+
+from src.application.interfaces.rate_limiter import AbstractRateLimiter
+from src.config import settings
+from src.config.settings import RateLimitSettings
+
+
+class TokenBucketRateLimiter(AbstractRateLimiter):
+    """Sharded in-memory token buckets."""
+
+    def __init__(self, rate_per_second: float, burst: int, max_keys: int = 100_000, shards: int = 64):
+        """Initialize token bucket rate limiter.
+
+        Args:
+            rate_per_second: Tokens added to a bucket per second
+            burst: Bucket capacity, i.e. requests allowed at once after a quiet period
+            max_keys: Buckets kept in total before the least recently used are dropped
+            shards: Number of independent LRU shards
+        """
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.max_keys_per_shard = max(1, max_keys // shards)
+        # key -> (tokens, last refill)
+        self._shards: list[OrderedDict[str, tuple[float, float]]] = [OrderedDict() for _ in range(shards)]
+
+    @classmethod
+    def per_minute(cls, rate_per_minute: float, burst: int, rate_limit: RateLimitSettings) -> "TokenBucketRateLimiter":
+        return cls(rate_per_second=rate_per_minute / 60, burst=burst, max_keys=rate_limit.RATE_LIMIT_MAX_KEYS)
+
+    async def hit(self, key: str, cost: float = 1.0) -> float:
+        shard = self._shards[hash(key) % len(self._shards)]
+        now = time.monotonic()
+        tokens, updated = shard.get(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - updated) * self.rate_per_second)
+
+        if tokens >= cost:
+            shard[key] = (tokens - cost, now)
+            retry_after = 0.0
+        else:
+            shard[key] = (tokens, now)
+            retry_after = (cost - tokens) / self.rate_per_second
+
+        shard.move_to_end(key)
+        if len(shard) > self.max_keys_per_shard:
+            # A dropped bucket starts over full, which the least recently used one almost is anyway
+            shard.popitem(last=False)
+        return retry_after
+
+
+credential_ip_limiter = TokenBucketRateLimiter.per_minute(
+    settings.rate_limit.CREDENTIAL_IP_RATE_PER_MINUTE, settings.rate_limit.CREDENTIAL_IP_BURST, settings.rate_limit
+)
+credential_email_limiter = TokenBucketRateLimiter.per_minute(
+    settings.rate_limit.CREDENTIAL_EMAIL_RATE_PER_MINUTE, settings.rate_limit.CREDENTIAL_EMAIL_BURST, settings.rate_limit
+)
@@ -0,0 +1,91 @@
+"""Cache of verified JWT payloads.
+
+Clients reuse one access token for many requests, and verifying it means
+parsing it and recomputing the HMAC every time. ``VerifiedTokenCache`` keeps
+the payloads of tokens that already passed ``jwt.decode``, keyed by a digest
+of the token plus the verification parameters. Entries expire at the token's
+own ``exp``, so an expired token is never served from the cache.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+from src.config import settings
+from src.config.settings import TokenSettings
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of verified token payloads with hit/miss counters."""
+
+    def __init__(self, max_size: int = 10_000, max_ttl_seconds: int = 900):
+        """Initialize token cache.
+
+        Args:
+            max_size: Maximum number of cached tokens
+            max_ttl_seconds: Upper bound on how long a payload is cached,
+                also used for tokens without ``exp``
+        """
+        self.max_size = max_size
+        self.max_ttl_seconds = max_ttl_seconds
+        self._entries: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_settings(cls, token: TokenSettings) -> "VerifiedTokenCache":
+        return cls(max_size=token.CACHE_MAX_SIZE, max_ttl_seconds=token.CACHE_MAX_TTL_SECONDS)
+
+    @staticmethod
+    def make_key(token: str, key: str, options: dict, algorithms: list[str]) -> tuple:
+        """Build a cache key; the raw token is stored only as a digest."""
+        digest = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+        return digest, key, tuple(algorithms), repr(sorted(options.items()))
+
+    def get(self, cache_key: tuple) -> dict | None:
+        """Return a copy of the cached payload, or None if missing or expired."""
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, payload = entry
+        if time.time() >= expires_at:
+            del self._entries[cache_key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(cache_key)
+        self.hits += 1
+        return dict(payload)
+
+    def put(self, cache_key: tuple, payload: dict) -> None:
+        """Cache a verified payload until its ``exp`` (bounded by max_ttl_seconds)."""
+        if self.max_size <= 0:
+            return
+        expires_at = time.time() + self.max_ttl_seconds
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+
+        self._entries[cache_key] = (expires_at, dict(payload))
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+verified_token_cache = VerifiedTokenCache.from_settings(settings.token)
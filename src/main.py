@@ -1,10 +1,15 @@
-import uvicorn
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
+from fastapi.datastructures import Default
 
 from starlette.middleware.cors import CORSMiddleware
 
+from src.application.schemas.base import DomainOutputSchema
 from src.config import settings
 from src.domain.exceptions import (
+    AppointmentConflict,
     BusinessRuleViolation,
     InsufficientPermissions,
     InvalidCredentials,
@@ -12,13 +17,32 @@ from src.domain.exceptions import (
     ObjectAlreadyExists,
     ObjectNotFound,
     ObjectValidationError,
+    RateLimited,
+    ServiceOverloaded,
 )
+from src.infrastructure.cache.catalog_invalidation import CatalogInvalidationListener
+from src.infrastructure.cache.idempotency_store import idempotency_store
+from src.infrastructure.database.lifecycle import dispose_database, warm_up_database
+from src.infrastructure.database.replicas import replica_router
+from src.infrastructure.reminders.scheduler import ReminderScheduler
+from src.infrastructure.security.hashing_pool import hashing_pool
 from src.presentation.api import exceptions as exception_handlers
+from src.presentation.api import metrics
+from src.presentation.api.middleware import IdempotencyMiddleware, ReadYourWritesMiddleware, RequestMetricsMiddleware
+from src.presentation.api.responses import FastJSONResponse
 from src.presentation.api.v1.router import api_v1_router as routers
-
+from src.presentation.server import worker_count
 
 
 def _include_middleware(app: FastAPI) -> None:
+    # Innermost, so replayed responses still pass CORS and metrics
+    if settings.idempotency.IDEMPOTENCY_ENABLED:
+        if idempotency_store.shared is None and not settings.DEBUG and worker_count(settings.server) > 1:
+            raise RuntimeError(
+                "IDEMPOTENCY_SHARED=false only detects duplicates within one process; "
+                "set WEB_WORKERS=1 or IDEMPOTENCY_SHARED=true"
+            )
+        app.add_middleware(IdempotencyMiddleware, store=idempotency_store, idempotency=settings.idempotency)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -26,9 +50,17 @@ def _include_middleware(app: FastAPI) -> None:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    if replica_router.enabled:
+        app.add_middleware(
+            ReadYourWritesMiddleware, sticky_seconds=settings.database.POSTGRES_READ_YOUR_WRITES_SECONDS
+        )
+    if settings.observability.METRICS_ENABLED:
+        app.add_middleware(RequestMetricsMiddleware, observability=settings.observability)
 
 def _include_router(app: FastAPI) -> None:
     app.include_router(routers)
+    if settings.observability.METRICS_ENABLED:
+        app.include_router(metrics.router)
 
 
 def _include_exception_handlers(app: FastAPI) -> None:
@@ -45,6 +77,9 @@ def _include_exception_handlers(app: FastAPI) -> None:
     app.add_exception_handler(
         BusinessRuleViolation, exception_handlers.handle_business_rule_violation
     )
+    app.add_exception_handler(
+        AppointmentConflict, exception_handlers.handle_appointment_conflict
+    )
     app.add_exception_handler(
         InsufficientPermissions, exception_handlers.handle_insufficient_permissions
     )
@@ -54,10 +89,42 @@ def _include_exception_handlers(app: FastAPI) -> None:
     app.add_exception_handler(
         InvalidCredentials, exception_handlers.handle_invalid_credentials
     )
+    app.add_exception_handler(
+        ServiceOverloaded, exception_handlers.handle_service_overloaded
+    )
+    app.add_exception_handler(
+        RateLimited, exception_handlers.handle_rate_limited
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm the connection pools before serving, release them after the last request."""
+    database = settings.database
+    if database.POSTGRES_POOL_ENABLED:
+        await warm_up_database(min(database.POSTGRES_POOL_WARMUP_CONNECTIONS, database.POSTGRES_POOL_SIZE))
+    catalog_listener = None
+    if settings.cache.CATALOG_CACHE_MAX_SIZE > 0:
+        catalog_listener = CatalogInvalidationListener.from_settings(settings.database, settings.cache)
+        catalog_listener.start()
+    reminder_scheduler = None
+    if settings.reminders.REMINDERS_ENABLED:
+        reminder_scheduler = ReminderScheduler.from_settings(settings.reminders)
+        reminder_scheduler.start()
+    yield
+    # The server has stopped accepting and finished in-flight requests by now
+    if reminder_scheduler is not None:
+        await reminder_scheduler.stop()
+    if catalog_listener is not None:
+        await catalog_listener.stop()
+    hashing_pool.shutdown()
+    await dispose_database()
 
 
 def create_app() -> FastAPI:
-    app = FastAPI()
+    # Wrapped in Default so routes with a response model keep FastAPI's direct Pydantic-to-JSON path
+    app = FastAPI(default_response_class=Default(FastJSONResponse), lifespan=lifespan)
+    DomainOutputSchema.validate_domain_objects = settings.VALIDATE_OUTPUT_SCHEMAS
     _include_middleware(app)
     _include_exception_handlers(app)
     _include_router(app)
@@ -66,4 +133,6 @@ def create_app() -> FastAPI:
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:create_app", host=settings.HOST, port=settings.PORT)
+    from src.presentation.server import serve
+
+    serve()
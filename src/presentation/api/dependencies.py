@@ -1,22 +1,204 @@
-from typing import Annotated
-from fastapi import Depends
+from dataclasses import dataclass
+from typing import Annotated, AsyncGenerator
+from fastapi import Depends, Query, Request
 
+from src.application.services.analytics_service import AnalyticsService
+from src.application.services.appointment_export_service import AppointmentExportService
+from src.application.services.availability_service import AvailabilityService
+from src.application.services.booking_service import BookingService
+from src.application.services.bulk_import_service import BulkImportService
+from src.application.services.catalog_service import CatalogService
+from src.application.services.search_service import SearchService
 from src.application.services.user_service import UserService
+from src.config import settings
+from src.domain.exceptions import RateLimited, ServiceOverloaded
+from src.infrastructure.database.unit_of_work import UnitOfWork
+from src.infrastructure.repositories.analytics_repository import AnalyticsRepository
+from src.infrastructure.repositories.appointment_repository import AppointmentRepository
+from src.infrastructure.repositories.availability_repository import AvailabilityRepository
+from src.infrastructure.repositories.batched_repositories import (
+    BatchingCompanyRepository,
+    BatchingStaffRepository,
+    BatchingStaffServiceRepository,
+    BatchingUserRepository,
+)
+from src.infrastructure.repositories.bulk_import_repository import BulkImportRepository
+from src.infrastructure.repositories.cached_repositories import (
+    CachedAvailabilityRepository,
+    CachedCompanyRepository,
+    CachedStaffRepository,
+    CachedStaffServiceRepository,
+)
+from src.infrastructure.repositories.company_repository import CompanyRepository
+from src.infrastructure.repositories.pagination import MAX_PAGE_SIZE
+from src.infrastructure.repositories.search_repository import SearchRepository
+from src.infrastructure.repositories.staff_repository import StaffRepository
+from src.infrastructure.repositories.staff_service_repository import StaffServiceRepository
 from src.infrastructure.repositories.user_repository import UserRepository
 from src.infrastructure.security.auth_security import AuthSecurity
+from src.infrastructure.security.hashing_pool import hashing_pool
+from src.infrastructure.security.rate_limiter import (
+    TokenBucketRateLimiter,
+    credential_email_limiter,
+    credential_ip_limiter,
+)
 
 
-def get_user_repository() -> UserRepository:
-    return UserRepository()
+async def get_unit_of_work() -> AsyncGenerator[UnitOfWork, None]:
+    """One session and transaction per request, committed once the endpoint returns."""
+    async with UnitOfWork() as uow:
+        yield uow
+
+def get_user_repository() -> BatchingUserRepository:
+    return BatchingUserRepository(UserRepository())
 
 def get_auth_security() -> AuthSecurity:
     return AuthSecurity()
 
+def get_company_repository() -> CachedCompanyRepository:
+    return CachedCompanyRepository(BatchingCompanyRepository(CompanyRepository()))
+
+def get_staff_repository() -> CachedStaffRepository:
+    return CachedStaffRepository(BatchingStaffRepository(StaffRepository()))
+
+# Staff as served to clients: the rating fields change with every review, so not from the catalog cache
+def get_uncached_staff_repository() -> BatchingStaffRepository:
+    return BatchingStaffRepository(StaffRepository())
+
+def get_staff_service_repository() -> CachedStaffServiceRepository:
+    return CachedStaffServiceRepository(BatchingStaffServiceRepository(StaffServiceRepository()))
+
+def get_availability_repository() -> CachedAvailabilityRepository:
+    return CachedAvailabilityRepository(AvailabilityRepository())
+
+def get_appointment_repository() -> AppointmentRepository:
+    return AppointmentRepository()
+
+def get_bulk_import_repository() -> BulkImportRepository:
+    return BulkImportRepository()
+
+def get_analytics_repository() -> AnalyticsRepository:
+    return AnalyticsRepository()
+
+def get_search_repository() -> SearchRepository:
+    return SearchRepository()
+
+def get_email_rate_limiter() -> TokenBucketRateLimiter | None:
+    return credential_email_limiter if settings.rate_limit.RATE_LIMIT_ENABLED else None
+
+# No unit of work: signup's one write is a single INSERT, and a request-wide transaction would hold
+# a pooled connection idle through the password hashing queue
 def get_user_service(
-        user_repository: UserRepository = Depends(get_user_repository),
-        auth_security: AuthSecurity = Depends(get_auth_security)
+        user_repository: BatchingUserRepository = Depends(get_user_repository),
+        auth_security: AuthSecurity = Depends(get_auth_security),
+        email_rate_limiter: TokenBucketRateLimiter | None = Depends(get_email_rate_limiter),
 ) -> UserService:
-    return UserService(user_repository=user_repository, auth_security=auth_security)
+    return UserService(
+        user_repository=user_repository, auth_security=auth_security, email_rate_limiter=email_rate_limiter
+    )
+
+def get_catalog_service(
+        _: UnitOfWork = Depends(get_unit_of_work, scope="function"),
+        company_repository: CachedCompanyRepository = Depends(get_company_repository),
+        staff_repository: BatchingStaffRepository = Depends(get_uncached_staff_repository),
+        staff_service_repository: CachedStaffServiceRepository = Depends(get_staff_service_repository),
+) -> CatalogService:
+    return CatalogService(
+        company_repository=company_repository,
+        staff_repository=staff_repository,
+        staff_service_repository=staff_service_repository,
+    )
+
+def get_availability_service(
+        _: UnitOfWork = Depends(get_unit_of_work, scope="function"),
+        availability_repository: CachedAvailabilityRepository = Depends(get_availability_repository),
+) -> AvailabilityService:
+    return AvailabilityService(
+        availability_repository=availability_repository,
+        max_months_ahead=settings.partitions.APPOINTMENT_PARTITIONS_AHEAD_MONTHS,
+    )
+
+def get_booking_service(
+        _: UnitOfWork = Depends(get_unit_of_work, scope="function"),
+        appointment_repository: AppointmentRepository = Depends(get_appointment_repository),
+        availability_repository: CachedAvailabilityRepository = Depends(get_availability_repository),
+        staff_repository: CachedStaffRepository = Depends(get_staff_repository),
+) -> BookingService:
+    return BookingService(
+        appointment_repository=appointment_repository,
+        availability_repository=availability_repository,
+        staff_repository=staff_repository,
+        max_months_ahead=settings.partitions.APPOINTMENT_PARTITIONS_AHEAD_MONTHS,
+    )
+
+def get_bulk_import_service(
+        bulk_import_repository: BulkImportRepository = Depends(get_bulk_import_repository),
+        auth_security: AuthSecurity = Depends(get_auth_security),
+) -> BulkImportService:
+    # No request-wide unit of work: every chunk commits on its own
+    return BulkImportService(bulk_import_repository=bulk_import_repository, auth_security=auth_security)
+
+def get_appointment_export_service(
+        appointment_repository: AppointmentRepository = Depends(get_appointment_repository),
+) -> AppointmentExportService:
+    # No request-wide unit of work: the export streams from its own session after the endpoint returns
+    return AppointmentExportService(appointment_repository=appointment_repository)
+
+def get_analytics_service(
+        _: UnitOfWork = Depends(get_unit_of_work, scope="function"),
+        analytics_repository: AnalyticsRepository = Depends(get_analytics_repository),
+        availability_repository: CachedAvailabilityRepository = Depends(get_availability_repository),
+) -> AnalyticsService:
+    return AnalyticsService(
+        analytics_repository=analytics_repository, availability_repository=availability_repository
+    )
+
+def get_search_service(
+        _: UnitOfWork = Depends(get_unit_of_work, scope="function"),
+        search_repository: SearchRepository = Depends(get_search_repository),
+) -> SearchService:
+    return SearchService(search_repository=search_repository)
+
+
+def _client_ip(request: Request) -> str:
+    if settings.rate_limit.RATE_LIMIT_TRUST_FORWARDED_FOR:
+        forwarded_for = request.headers.get("x-forwarded-for")
+        if forwarded_for:
+            return forwarded_for.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+async def admit_credential_request(request: Request) -> None:
+    """Admission control of endpoints doing password hashing, run before any database or CPU work.
+
+    Raises:
+        ServiceOverloaded: If the hashing pool can't take another job (503)
+        RateLimited: If the client IP exceeded its budget (429)
+    """
+    if hashing_pool.is_saturated():
+        raise ServiceOverloaded("Password hashing pool is saturated, try again later.")
+    if not settings.rate_limit.RATE_LIMIT_ENABLED:
+        return
+    retry_after = await credential_ip_limiter.hit(_client_ip(request))
+    if retry_after:
+        raise RateLimited("Too many attempts from this address, try again later.", retry_after=retry_after)
+
+
+@dataclass
+class PaginationParams:
+    """Keyset pagination query parameters shared by listing endpoints."""
+
+    limit: int = Query(default=20, ge=1, le=MAX_PAGE_SIZE)
+    cursor: str | None = Query(default=None, description="Opaque cursor from the previous page")
 
 
-user_service_deps = Annotated[UserService, Depends(get_user_service)]
\ No newline at end of file
+unit_of_work_deps = Annotated[UnitOfWork, Depends(get_unit_of_work, scope="function")]
+pagination_deps = Annotated[PaginationParams, Depends()]
+user_service_deps = Annotated[UserService, Depends(get_user_service)]
+credential_admission = Depends(admit_credential_request)
+catalog_service_deps = Annotated[CatalogService, Depends(get_catalog_service)]
+availability_service_deps = Annotated[AvailabilityService, Depends(get_availability_service)]
+booking_service_deps = Annotated[BookingService, Depends(get_booking_service)]
+bulk_import_service_deps = Annotated[BulkImportService, Depends(get_bulk_import_service)]
+appointment_export_service_deps = Annotated[AppointmentExportService, Depends(get_appointment_export_service)]
+analytics_service_deps = Annotated[AnalyticsService, Depends(get_analytics_service)]
+search_service_deps = Annotated[SearchService, Depends(get_search_service)]
\ No newline at end of file
@@ -4,10 +4,13 @@ This module contains exception handlers that convert domain exceptions
 into appropriate HTTP responses.
 """
 
+import math
+
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
 from src.domain.exceptions import (
+    AppointmentConflict,
     BusinessRuleViolation,
     InsufficientPermissions,
     InvalidCredentials,
@@ -15,7 +18,10 @@ from src.domain.exceptions import (
     ObjectAlreadyExists,
     ObjectNotFound,
     ObjectValidationError,
+    RateLimited,
+    ServiceOverloaded,
 )
+from src.infrastructure.observability.metrics import requests_rejected_total
 
 
 def handle_object_not_found(_: Request, e: ObjectNotFound) -> JSONResponse:
@@ -54,6 +60,14 @@ def handle_business_rule_violation(
     )
 
 
+def handle_appointment_conflict(_: Request, e: AppointmentConflict) -> JSONResponse:
+    """Handle AppointmentConflict exception."""
+    return JSONResponse(
+        content={"message": str(e)},
+        status_code=status.HTTP_409_CONFLICT,
+    )
+
+
 def handle_insufficient_permissions(
     _: Request, e: InsufficientPermissions
 ) -> JSONResponse:
@@ -79,3 +93,23 @@ def handle_invalid_credentials(_: Request, e: InvalidCredentials) -> JSONRespons
         status_code=status.HTTP_401_UNAUTHORIZED,
     )
 
+
+def handle_service_overloaded(_: Request, e: ServiceOverloaded) -> JSONResponse:
+    """Handle ServiceOverloaded exception."""
+    requests_rejected_total.inc(reason="overloaded")
+    return JSONResponse(
+        content={"message": str(e)},
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": "1"},
+    )
+
+
+
+def handle_rate_limited(_: Request, e: RateLimited) -> JSONResponse:
+    """Handle RateLimited exception."""
+    requests_rejected_total.inc(reason="rate_limited")
+    return JSONResponse(
+        content={"message": str(e)},
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))},
+    )
@@ -0,0 +1,35 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.infrastructure.cache.catalog_cache import catalog_cache
+from src.infrastructure.database.connection import engine
+from src.infrastructure.database.pool import get_pool_stats
+from src.infrastructure.observability.metrics import (
+    cache_entries,
+    cache_lookups_total,
+    db_pool_connections,
+    hashing_pool_in_flight,
+    registry,
+)
+from src.infrastructure.security.hashing_pool import hashing_pool
+from src.infrastructure.security.token_cache import verified_token_cache
+
+router = APIRouter(tags=["Health"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", summary="Prometheus metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Process metrics in the Prometheus text format."""
+    pool_stats = get_pool_stats(engine)
+    db_pool_connections.set(pool_stats.checked_out, state="checked_out")
+    db_pool_connections.set(pool_stats.idle, state="idle")
+    db_pool_connections.set(pool_stats.overflow, state="overflow")
+    hashing_pool_in_flight.set(hashing_pool.in_flight)
+    for name, stats in (("catalog", catalog_cache.stats()), ("verified_token", verified_token_cache.stats())):
+        cache_entries.set(stats["size"], cache=name)
+        cache_lookups_total.set(stats["hits"], cache=name, result="hit")
+        cache_lookups_total.set(stats["misses"], cache=name, result="miss")
+
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
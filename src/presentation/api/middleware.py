@@ -0,0 +1,325 @@
+"""ASGI middleware of the API."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+
+from starlette.requests import ClientDisconnect
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.settings import IdempotencySettings, ObservabilitySettings
+from src.infrastructure.cache.idempotency_store import IdempotencyStore, StoredResponse
+from src.infrastructure.database.replicas import RoutingState, current_routing
+from src.infrastructure.observability.metrics import db_queries_per_request, db_time_per_request, http_request_duration
+from src.infrastructure.observability.request_stats import RequestStats, current_request_stats
+
+logger = logging.getLogger(__name__)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _route_template(scope: Scope) -> str:
+    """Full path template of the matched route, e.g. ``/v1/users/{user_id}``."""
+    route = scope.get("route")
+    if route is None:
+        return UNMATCHED_ROUTE
+
+    # Routes of included routers may only know their path relative to the router prefix
+    template = getattr(route, "path_format", None) or getattr(route, "path", UNMATCHED_ROUTE)
+    try:
+        rendered = template.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return template
+    path = scope["path"]
+    if path.endswith(rendered):
+        return path[: len(path) - len(rendered)] + template
+    return template
+
+
+class RequestMetricsMiddleware:
+    """Record latency, database work and hashing time of every HTTP request.
+
+    Routes are labelled with their path template (``/v1/users/{user_id}``),
+    never the raw path, to keep metric cardinality bounded. Requests slower
+    than the configured threshold are logged together with the statements
+    they executed.
+    """
+
+    def __init__(self, app: ASGIApp, observability: ObservabilitySettings):
+        self.app = app
+        self.slow_request_seconds = observability.SLOW_REQUEST_THRESHOLD_MS / 1000
+        self.max_statements = observability.SLOW_REQUEST_MAX_STATEMENTS
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(max_statements=self.max_statements)
+        token = current_request_stats.set(stats)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            current_request_stats.reset(token)
+            self._record(scope, status_code, elapsed, stats)
+
+    def _record(self, scope: Scope, status_code: int, elapsed: float, stats: RequestStats) -> None:
+        route_path = _route_template(scope)
+        method = scope["method"]
+
+        http_request_duration.observe(elapsed, method=method, route=route_path, status=str(status_code))
+        db_queries_per_request.observe(stats.query_count, route=route_path)
+        db_time_per_request.observe(stats.query_seconds, route=route_path)
+
+        if elapsed < self.slow_request_seconds:
+            return
+        statements = "\n".join(
+            f"  [{duration * 1000:.1f} ms] {statement}" for duration, statement in stats.statements
+        )
+        logger.warning(
+            "Slow request %s %s -> %s in %.1f ms (db: %d queries, %.1f ms; pool wait: %.1f ms; hashing: %.1f ms)%s",
+            method,
+            scope["path"],
+            status_code,
+            elapsed * 1000,
+            stats.query_count,
+            stats.query_seconds * 1000,
+            stats.pool_wait_seconds * 1000,
+            stats.hashing_seconds * 1000,
+            f"\n{statements}" if statements else "",
+        )
+
+
+class ReadYourWritesMiddleware:
+    """Keep clients that just wrote reading from the primary database.
+
+    A request that executed DML on the primary gets a short-lived cookie;
+    while it is valid, read-only sessions of that client's requests skip the
+    replicas, so a client never reads a replica that hasn't caught up with its
+    own write yet.
+    """
+
+    cookie_name = "read_primary_until"
+
+    def __init__(self, app: ASGIApp, sticky_seconds: float):
+        self.app = app
+        self.sticky_seconds = sticky_seconds
+
+    def _sticky_until(self, scope: Scope) -> float:
+        for name, value in scope.get("headers", ()):
+            if name != b"cookie":
+                continue
+            for part in value.decode("latin-1").split(";"):
+                key, _, raw = part.strip().partition("=")
+                if key == self.cookie_name:
+                    try:
+                        return float(raw)
+                    except ValueError:
+                        return 0.0
+        return 0.0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = RoutingState(sticky_until=self._sticky_until(scope))
+        token = current_routing.set(state)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and state.has_written:
+                until = time.time() + self.sticky_seconds
+                cookie = (
+                    f"{self.cookie_name}={until:.3f}; Max-Age={int(self.sticky_seconds)}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = [*message.get("headers", []), (b"set-cookie", cookie.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_routing.reset(token)
+
+
+class IdempotencyMiddleware:
+    """Execute unsafe requests carrying an ``Idempotency-Key`` header at most once.
+
+    The first request with a given key runs normally and its response is
+    stored; retries with the same key and an identical request get the
+    stored response replayed (marked with ``Idempotent-Replayed: true``)
+    without running the endpoint again. Duplicates arriving while the first
+    one is still running wait for it instead of running in parallel. Reusing
+    a key for a different request is rejected with 422.
+
+    Keys are scoped by method, path and Authorization header. Responses with
+    a 5xx status or 429 are not stored, so those retries run again.
+    """
+
+    header_name = b"idempotency-key"
+    methods = frozenset({"POST", "PATCH"})
+    poll_seconds = 0.05
+
+    def __init__(self, app: ASGIApp, store: IdempotencyStore, idempotency: IdempotencySettings):
+        self.app = app
+        self.store = store
+        self.max_body_bytes = idempotency.IDEMPOTENCY_MAX_BODY_BYTES
+        self.wait_seconds = idempotency.IDEMPOTENCY_WAIT_SECONDS
+
+    @staticmethod
+    def _is_storable(status: int) -> bool:
+        return status < 500 and status != 429
+
+    @staticmethod
+    async def _send_json(send: Send, status: int, message: str) -> None:
+        body = json.dumps({"message": message}, separators=(",", ":")).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    async def _replay(send: Send, response: StoredResponse) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": response.status,
+            "headers": [*response.headers, (b"idempotent-replayed", b"true")],
+        })
+        await send({"type": "http.response.body", "body": response.body})
+
+    async def _read_body(self, receive: Receive) -> bytes | None:
+        """Whole request body, or None if it exceeds the limit.
+
+        Raises:
+            ClientDisconnect: If the client went away before sending all of it
+        """
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise ClientDisconnect()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_bytes:
+                return None
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    async def _acquire(self, key: str) -> StoredResponse | bool:
+        """Stored response of ``key``, True once this request owns it, or False after waiting in vain."""
+        deadline = time.monotonic() + self.wait_seconds
+        while (remaining := deadline - time.monotonic()) > 0:
+            stored = await self.store.get(key)
+            if stored is not None:
+                return stored
+            future = self.store.in_flight(key)
+            if future is not None:
+                try:
+                    await asyncio.wait_for(asyncio.shield(future), timeout=remaining)
+                except asyncio.TimeoutError:
+                    return False
+                # The original finished: replay its response, or run ourselves if it wasn't storable
+                continue
+            if not await self.store.claimed_elsewhere(key) and await self.store.claim(key):
+                return True
+            # Claimed by another process, its response shows up in the shared tier
+            await asyncio.sleep(min(self.poll_seconds, remaining))
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in self.methods:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        idempotency_key = headers.get(self.header_name)
+        if not idempotency_key:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            body = await self._read_body(receive)
+        except ClientDisconnect:
+            # A truncated body must neither run nor claim the key its retry will bring
+            return
+        if body is None:
+            await self._send_json(send, 413, "Request body is too large for an Idempotency-Key.")
+            return
+
+        fingerprint = hashlib.sha256(
+            b"\0".join((scope["method"].encode(), scope["path"].encode(), scope.get("query_string", b""), body))
+        ).hexdigest()
+        key = hashlib.sha256(
+            b"\0".join((
+                scope["method"].encode(),
+                scope["path"].encode(),
+                headers.get(b"authorization", b""),
+                idempotency_key,
+            ))
+        ).hexdigest()
+
+        acquired = await self._acquire(key)
+        if acquired is False:
+            await self._send_json(send, 409, "A request with this Idempotency-Key is still being processed.")
+            return
+        if isinstance(acquired, StoredResponse):
+            if acquired.fingerprint != fingerprint:
+                await self._send_json(send, 422, "Idempotency-Key was already used for a different request.")
+                return
+            await self._replay(send, acquired)
+            return
+
+        body_sent = False
+
+        async def replay_receive() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        status = 500
+        response_headers: list[tuple[bytes, bytes]] = []
+        response_body = bytearray()
+        complete = False
+        storable = True
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, response_headers, complete, storable
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                response_headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                response_body.extend(message.get("body", b""))
+                if len(response_body) > self.max_body_bytes:
+                    storable = False
+                    response_body.clear()
+                complete = not message.get("more_body", False)
+            await send(message)
+
+        response = None
+        try:
+            await self.app(scope, replay_receive, send_wrapper)
+            if complete and storable and self._is_storable(status):
+                response = StoredResponse(
+                    fingerprint=fingerprint, status=status, headers=response_headers, body=bytes(response_body)
+                )
+        finally:
+            await self.store.release(key, response)
@@ -0,0 +1,24 @@
+"""Response classes of the API."""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when it is installed.
+
+    Used for endpoints without a response model (plain dicts and lists);
+    endpoints with a response model are serialized straight to JSON bytes by
+    Pydantic and never reach ``render``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,29 @@
+from datetime import date
+from uuid import UUID
+
+from fastapi import APIRouter
+
+from src.application.schemas.analytics import DailyStatsSchema, StaffUtilizationSchema
+from src.presentation.api.dependencies import analytics_service_deps
+
+router = APIRouter(tags=["Analytics"], prefix="/analytics")
+
+
+@router.get(
+    "/companies/{company_id}/daily", response_model=list[DailyStatsSchema], summary="Get a company's daily bookings"
+)
+async def get_daily_stats(company_id: UUID, date_from: date, date_to: date, analytics_service: analytics_service_deps):
+    """Endpoint to get booking counts per status, revenue and booked minutes for every day of a range."""
+    return await analytics_service.get_daily_stats(company_id=company_id, date_from=date_from, date_to=date_to)
+
+
+@router.get(
+    "/companies/{company_id}/staff-utilization",
+    response_model=list[StaffUtilizationSchema],
+    summary="Get a company's staff utilization",
+)
+async def get_staff_utilization(
+    company_id: UUID, date_from: date, date_to: date, analytics_service: analytics_service_deps
+):
+    """Endpoint to get the share of each staff member's working hours that was booked within a range."""
+    return await analytics_service.get_staff_utilization(company_id=company_id, date_from=date_from, date_to=date_to)
@@ -0,0 +1,53 @@
+from datetime import date
+from uuid import UUID
+
+from fastapi import APIRouter, Query, status
+from starlette.responses import StreamingResponse
+
+from src.application.schemas.appointment import AppointmentInputSchema, AppointmentOutputSchema
+from src.application.schemas.appointment_export import ExportFormat
+from src.application.schemas.pagination import PageSchema
+from src.infrastructure.export.writers import MEDIA_TYPES, WRITERS
+from src.presentation.api.dependencies import appointment_export_service_deps, booking_service_deps, pagination_deps
+
+router = APIRouter(tags=["Appointment"], prefix="/appointments")
+
+
+@router.post(
+    "/", response_model=AppointmentOutputSchema, status_code=status.HTTP_201_CREATED, summary="Book an appointment"
+)
+async def book_appointment(booking_input: AppointmentInputSchema, booking_service: booking_service_deps):
+    """Endpoint to book an appointment for a staff service."""
+    return await booking_service.book_appointment(booking_input=booking_input)
+
+
+@router.get("/", response_model=PageSchema[AppointmentOutputSchema], summary="List appointments")
+async def list_appointments(
+    booking_service: booking_service_deps, pagination: pagination_deps, company_id: UUID | None = None
+):
+    """Endpoint to list appointments newest first with cursor pagination."""
+    return await booking_service.list_appointments(
+        limit=pagination.limit, cursor=pagination.cursor, company_id=company_id
+    )
+
+
+@router.get("/export", response_class=StreamingResponse, summary="Export appointments as CSV or iCalendar")
+async def export_appointments(
+    export_service: appointment_export_service_deps,
+    company_id: UUID,
+    date_from: date,
+    date_to: date,
+    file_format: ExportFormat = Query(default=ExportFormat.CSV, alias="format"),
+):
+    """Endpoint to download a company's appointments starting within a date range.
+
+    Rows are read from a server-side cursor and written to the response as
+    they arrive, so memory use does not depend on the size of the export.
+    """
+    rows = export_service.export_appointments(company_id=company_id, date_from=date_from, date_to=date_to)
+    filename = f"appointments-{date_from.isoformat()}-{date_to.isoformat()}.{file_format.value}"
+    return StreamingResponse(
+        WRITERS[file_format](rows),
+        media_type=MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
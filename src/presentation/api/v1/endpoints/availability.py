@@ -0,0 +1,23 @@
+from datetime import date
+from uuid import UUID
+
+from fastapi import APIRouter, Query
+
+from src.application.schemas.availability import StaffAvailabilitySchema
+from src.presentation.api.dependencies import availability_service_deps
+
+router = APIRouter(tags=["Availability"], prefix="/availability")
+
+
+@router.get("/", response_model=StaffAvailabilitySchema, summary="Find free slots for a service")
+async def get_availability(
+    availability_service: availability_service_deps,
+    service_id: UUID,
+    date_from: date,
+    date_to: date,
+    step_minutes: int | None = Query(default=None, gt=0),
+):
+    """Endpoint to list bookable slots of a staff service within a date range."""
+    return await availability_service.get_service_availability(
+        service_id=service_id, date_from=date_from, date_to=date_to, step_minutes=step_minutes
+    )
\ No newline at end of file
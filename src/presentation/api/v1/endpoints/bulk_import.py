@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Query, Request
+
+from src.application.schemas.bulk_import import ImportEntity, ImportFormat, ImportReportSchema
+from src.infrastructure.bulk_import.readers import iter_records
+from src.presentation.api.dependencies import bulk_import_service_deps
+
+router = APIRouter(tags=["Bulk import"], prefix="/imports")
+
+
+@router.post("/{entity}", response_model=ImportReportSchema, summary="Bulk import records")
+async def bulk_import(
+    entity: ImportEntity,
+    request: Request,
+    bulk_import_service: bulk_import_service_deps,
+    file_format: ImportFormat = Query(default=ImportFormat.CSV, alias="format"),
+):
+    """Endpoint to import CSV or NDJSON sent as the raw request body.
+
+    The body is consumed as a stream and written in chunks, so the whole
+    file is never held in memory.
+    """
+    records = iter_records(request.stream(), file_format)
+    return await bulk_import_service.import_records(entity=entity, records=records)
\ No newline at end of file
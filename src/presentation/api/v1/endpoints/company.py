@@ -0,0 +1,21 @@
+from uuid import UUID
+
+from fastapi import APIRouter
+
+from src.application.schemas.company import CompanyOutputSchema
+from src.application.schemas.pagination import PageSchema
+from src.presentation.api.dependencies import catalog_service_deps, pagination_deps
+
+router = APIRouter(tags=["Company"], prefix="/companies")
+
+
+@router.get("/", response_model=PageSchema[CompanyOutputSchema], summary="List companies")
+async def list_companies(catalog_service: catalog_service_deps, pagination: pagination_deps):
+    """Endpoint to list companies newest first with cursor pagination."""
+    return await catalog_service.list_companies(limit=pagination.limit, cursor=pagination.cursor)
+
+
+@router.get("/{company_id}", response_model=CompanyOutputSchema, summary="Get a company")
+async def get_company(company_id: UUID, catalog_service: catalog_service_deps):
+    """Endpoint to get a single company by id."""
+    return await catalog_service.get_company(company_id=company_id)
\ No newline at end of file
@@ -1,6 +1,9 @@
 from fastapi import APIRouter
 
 from src.config import settings
+from src.infrastructure.database.connection import engine
+from src.infrastructure.database.pool import get_pool_stats
+from src.infrastructure.database.replicas import replica_router
 
 router = APIRouter(tags=["Health"])
 
@@ -12,4 +15,16 @@ async def health_check():
         "status": "ok",
         "app": settings.APP_NAME,
         "version": settings.APP_VERSION,
-    }
\ No newline at end of file
+    }
+
+
+@router.get("/health/db-pool", summary="Database pool statistics")
+async def db_pool_stats():
+    """Live connection pool counters used to size the pool against real traffic."""
+    return get_pool_stats(engine).to_dict()
+
+
+@router.get("/health/db-replicas", summary="Read replica status")
+async def db_replica_status():
+    """Last measured replication lag of every configured read replica."""
+    return {"max_lag_seconds": replica_router.max_lag_seconds, "replicas": replica_router.status()}
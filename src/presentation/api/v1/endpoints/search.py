@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Query
+
+from src.application.schemas.pagination import PageSchema
+from src.application.schemas.search import CompanySearchResultSchema, ServiceSearchResultSchema
+from src.presentation.api.dependencies import pagination_deps, search_service_deps
+
+router = APIRouter(tags=["Search"], prefix="/search")
+
+
+@router.get("/companies", response_model=PageSchema[CompanySearchResultSchema], summary="Search companies")
+async def search_companies(
+    search_service: search_service_deps, pagination: pagination_deps, q: str = Query(min_length=2, max_length=100)
+):
+    """Endpoint to search companies by name and address, best match first, tolerating typos and prefixes."""
+    return await search_service.search_companies(query=q, limit=pagination.limit, cursor=pagination.cursor)
+
+
+@router.get("/services", response_model=PageSchema[ServiceSearchResultSchema], summary="Search services")
+async def search_services(
+    search_service: search_service_deps, pagination: pagination_deps, q: str = Query(min_length=2, max_length=100)
+):
+    """Endpoint to search active services by name and description, best first, tolerating typos and prefixes."""
+    return await search_service.search_services(query=q, limit=pagination.limit, cursor=pagination.cursor)
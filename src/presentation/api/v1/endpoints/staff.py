@@ -0,0 +1,30 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Query
+
+from src.application.schemas.pagination import PageSchema
+from src.application.schemas.staff import StaffOutputSchema
+from src.infrastructure.repositories.pagination import MAX_PAGE_SIZE
+from src.presentation.api.dependencies import catalog_service_deps, pagination_deps
+
+router = APIRouter(tags=["Staff"], prefix="/staff")
+
+
+@router.get("/", response_model=PageSchema[StaffOutputSchema], summary="List staff members")
+async def list_staff(catalog_service: catalog_service_deps, pagination: pagination_deps, company_id: UUID | None = None):
+    """Endpoint to list staff members newest first with cursor pagination."""
+    return await catalog_service.list_staff(limit=pagination.limit, cursor=pagination.cursor, company_id=company_id)
+
+
+@router.get("/top-rated", response_model=list[StaffOutputSchema], summary="List a company's best rated staff")
+async def list_top_rated_staff(
+    catalog_service: catalog_service_deps, company_id: UUID, limit: int = Query(default=10, ge=1, le=MAX_PAGE_SIZE)
+):
+    """Endpoint to list a company's staff members by average rating, unrated ones last."""
+    return await catalog_service.list_top_rated_staff(company_id=company_id, limit=limit)
+
+
+@router.get("/{staff_id}", response_model=StaffOutputSchema, summary="Get a staff member")
+async def get_staff(staff_id: UUID, catalog_service: catalog_service_deps):
+    """Endpoint to get a single staff member by id."""
+    return await catalog_service.get_staff(staff_id=staff_id)
@@ -0,0 +1,21 @@
+from uuid import UUID
+
+from fastapi import APIRouter
+
+from src.application.schemas.pagination import PageSchema
+from src.application.schemas.staff_service import StaffServiceOutputSchema
+from src.presentation.api.dependencies import catalog_service_deps, pagination_deps
+
+router = APIRouter(tags=["Service"], prefix="/services")
+
+
+@router.get("/", response_model=PageSchema[StaffServiceOutputSchema], summary="List staff services")
+async def list_services(catalog_service: catalog_service_deps, pagination: pagination_deps, staff_id: UUID | None = None):
+    """Endpoint to list staff services newest first with cursor pagination."""
+    return await catalog_service.list_services(limit=pagination.limit, cursor=pagination.cursor, staff_id=staff_id)
+
+
+@router.get("/{service_id}", response_model=StaffServiceOutputSchema, summary="Get a staff service")
+async def get_service(service_id: UUID, catalog_service: catalog_service_deps):
+    """Endpoint to get a single staff service by id."""
+    return await catalog_service.get_service(service_id=service_id)
\ No newline at end of file
@@ -1,13 +1,22 @@
 from fastapi import APIRouter
 
+from src.application.schemas.pagination import PageSchema
 from src.application.schemas.user import UserOutputSchema, UserInputSchema
-from src.presentation.api.dependencies import user_service_deps
+from src.presentation.api.dependencies import credential_admission, pagination_deps, user_service_deps
 
 router = APIRouter(tags=["User"], prefix="/users")
 
 
-@router.post("/",response_model=UserOutputSchema ,summary="Create a new user")
+@router.post(
+    "/", response_model=UserOutputSchema, summary="Create a new user", dependencies=[credential_admission]
+)
 async def create_user(user_input: UserInputSchema, user_service: user_service_deps):
     """Endpoint to create a new user."""
     user = await user_service.create_user(user_input=user_input)
-    return user
\ No newline at end of file
+    return user
+
+
+@router.get("/", response_model=PageSchema[UserOutputSchema], summary="List users")
+async def list_users(user_service: user_service_deps, pagination: pagination_deps):
+    """Endpoint to list users newest first with cursor pagination."""
+    return await user_service.list_users(limit=pagination.limit, cursor=pagination.cursor)
\ No newline at end of file
@@ -1,8 +1,27 @@
 from fastapi import APIRouter
-from src.presentation.api.v1.endpoints import health, user
+from src.presentation.api.v1.endpoints import (
+    analytics,
+    appointment,
+    availability,
+    bulk_import,
+    company,
+    health,
+    search,
+    staff,
+    staff_service,
+    user,
+)
 
 api_v1_router = APIRouter(prefix="/v1")
 
 
 api_v1_router.include_router(health.router)
 api_v1_router.include_router(user.router)
+api_v1_router.include_router(company.router)
+api_v1_router.include_router(staff.router)
+api_v1_router.include_router(staff_service.router)
+api_v1_router.include_router(availability.router)
+api_v1_router.include_router(appointment.router)
+api_v1_router.include_router(bulk_import.router)
+api_v1_router.include_router(analytics.router)
+api_v1_router.include_router(search.router)
\ No newline at end of file
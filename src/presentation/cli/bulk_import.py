@@ -0,0 +1,48 @@
+"""Bulk import command.
+
+Usage:
+    python -m src.presentation.cli.bulk_import users customers.csv
+    python -m src.presentation.cli.bulk_import appointments history.ndjson --format ndjson
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+
+from src.application.schemas.bulk_import import ImportEntity, ImportFormat
+from src.application.services.bulk_import_service import BulkImportService
+from src.infrastructure.bulk_import.readers import iter_file_chunks, iter_records
+from src.infrastructure.database.connection import engine
+from src.infrastructure.repositories.bulk_import_repository import BulkImportRepository
+from src.infrastructure.security.auth_security import AuthSecurity
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Bulk import users, staff, services or appointments.")
+    parser.add_argument("entity", type=ImportEntity, choices=list(ImportEntity))
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", dest="file_format", type=ImportFormat, choices=list(ImportFormat))
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--hash-concurrency", type=int, default=4)
+    return parser.parse_args()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    file_format = args.file_format or ImportFormat(args.path.suffix.lstrip(".").lower())
+    service = BulkImportService(
+        bulk_import_repository=BulkImportRepository(),
+        auth_security=AuthSecurity(),
+        chunk_size=args.chunk_size,
+        hash_concurrency=args.hash_concurrency,
+    )
+    try:
+        report = await service.import_records(
+            entity=args.entity, records=iter_records(iter_file_chunks(args.path), file_format)
+        )
+    finally:
+        await engine.dispose()
+    print(report.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(_run(_parse_args()))
@@ -0,0 +1,64 @@
+"""Create upcoming appointment partitions and archive old ones.
+
+Usage:
+    python -m src.presentation.cli.maintain_appointment_partitions
+    python -m src.presentation.cli.maintain_appointment_partitions --ahead-months 6 --retention-months 0
+
+Run it at least monthly (e.g. daily from cron); it is idempotent. Bookings
+for a month without a partition fail, so keep the ahead window longer than
+the furthest bookable date. Partitions whose month ended more than the
+retention period ago are detached into the ``archive`` schema, where they
+stay queryable as plain tables and can be dumped or dropped.
+"""
+
+import argparse
+import asyncio
+from datetime import date
+
+from src.config import settings
+from src.infrastructure.database.connection import engine
+from src.infrastructure.repositories.appointment_partition_repository import AppointmentPartitionRepository
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Create upcoming appointment partitions and archive old ones.")
+    parser.add_argument(
+        "--ahead-months", type=int, default=settings.partitions.APPOINTMENT_PARTITIONS_AHEAD_MONTHS,
+        help="Months beyond the current one to create partitions for",
+    )
+    parser.add_argument(
+        "--retention-months", type=int, default=settings.partitions.APPOINTMENT_RETENTION_MONTHS,
+        help="Full months before the current one to keep attached, 0 to archive nothing",
+    )
+    return parser.parse_args()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    repository = AppointmentPartitionRepository()
+    current_month = date.today().replace(day=1)
+    try:
+        created = await repository.create_partitions(
+            month_from=current_month, month_to=_add_months(current_month, args.ahead_months)
+        )
+        print(f"Created {len(created)} partitions: {', '.join(created) or '-'}")
+
+        if args.retention_months > 0:
+            oldest_kept = _add_months(current_month, -args.retention_months)
+            archived = []
+            for name, month in (await repository.list_partitions()).items():
+                if month >= oldest_kept:
+                    break
+                await repository.archive_partition(name=name)
+                archived.append(name)
+            print(f"Archived {len(archived)} partitions: {', '.join(archived) or '-'}")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_run(_parse_args()))
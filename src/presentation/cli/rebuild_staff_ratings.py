@@ -0,0 +1,31 @@
+"""Rebuild the per-staff rating aggregates from the reviews.
+
+Usage:
+    python -m src.presentation.cli.rebuild_staff_ratings
+    python -m src.presentation.cli.rebuild_staff_ratings --staff-id 5f0c... --staff-id 9a1e...
+"""
+
+import argparse
+import asyncio
+from uuid import UUID
+
+from src.infrastructure.database.connection import engine
+from src.infrastructure.repositories.staff_rating_repository import StaffRatingRepository
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Recompute staff rating count and average from the reviews.")
+    parser.add_argument("--staff-id", dest="staff_ids", type=UUID, action="append", help="Only rebuild this staff member")
+    return parser.parse_args()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    try:
+        corrected = await StaffRatingRepository().rebuild_ratings(staff_ids=args.staff_ids)
+    finally:
+        await engine.dispose()
+    print(f"Corrected rating aggregates of {len(corrected)} staff members")
+
+
+if __name__ == "__main__":
+    asyncio.run(_run(_parse_args()))
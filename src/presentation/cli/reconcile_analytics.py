@@ -0,0 +1,62 @@
+"""Rebuild the appointment rollups behind company analytics.
+
+Usage:
+    python -m src.presentation.cli.reconcile_analytics
+    python -m src.presentation.cli.reconcile_analytics --date-from 2026-01-01 --date-to 2026-03-31
+    python -m src.presentation.cli.reconcile_analytics --company-id 5f0c...
+
+Triggers keep the rollups current; run this periodically (e.g. nightly from
+cron over the last few days) to correct drift such as rows written with the
+triggers disabled. Every company and day is rebuilt in its own short
+transaction, which only holds up bookings of that company on that day. Days
+before the oldest attached partition are skipped: months archived by
+maintain_appointment_partitions have no appointments left in the table, and
+their rollups are all that is left of them.
+"""
+
+import argparse
+import asyncio
+from datetime import date, timedelta
+from uuid import UUID
+
+from src.infrastructure.database.connection import engine
+from src.infrastructure.repositories.analytics_repository import AnalyticsRepository
+from src.infrastructure.repositories.appointment_partition_repository import AppointmentPartitionRepository
+
+DEFAULT_DAYS = 7
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Recompute the daily appointment rollups from the appointments.")
+    parser.add_argument("--date-from", type=date.fromisoformat, help=f"First day, {DEFAULT_DAYS} days ago by default")
+    parser.add_argument("--date-to", type=date.fromisoformat, help="Last day, today by default")
+    parser.add_argument("--company-id", type=UUID, help="Only rebuild this company")
+    return parser.parse_args()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    date_to = args.date_to or date.today()
+    date_from = args.date_from or date_to - timedelta(days=DEFAULT_DAYS)
+    repository = AnalyticsRepository()
+    rows = 0
+    try:
+        oldest_month = min((await AppointmentPartitionRepository().list_partitions()).values(), default=None)
+        if oldest_month is None:
+            print("No appointment partitions are attached, nothing to rebuild")
+            return
+        if date_from < oldest_month:
+            print(f"Skipping {date_from} to {oldest_month - timedelta(days=1)}, those months are archived")
+            date_from = oldest_month
+        day = date_from
+        while day <= date_to:
+            company_ids = [args.company_id] if args.company_id else await repository.get_company_ids_for_day(day=day)
+            for company_id in company_ids:
+                rows += await repository.reconcile_day(company_id=company_id, day=day)
+            day += timedelta(days=1)
+    finally:
+        await engine.dispose()
+    print(f"Rebuilt {rows} rollup rows for {date_from} to {date_to}")
+
+
+if __name__ == "__main__":
+    asyncio.run(_run(_parse_args()))
@@ -0,0 +1,51 @@
+"""Appointment reminder worker.
+
+Usage:
+    python -m src.presentation.cli.send_reminders
+    python -m src.presentation.cli.send_reminders --once
+
+Runs the reminder scheduler until SIGTERM/SIGINT, or claims and sends due
+reminders until none are left with ``--once`` (e.g. from cron). Safe to run
+next to other workers and web workers with REMINDERS_ENABLED.
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+
+from src.config import settings
+from src.infrastructure.database.connection import engine
+from src.infrastructure.reminders.scheduler import ReminderScheduler
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Send reminders for upcoming appointments.")
+    parser.add_argument("--once", action="store_true", help="Send what is due now and exit")
+    return parser.parse_args()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    scheduler = ReminderScheduler.from_settings(settings.reminders)
+    try:
+        if args.once:
+            sent = 0
+            while (result := await scheduler.service.send_due_reminders()).sent:
+                sent += result.sent
+            print(f"Sent {sent} reminders")
+            return
+
+        loop = asyncio.get_running_loop()
+        scheduler.start()
+        stopped = asyncio.Event()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, stopped.set)
+        await stopped.wait()
+        await scheduler.stop()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run(_parse_args()))
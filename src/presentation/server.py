@@ -0,0 +1,166 @@
+"""Production server launcher.
+
+Usage:
+    python -m src.presentation.server
+
+With ``WEB_WORKERS`` other than 1 (0 means one per available CPU) the app is
+imported and built once in the parent process, which then binds the listening
+socket and forks the workers. Workers share the imported code copy-on-write
+and accept from the same socket; each runs its own event loop, its own
+lifespan (pool warm-up on startup, drain and engine disposal on shutdown) and
+its own connection pool, so keep ``workers * (POSTGRES_POOL_SIZE +
+POSTGRES_POOL_MAX_OVERFLOW)`` below the server's ``max_connections``.
+
+SIGTERM or SIGINT to the parent is forwarded to every worker, which stops
+accepting, waits up to ``WEB_GRACEFUL_SHUTDOWN_SECONDS`` for in-flight
+requests and then runs the lifespan shutdown. Workers that die unexpectedly
+are replaced.
+
+With DEBUG or a single worker uvicorn runs the app in-process.
+"""
+
+import logging
+import os
+import signal
+import socket
+import time
+
+import uvicorn
+from uvicorn.importer import import_from_string
+
+from src.config import settings
+from src.config.settings import ServerSettings
+
+logger = logging.getLogger(__name__)
+
+APP_FACTORY = "src.main:create_app"
+
+# Workers crashing faster than this are not respawned in a loop
+MIN_WORKER_LIFETIME_SECONDS = 1.0
+
+
+def worker_count(server: ServerSettings) -> int:
+    """Configured worker count, or the number of CPUs available to the process."""
+    if server.WEB_WORKERS > 0:
+        return server.WEB_WORKERS
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _config(app, server: ServerSettings) -> uvicorn.Config:
+    return uvicorn.Config(
+        app,
+        host=settings.HOST,
+        port=settings.PORT,
+        lifespan="on",
+        backlog=server.WEB_BACKLOG,
+        timeout_keep_alive=server.WEB_KEEPALIVE_SECONDS,
+        timeout_graceful_shutdown=server.WEB_GRACEFUL_SHUTDOWN_SECONDS,
+    )
+
+
+def _bind(server: ServerSettings) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ":" in settings.HOST else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((settings.HOST, settings.PORT))
+    sock.listen(server.WEB_BACKLOG)
+    sock.set_inheritable(True)
+    return sock
+
+
+class Arbiter:
+    """Forks workers serving a preloaded app and keeps them running."""
+
+    def __init__(self, app, server: ServerSettings, workers: int):
+        """Initialize arbiter.
+
+        Args:
+            app: ASGI application, built before forking
+            server: Server settings
+            workers: Number of worker processes
+        """
+        self.app = app
+        self.server = server
+        self.workers = workers
+        self.sock: socket.socket | None = None
+        self.children: dict[int, float] = {}
+        self.stopping = False
+
+    def _spawn(self) -> None:
+        pid = os.fork()
+        if pid:
+            self.children[pid] = time.monotonic()
+            return
+
+        # Worker: uvicorn installs its own SIGTERM/SIGINT handlers
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        exit_code = 0
+        try:
+            uvicorn.Server(_config(self.app, self.server)).run(sockets=[self.sock])
+        except BaseException:
+            logger.exception("Worker %s crashed", os.getpid())
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _stop(self, signum, frame) -> None:
+        self.stopping = True
+        for pid in self.children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def run(self) -> None:
+        self.sock = _bind(self.server)
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        logger.info("Starting %s workers on %s:%s", self.workers, settings.HOST, settings.PORT)
+        for _ in range(self.workers):
+            self._spawn()
+
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            except InterruptedError:
+                continue
+            started = self.children.pop(pid, None)
+            if started is None or self.stopping:
+                continue
+            logger.warning("Worker %s exited with status %s", pid, os.waitstatus_to_exitcode(status))
+            if time.monotonic() - started < MIN_WORKER_LIFETIME_SECONDS:
+                # Failing right after start (bad config, port in use): stop instead of spinning
+                self._stop(signal.SIGTERM, None)
+                continue
+            self._spawn()
+
+        self.sock.close()
+
+
+def serve(server: ServerSettings = settings.server) -> None:
+    workers = worker_count(server)
+    if settings.DEBUG or workers == 1:
+        uvicorn.run(
+            APP_FACTORY,
+            factory=True,
+            reload=settings.DEBUG,
+            host=settings.HOST,
+            port=settings.PORT,
+            backlog=server.WEB_BACKLOG,
+            timeout_keep_alive=server.WEB_KEEPALIVE_SECONDS,
+            timeout_graceful_shutdown=server.WEB_GRACEFUL_SHUTDOWN_SECONDS,
+        )
+        return
+
+    # Preload: import and build the app once so workers fork with it already in memory
+    app = import_from_string(APP_FACTORY)()
+    Arbiter(app, server, workers).run()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    serve()